@@ -56,6 +56,8 @@ from .struct import (
     get_unused_namespaces,
 )
 from .struct.graph import BELGraph, WarningTuple
+from .struct.pipeline import Trace
+from .struct.query import Query
 from .utils import get_corresponding_pickle_path
 
 logger = logging.getLogger(__name__)
@@ -304,6 +306,31 @@ def insert(manager, graph: BELGraph):
     to_database(graph, manager=manager, use_tqdm=True)
 
 
+@main.command()
+@click.argument("path", type=click.File())
+@click.option("-o", "--output", type=click.File("wb"), help="Path to output the resulting graph as a pickle")
+@click.option("--trace-output", type=click.File("w"), help="Path to output the query and its trace as JSON")
+@click.option("--no-memory", is_flag=True, help="Do not measure the peak memory of each stage")
+@click.option("-j", "--n-jobs", type=int, help="Number of worker processes for seeding and unions of pipelines")
+@click.pass_obj
+def query(manager: Manager, path, output, trace_output, no_memory: bool, n_jobs: int | None):
+    """Run a query from a JSON file and show how long each of its stages took."""
+    _query = Query.load(path)
+    trace = Trace(track_memory=not no_memory)
+    graph = _query.run(manager, trace=trace, n_jobs=n_jobs)
+    click.echo(trace.to_table())
+
+    if graph is None:
+        click.echo("query returned no graph")
+    else:
+        click.echo(f"built BEL graph with {graph.number_of_nodes()} nodes and {graph.number_of_edges()} edges")
+        if output:
+            to_pickle(graph, output)
+
+    if trace_output:
+        json.dump({"query": _query.to_json(), "trace": trace.to_json()}, trace_output, indent=2)
+
+
 @main.command()
 @graph_argument
 @host_option
@@ -444,6 +471,14 @@ def examples(manager: Manager, debug: bool):
         manager.insert_graph(graph, use_tqdm=True)
 
 
+@manage.command()
+@click.option("--no-rebuild", is_flag=True, help="Do not index the evidences and edges that are already stored")
+@click.pass_obj
+def search_index(manager: Manager, no_rebuild: bool):
+    """Add full-text search indexes to an existing database."""
+    manager.create_search_index(rebuild=not no_rebuild)
+
+
 @manage.group()
 def namespaces():
     """Manage namespaces."""
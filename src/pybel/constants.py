@@ -366,6 +366,23 @@ CORRELATIVE_RELATIONS = APOLAR_CORRELATIVE_RELATIONS | POLAR_CORRELATIVE_RELATIO
 #: A set of polar relations
 POLAR_RELATIONS = CAUSAL_POLAR_RELATIONS | POLAR_CORRELATIVE_RELATIONS
 
+#: The name of the relation class containing :data:`CAUSAL_RELATIONS`
+RELATION_CLASS_CAUSAL = "causal"
+#: The name of the relation class containing :data:`CORRELATIVE_RELATIONS`
+RELATION_CLASS_CORRELATIVE = "correlative"
+#: The name of the relation class containing :data:`PART_OF`
+RELATION_CLASS_PART_OF = "part_of"
+#: The name of the relation class containing :data:`HAS_VARIANT`
+RELATION_CLASS_HAS_VARIANT = "has_variant"
+
+#: A mapping from relation class names to the relations they contain, used for relation-typed adjacency indexes
+RELATION_CLASSES = {
+    RELATION_CLASS_CAUSAL: frozenset(CAUSAL_RELATIONS),
+    RELATION_CLASS_CORRELATIVE: frozenset(CORRELATIVE_RELATIONS),
+    RELATION_CLASS_PART_OF: frozenset({PART_OF}),
+    RELATION_CLASS_HAS_VARIANT: frozenset({HAS_VARIANT}),
+}
+
 #: A set of all relationships that are inherently directionless, and are therefore added to the graph twice
 TWO_WAY_RELATIONS = CORRELATIVE_RELATIONS | {
     ASSOCIATION,
@@ -136,11 +136,27 @@ class BaseEntity(dict, metaclass=ABCMeta):
             self._md5 = hashlib.md5(self.as_bel().encode("utf8")).hexdigest()
         return self._md5
 
+    def _get_bel(self) -> str:
+        """Get this entity as a BEL string, which is kept since it is used for every hash and comparison.
+
+        Entities that were pickled before the BEL string was kept don't have it.
+        """
+        rv = self.__dict__.get("_bel")
+        if rv is None:
+            rv = self._bel = self.as_bel()
+        return rv
+
+    def __getstate__(self):
+        # the BEL string can be rebuilt, so it doesn't need to take up space in pickles
+        state = self.__dict__.copy()
+        state.pop("_bel", None)
+        return state
+
     def __hash__(self):
-        return hash(self.as_bel())
+        return hash(self._get_bel())
 
     def __eq__(self, other):
-        return isinstance(other, BaseEntity) and self.as_bel() == other.as_bel()
+        return isinstance(other, BaseEntity) and self._get_bel() == other._get_bel()
 
     def __repr__(self):
         return f"<BEL {self.as_bel(use_identifiers=True)}>"
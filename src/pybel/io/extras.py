@@ -7,6 +7,7 @@ from networkx.utils import open_file
 
 from ..dsl import CentralDogma
 from ..struct import BELGraph
+from ..struct.node_utils import iter_cartesian_expansion
 
 __all__ = [
     "to_csv",
@@ -42,7 +43,12 @@ def to_csv(graph: BELGraph, path: str | TextIO, sep: str | None = None) -> None:
 
 
 @open_file(1, mode="w")
-def to_sif(graph: BELGraph, path: str | TextIO, sep: str | None = None) -> None:
+def to_sif(
+    graph: BELGraph,
+    path: str | TextIO,
+    sep: str | None = None,
+    cartesian_expansion: bool = False,
+) -> None:
     """Write the graph as a tab-separated SIF file.
 
     The resulting file will contain the following columns:
@@ -53,11 +59,16 @@ def to_sif(graph: BELGraph, path: str | TextIO, sep: str | None = None) -> None:
 
     This format is simple and can be used readily with many applications, but is lossy in that it does not include
     relation metadata.
+
+    If ``cartesian_expansion`` is true, complexes and reactions are expanded to the edges between their members,
+    reactants, and products. The expanded edges are streamed from :func:`pybel.struct.iter_cartesian_expansion`
+    without being added to the graph.
     """
     if sep is None:
         sep = "\t"
 
-    for u, v, data in graph.edges(data=True):
+    edges = iter_cartesian_expansion(graph) if cartesian_expansion else graph.edges(data=True)
+    for u, v, data in edges:
         print(
             graph.edge_to_bel(u, v, edge_data=data, sep=sep),
             file=path,
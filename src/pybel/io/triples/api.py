@@ -10,6 +10,8 @@ from tqdm.autonotebook import tqdm
 from . import converters
 from ...dsl import BaseEntity
 from ...struct import BELGraph
+from ...struct.node_utils import estimate_cartesian_expansion, iter_cartesian_expansion
+from ...typing import EdgeData
 
 __all__ = [
     "to_edgelist",
@@ -33,6 +35,7 @@ def to_triples_file(
     use_tqdm: bool = False,
     sep="\t",
     raise_on_none: bool = False,
+    cartesian_expansion: bool = False,
 ) -> None:
     """Write the graph as a TSV.
 
@@ -41,9 +44,12 @@ def to_triples_file(
     :param use_tqdm: Should a progress bar be shown?
     :param sep: The separator to use
     :param raise_on_none: Should an exception be raised if no triples are returned?
+    :param cartesian_expansion: Should complexes and reactions be expanded? See :func:`to_triples`.
     :raises: NoTriplesValueError
     """
-    for h, r, t in to_triples(graph, use_tqdm=use_tqdm, raise_on_none=raise_on_none):
+    for h, r, t in to_triples(
+        graph, use_tqdm=use_tqdm, raise_on_none=raise_on_none, cartesian_expansion=cartesian_expansion
+    ):
         print(h, r, t, sep=sep, file=path)
 
 
@@ -55,6 +61,7 @@ def to_edgelist(
     use_tqdm: bool = False,
     sep="\t",
     raise_on_none: bool = False,
+    cartesian_expansion: bool = False,
 ) -> None:
     """Write the graph as an edgelist.
 
@@ -63,32 +70,49 @@ def to_edgelist(
     :param use_tqdm: Should a progress bar be shown?
     :param sep: The separator to use
     :param raise_on_none: Should an exception be raised if no triples are returned?
+    :param cartesian_expansion: Should complexes and reactions be expanded? See :func:`to_triples`.
     :raises: NoTriplesValueError
     """
-    for h, r, t in to_triples(graph, use_tqdm=use_tqdm, raise_on_none=raise_on_none):
+    for h, r, t in to_triples(
+        graph, use_tqdm=use_tqdm, raise_on_none=raise_on_none, cartesian_expansion=cartesian_expansion
+    ):
         print(h, t, json.dumps({"relation": r}), sep=sep, file=path)
 
 
-def to_triples(graph: BELGraph, use_tqdm: bool = False, raise_on_none: bool = False) -> list[tuple[str, str, str]]:
+def to_triples(
+    graph: BELGraph,
+    use_tqdm: bool = False,
+    raise_on_none: bool = False,
+    cartesian_expansion: bool = False,
+) -> list[tuple[str, str, str]]:
     """Get a non-redundant list of triples representing the graph.
 
     :param graph: A BEL graph
     :param use_tqdm: Should a progress bar be shown?
     :param raise_on_none: Should an exception be raised if no triples are returned?
+    :param cartesian_expansion: Should complexes and reactions be expanded to the edges between their members,
+     reactants, and products? The expanded edges are streamed from :func:`pybel.struct.iter_cartesian_expansion`
+     without being added to the graph.
     :raises: NoTriplesValueError
     """
-    it = graph.edges(keys=True)
+    if cartesian_expansion:
+        # expanded edges are never added to the graph, so they don't have keys
+        it = ((u, v, None, data) for u, v, data in iter_cartesian_expansion(graph))
+        total = estimate_cartesian_expansion(graph)
+    else:
+        it = graph.edges(keys=True, data=True)
+        total = graph.number_of_edges()
 
     if use_tqdm:
         it = tqdm(
             it,
-            total=graph.number_of_edges(),
+            total=total,
             desc=f"Preparing TSV for {graph}",
             unit_scale=True,
             unit="edge",
         )
 
-    triples = (to_triple(graph, u, v, key) for u, v, key in it)
+    triples = (_data_to_triple(u, v, key, data) for u, v, key, data in it)
 
     # clean duplicates and Nones
     rv = sorted({triple for triple in triples if triple is not None})
@@ -104,8 +128,16 @@ def to_triple(
     key: str,
 ) -> tuple[str, str, str] | None:
     """Get the triples' strings that should be written to the file."""
-    data = graph[u][v][key]
+    return _data_to_triple(u, v, key, graph[u][v][key])
+
 
+def _data_to_triple(
+    u: BaseEntity,
+    v: BaseEntity,
+    key: str | None,
+    data: EdgeData,
+) -> tuple[str, str, str] | None:
+    """Get the triples' strings for an edge, which does not have to be in a graph."""
     # order is important
     _converters = [
         converters.ListComplexHasComponentConverter,
@@ -152,4 +184,4 @@ def to_triple(
         if converter.predicate(u, v, key, data):
             return converter.convert(u, v, key, data)
 
-    logger.warning(f"unhandled: {graph.edge_to_bel(u, v, data)}")
+    logger.warning(f"unhandled: {BELGraph.edge_to_bel(u, v, data)}")
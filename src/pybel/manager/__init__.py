@@ -7,12 +7,14 @@ downloading and parsing upon each compilation.
 
 from . import (
     base_manager,
+    bulk,
     cache_manager,
     citation_utils,
     database_io,
     make_json_serializable,
     models,
     query_manager,
+    search,
 )
 from .base_manager import BaseManager, build_engine_session
 from .cache_manager import Manager, NetworkManager
@@ -32,10 +34,18 @@ from .models import (
     network_edge,
     network_node,
 )
-from .query_manager import QueryManager, graph_from_edges
+from .query_manager import (
+    EDGE_LOADERS,
+    NEIGHBORHOOD_DIRECTIONS,
+    QueryManager,
+    graph_from_edge_store,
+    graph_from_edges,
+)
+from .search import SEARCH_FIELDS
 
 __all__ = [
     "Author",
+    "EDGE_LOADERS",
     # Models
     "Base",
     "BaseManager",
@@ -43,18 +53,21 @@ __all__ = [
     "Edge",
     "Evidence",
     "Manager",
+    "NEIGHBORHOOD_DIRECTIONS",
     "Namespace",
     "NamespaceEntry",
     "Network",
     "NetworkManager",
     "Node",
     "QueryManager",
+    "SEARCH_FIELDS",
     "build_engine_session",
     "edge_annotation",
     "enrich_pmc_citations",
     "enrich_pubmed_citations",
     # I/O
     "from_database",
+    "graph_from_edge_store",
     "graph_from_edges",
     "network_edge",
     "network_node",
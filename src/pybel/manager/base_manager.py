@@ -1,10 +1,13 @@
 """This module contains the base class for connection managers in SQLAlchemy."""
 
 import logging
-from typing import TypeVar
+import os
+import weakref
+from typing import Any, TypeVar
 
 import pystow
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from .models import Base
@@ -12,6 +15,8 @@ from .models import Base
 __all__ = [
     "BaseManager",
     "build_engine_session",
+    "get_engine_kwargs",
+    "is_sqlite_memory",
 ]
 
 logger = logging.getLogger(__name__)
@@ -19,6 +24,71 @@ logger = logging.getLogger(__name__)
 X = TypeVar("X")
 
 
+#: The engines made by :func:`build_engine_session`, which get new connection pools in forked processes
+_ENGINES: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def _dispose_engines_after_fork() -> None:
+    """Give the engines new connection pools in a forked process without closing the parent process's connections."""
+    for engine in list(_ENGINES):
+        engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_engines_after_fork)
+
+
+def _set_sqlite_wal(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
+def is_sqlite_memory(url: str | URL) -> bool:
+    """Check if the connection is to an in-memory SQLite database, which only exists for its own connection."""
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database in {None, "", ":memory:"}
+
+
+def get_engine_kwargs(
+    connection: str,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_pre_ping: bool | None = None,
+    pool_recycle: int | None = None,
+) -> dict[str, Any]:
+    """Get the keyword arguments for :func:`sqlalchemy.create_engine` that configure its connection pool.
+
+    Settings that are not given are looked up in the ``pybel`` configuration as ``manager_pool_size``,
+    ``manager_max_overflow``, ``manager_pool_pre_ping``, and ``manager_pool_recycle``. Settings that are not
+    configured are left to SQLAlchemy's defaults.
+
+    :param connection: An RFC-1738 database connection string
+    :param pool_size: The number of connections kept open in the pool
+    :param max_overflow: The number of connections that can be opened beyond the pool size
+    :param pool_pre_ping: Should connections be tested before they are used, to replace ones that were dropped?
+    :param pool_recycle: The number of seconds after which connections are replaced, e.g., to stay below the
+     database server's timeout for idle connections
+    """
+    pool_size = pystow.get_config("pybel", "manager_pool_size", passthrough=pool_size, dtype=int)
+    max_overflow = pystow.get_config("pybel", "manager_max_overflow", passthrough=max_overflow, dtype=int)
+    pool_pre_ping = pystow.get_config("pybel", "manager_pool_pre_ping", passthrough=pool_pre_ping, dtype=bool)
+    pool_recycle = pystow.get_config("pybel", "manager_pool_recycle", passthrough=pool_recycle, dtype=int)
+
+    rv = {}
+    # in-memory SQLite databases have a single connection per thread, so there is no pool to size
+    if not is_sqlite_memory(connection):
+        if pool_size is not None:
+            rv["pool_size"] = pool_size
+        if max_overflow is not None:
+            rv["max_overflow"] = max_overflow
+    if pool_pre_ping is not None:
+        rv["pool_pre_ping"] = pool_pre_ping
+    if pool_recycle is not None:
+        rv["pool_recycle"] = pool_recycle
+    return rv
+
+
 def build_engine_session(
     connection: str,
     echo: bool = False,
@@ -26,6 +96,11 @@ def build_engine_session(
     autocommit: bool | None = None,
     expire_on_commit: bool | None = None,
     scopefunc=None,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_pre_ping: bool | None = None,
+    pool_recycle: int | None = None,
+    sqlite_wal: bool | None = None,
 ) -> tuple:
     """Build an engine and a session.
 
@@ -35,6 +110,12 @@ def build_engine_session(
     :param autocommit: Defaults to False if not specified in kwargs or configuration.
     :param expire_on_commit: Defaults to False if not specified in kwargs or configuration.
     :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
+    :param pool_size: The number of connections kept open in the pool. See :func:`get_engine_kwargs`.
+    :param max_overflow: The number of connections that can be opened beyond the pool size
+    :param pool_pre_ping: Should connections be tested before they are used?
+    :param pool_recycle: The number of seconds after which connections are replaced
+    :param sqlite_wal: Should SQLite databases use write-ahead logging, so readers don't block writers in other
+     processes? Defaults to False if not specified in kwargs or configuration as ``manager_sqlite_wal``.
     :rtype: tuple[Engine,Session]
 
     From the Flask-SQLAlchemy documentation:
@@ -44,11 +125,27 @@ def build_engine_session(
     context stack identity is used. This will ensure that sessions are
     created and removed with the request/response cycle, and should be fine
     in most cases.
+
+    The engine gets a new connection pool in processes that are forked from this one, so connections are never shared
+    between processes. Sessions should still not be used across a fork, so workers should make their own managers
+    with :meth:`pybel.manager.Manager.for_worker`.
     """
     if connection is None:
         raise ValueError("can not build engine when connection is None")
 
-    engine = create_engine(connection, echo=echo)
+    engine_kwargs = get_engine_kwargs(
+        connection,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=pool_pre_ping,
+        pool_recycle=pool_recycle,
+    )
+    engine = create_engine(connection, echo=echo, **engine_kwargs)
+    _ENGINES.add(engine)
+
+    sqlite_wal = pystow.get_config("pybel", "manager_sqlite_wal", passthrough=sqlite_wal, dtype=bool, default=False)
+    if sqlite_wal and engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_wal)
 
     autoflush = pystow.get_config("pybel", "manager_autoflush", passthrough=autoflush, dtype=bool, default=True)
     autocommit = pystow.get_config("pybel", "manager_autocommit", passthrough=autocommit, dtype=bool, default=False)
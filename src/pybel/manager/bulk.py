@@ -0,0 +1,399 @@
+"""Bulk insertion of graphs into the edge store.
+
+Inserting a graph through the ORM looks up each node, edge, citation, and evidence one at a time. The functions in
+this module instead compute all hashes up front, fetch the identifiers of the rows that already exist in a few large
+``IN (...)`` queries, and insert the missing rows with multi-row Core ``INSERT`` statements. The rows that end up in
+the database are the same as the ones made by :meth:`pybel.manager.Manager.insert_graph` without ``bulk=True``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Table, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from tqdm.autonotebook import tqdm
+
+from .models import (
+    Citation,
+    Edge,
+    Evidence,
+    Namespace,
+    NamespaceEntry,
+    Node,
+    edge_annotation,
+)
+from ..constants import (
+    ANNOTATIONS,
+    CITATION,
+    EVIDENCE,
+    IDENTIFIER,
+    NAMESPACE,
+    RELATION,
+    SOURCE_MODIFIER,
+    TARGET_MODIFIER,
+    UNQUALIFIED_EDGES,
+)
+from ..dsl import BaseConcept, BaseEntity
+from ..language import Entity
+
+__all__ = [
+    "CHUNK_SIZE",
+    "iter_chunks",
+    "insert_ignore",
+    "select_ids",
+    "store_graph_parts_bulk",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The number of values in each ``IN (...)`` clause and the number of rows in each ``INSERT`` statement. This stays
+#: under the limit of 999 bound parameters of older versions of SQLite.
+CHUNK_SIZE = 500
+
+
+def iter_chunks(values: Iterable[Any], size: int = CHUNK_SIZE) -> Iterator[list[Any]]:
+    """Iterate over lists of at most the given size."""
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def insert_ignore(session: Session, table: Table, rows: Sequence[Mapping[str, Any]]) -> None:
+    """Insert rows in batches, skipping the ones that conflict with existing rows where the database supports it.
+
+    Uses ``ON CONFLICT DO NOTHING`` on SQLite and PostgreSQL and ``INSERT IGNORE`` on MySQL. On other databases,
+    conflicts raise an error like a plain insert.
+    """
+    if not rows:
+        return
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        statement = sqlite.insert(table).on_conflict_do_nothing()
+    elif dialect == "postgresql":
+        statement = postgresql.insert(table).on_conflict_do_nothing()
+    elif dialect in {"mysql", "mariadb"}:
+        statement = table.insert().prefix_with("IGNORE")
+    else:
+        statement = table.insert()
+    for chunk in iter_chunks(rows):
+        session.execute(statement, chunk)
+
+
+def select_ids(session: Session, key_column, id_column, keys: Iterable[Any], *criteria, join=None) -> dict[Any, int]:
+    """Get the identifiers of the rows whose key column has one of the given values.
+
+    If several rows have the same key, the one with the lowest identifier is kept. A key of none matches rows where
+    the key column is null, like comparing to none in a SQLAlchemy filter does.
+
+    :param session: A database session
+    :param key_column: The column to look up by
+    :param id_column: The primary key column to return
+    :param keys: The values of the key column to look up
+    :param criteria: Additional filters
+    :param join: A model to join to before filtering
+    """
+    keys = set(keys)
+    rv: dict[Any, int] = {}
+
+    def _execute(condition) -> None:
+        query = select(key_column, id_column)
+        if join is not None:
+            query = query.join(join)
+        for key, identifier in session.execute(query.where(condition, *criteria).order_by(id_column)):
+            rv.setdefault(key, identifier)
+
+    if None in keys:
+        keys.remove(None)
+        _execute(key_column.is_(None))
+    for chunk in iter_chunks(sorted(keys)):
+        _execute(key_column.in_(chunk))
+    return rv
+
+
+def store_graph_parts_bulk(manager, graph, use_tqdm: bool = False) -> tuple[list[int], list[int]]:
+    """Store the nodes and edges of the graph and get the identifiers of their rows.
+
+    Nodes and edges are skipped for the same reasons as in :meth:`pybel.manager.cache_manager.InsertManager.\
+_store_graph_parts`, e.g., nodes whose names are missing from their namespaces and edges without evidence.
+
+    :param pybel.manager.cache_manager.InsertManager manager: A manager
+    :param pybel.BELGraph graph: A BEL graph whose namespaces and annotations have already been ensured
+    :return: The identifiers of the nodes and edges of the graph
+    """
+    node_ids = _store_nodes(manager, graph, use_tqdm=use_tqdm)
+    edge_ids = _store_edges(manager, graph, node_ids, use_tqdm=use_tqdm)
+    return list(dict.fromkeys(node_ids.values())), list(dict.fromkeys(edge_ids))
+
+
+def _store_nodes(manager, graph, use_tqdm: bool = False) -> dict[int, int]:
+    """Store the nodes of the graph and get a mapping from the identities of the node objects to their row ids."""
+    session = manager.session
+    nodes = list(graph)
+    if use_tqdm:
+        nodes = tqdm(nodes, desc="hashing nodes")
+    node_to_md5 = {id(node): node.md5 for node in nodes}
+    md5_to_node = {}
+    for node in graph:
+        md5_to_node.setdefault(node_to_md5[id(node)], node)
+    md5_to_id = select_ids(session, Node.md5, Node.id, md5_to_node)
+
+    missing = [node for md5, node in md5_to_node.items() if md5 not in md5_to_id]
+    entry_ids = _get_node_namespace_entry_ids(manager, graph, missing)
+    rows = []
+    for node in missing:
+        row = {
+            "type": node.function,
+            "bel": node.as_bel(),
+            "md5": node_to_md5[id(node)],
+            "data": node,
+            "namespace_entry_id": None,
+        }
+        if isinstance(node, BaseConcept):
+            entry_id = entry_ids.get(id(node))
+            if entry_id is None:
+                logger.warning("can not add node %s", node)
+                continue
+            row["namespace_entry_id"] = entry_id
+        rows.append(row)
+
+    insert_ignore(session, Node.__table__, rows)
+    md5_to_id.update(select_ids(session, Node.md5, Node.id, [row["md5"] for row in rows]))
+    return {id(node): md5_to_id[node_to_md5[id(node)]] for node in graph if node_to_md5[id(node)] in md5_to_id}
+
+
+def _get_node_namespace_entry_ids(manager, graph, nodes: Iterable[BaseEntity]) -> dict[int, int]:
+    """Get the namespace entries of the concept nodes, creating them for nodes from regular expression namespaces."""
+    session = manager.session
+    names_by_url = defaultdict(list)
+    names_by_pattern = defaultdict(list)
+    for node in nodes:
+        if not isinstance(node, BaseConcept):
+            continue
+        if node.namespace in graph.namespace_url:
+            names_by_url[graph.namespace_url[node.namespace]].append(node)
+        elif node.namespace in graph.namespace_pattern:
+            names_by_pattern[node.namespace, graph.namespace_pattern[node.namespace]].append(node)
+        else:
+            logger.warning(f"No reference in BELGraph for namespace: {node.namespace}")
+
+    rv = {}
+    for url, url_nodes in names_by_url.items():
+        name_to_id = manager.get_namespace_entry_ids(url, [node.name for node in url_nodes])
+        for node in url_nodes:
+            entry_id = name_to_id.get(node.name)
+            if entry_id is None:
+                logger.debug("skipping node with entity %s:%s from url=%s", node.namespace, node.name, url)
+            else:
+                rv[id(node)] = entry_id
+
+    for (keyword, pattern), pattern_nodes in names_by_pattern.items():
+        namespace = manager.ensure_regex_namespace(keyword, pattern)
+        names = {}
+        for node in pattern_nodes:
+            names.setdefault(node.name, node.identifier)
+        name_to_id = select_ids(
+            session, NamespaceEntry.name, NamespaceEntry.id, names, Namespace.pattern == pattern, join=Namespace
+        )
+        insert_ignore(
+            session,
+            NamespaceEntry.__table__,
+            [
+                {"namespace_id": namespace.id, "name": name, "identifier": identifier}
+                for name, identifier in names.items()
+                if name not in name_to_id
+            ],
+        )
+        name_to_id.update(
+            select_ids(
+                session,
+                NamespaceEntry.name,
+                NamespaceEntry.id,
+                [name for name in names if name not in name_to_id],
+                Namespace.pattern == pattern,
+                join=Namespace,
+            )
+        )
+        for node in pattern_nodes:
+            rv[id(node)] = name_to_id[node.name]
+
+    return rv
+
+
+def _store_edges(manager, graph, node_ids: Mapping[int, int], use_tqdm: bool = False) -> list[int]:
+    """Store the edges of the graph and get the ids of their rows."""
+    session = manager.session
+    edges = graph.edges(keys=True, data=True)
+    if use_tqdm:
+        edges = tqdm(edges, total=graph.number_of_edges(), desc="edges")
+
+    # the edges that can be stored, with their source and target ids
+    kept = {}
+    for u, v, key, data in edges:
+        source_id = node_ids.get(id(u))
+        if source_id is None:
+            logger.warning("skipping uncached source node: %s", u)
+            continue
+        target_id = node_ids.get(id(v))
+        if target_id is None:
+            logger.warning("skipping uncached target node: %s", v)
+            continue
+        if data[RELATION] not in UNQUALIFIED_EDGES:
+            if EVIDENCE not in data or CITATION not in data:
+                continue
+            if NAMESPACE not in data[CITATION] or IDENTIFIER not in data[CITATION]:
+                continue
+        kept.setdefault(key, (u, v, data, source_id, target_id))
+
+    md5_to_id = select_ids(session, Edge.md5, Edge.id, kept)
+    missing = {key: value for key, value in kept.items() if key not in md5_to_id}
+    # only qualified edges get evidences and annotations
+    qualified = {key: data for key, (_, _, data, _, _) in missing.items() if data[RELATION] not in UNQUALIFIED_EDGES}
+    evidence_ids = _get_evidence_ids(session, qualified.values())
+    annotation_ids = _get_annotation_entry_ids(manager, graph, qualified.values())
+
+    rows = []
+    for key, (u, v, data, source_id, target_id) in missing.items():
+        evidence_id = None
+        if key in qualified:
+            evidence_id = evidence_ids[_get_citation_key(data), data[EVIDENCE]]
+        rows.append(
+            {
+                "bel": graph.edge_to_bel(u, v, data),
+                "relation": data[RELATION],
+                "source_id": source_id,
+                "target_id": target_id,
+                "evidence_id": evidence_id,
+                "source_modifier": data.get(SOURCE_MODIFIER),
+                "target_modifier": data.get(TARGET_MODIFIER),
+                "md5": key,
+                "data": data,
+            }
+        )
+    insert_ignore(session, Edge.__table__, rows)
+    inserted = select_ids(session, Edge.md5, Edge.id, missing)
+    md5_to_id.update(inserted)
+
+    annotation_rows = []
+    for key, data in qualified.items():
+        annotations = data.get(ANNOTATIONS)
+        if annotations is None or key not in inserted:
+            continue
+        entry_ids = dict.fromkeys(
+            entry_id
+            for url, entities in manager._iter_from_annotations_dict(graph, annotations)
+            for name in _get_annotation_names(entities)
+            for entry_id in annotation_ids.get((url, name), ())
+        )
+        annotation_rows.extend({"edge_id": inserted[key], "name_id": entry_id} for entry_id in entry_ids)
+    insert_ignore(session, edge_annotation, annotation_rows)
+    return [md5_to_id[key] for key in kept]
+
+
+def _get_citation_key(data) -> tuple[str, str]:
+    return data[CITATION][NAMESPACE], data[CITATION][IDENTIFIER]
+
+
+def _get_evidence_ids(
+    session: Session, edge_data: Iterable[Mapping[str, Any]]
+) -> dict[tuple[tuple[str, str], str], int]:
+    """Get or create the citations and evidences of the qualified edges."""
+    texts_by_citation = defaultdict(dict)
+    for data in edge_data:
+        texts_by_citation[_get_citation_key(data)][data[EVIDENCE]] = None
+    if not texts_by_citation:
+        return {}
+
+    citation_ids = _get_citation_ids(session, texts_by_citation)
+    citation_id_to_key = {citation_id: key for key, citation_id in citation_ids.items()}
+
+    def _select_evidences():
+        rv = {}
+        for chunk in iter_chunks(sorted(citation_id_to_key)):
+            query = (
+                select(Evidence.citation_id, Evidence.text, Evidence.id)
+                .where(Evidence.citation_id.in_(chunk))
+                .order_by(Evidence.id)
+            )
+            for citation_id, text, evidence_id in session.execute(query):
+                rv.setdefault((citation_id_to_key[citation_id], text), evidence_id)
+        return rv
+
+    evidence_ids = _select_evidences()
+    insert_ignore(
+        session,
+        Evidence.__table__,
+        [
+            {"citation_id": citation_ids[citation], "text": text}
+            for citation, texts in texts_by_citation.items()
+            for text in texts
+            if (citation, text) not in evidence_ids
+        ],
+    )
+    return _select_evidences()
+
+
+def _get_citation_ids(session: Session, citations: Iterable[tuple[str, str]]) -> dict[tuple[str, str], int]:
+    """Get or create the citations with the given namespaces and identifiers."""
+    identifiers_by_namespace = defaultdict(dict)
+    for namespace, identifier in citations:
+        identifiers_by_namespace[namespace][identifier] = None
+
+    def _select_citations():
+        rv = {}
+        for namespace, identifiers in identifiers_by_namespace.items():
+            ids = select_ids(session, Citation.db_id, Citation.id, identifiers, Citation.db == namespace)
+            rv.update(((namespace, identifier), citation_id) for identifier, citation_id in ids.items())
+        return rv
+
+    rv = _select_citations()
+    insert_ignore(
+        session,
+        Citation.__table__,
+        [
+            {"db": namespace, "db_id": identifier}
+            for namespace, identifiers in identifiers_by_namespace.items()
+            for identifier in identifiers
+            if (namespace, identifier) not in rv
+        ],
+    )
+    return _select_citations()
+
+
+def _get_annotation_names(entities: Iterable[Entity]) -> list[str]:
+    """Get the names that annotation entries are looked up by, like
+    :meth:`pybel.manager.cache_manager.NamespaceManager.get_annotation_entries_by_names` does."""
+    return [entity.identifier if isinstance(entity, Entity) else entity for entity in entities]
+
+
+def _get_annotation_entry_ids(manager, graph, edge_data: Iterable[Mapping[str, Any]]) -> dict[tuple[str, str], list]:
+    """Get the ids of the annotation entries of the edges, with one query per annotation."""
+    names_by_url = defaultdict(set)
+    for data in edge_data:
+        annotations = data.get(ANNOTATIONS)
+        if annotations is None:
+            continue
+        for url, entities in manager._iter_from_annotations_dict(graph, annotations):
+            names_by_url[url].update(_get_annotation_names(entities))
+
+    rv = defaultdict(list)
+    for url, names in names_by_url.items():
+        for chunk in iter_chunks(sorted(names)):
+            query = (
+                select(NamespaceEntry.name, NamespaceEntry.id)
+                .join(Namespace)
+                .where(Namespace.url == url, NamespaceEntry.name.in_(chunk))
+                .order_by(NamespaceEntry.id)
+            )
+            for name, entry_id in manager.session.execute(query):
+                rv[url, name].append(entry_id)
+    return rv
@@ -4,11 +4,16 @@ Under the hood, PyBEL caches namespace and annotation files for quick recall on
 enable this option, but can specify a database location if they choose.
 """
 
+import datetime
 import logging
 import time
-from collections.abc import Iterable, Mapping
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
 
+import networkx as nx
 import pandas as pd
+import pystow
 import requests
 import sqlalchemy
 from bel_resources import get_bel_resource
@@ -16,7 +21,8 @@ from sqlalchemy import and_, exists, func
 from sqlalchemy.orm import aliased
 from tqdm.autonotebook import tqdm
 
-from .base_manager import BaseManager, build_engine_session
+from .base_manager import BaseManager, build_engine_session, is_sqlite_memory
+from .bulk import insert_ignore, select_ids, store_graph_parts_bulk
 from .exc import EdgeAddError
 from .lookup_manager import LookupManager
 from .models import (
@@ -34,6 +40,8 @@ from .models import (
 )
 from .query_manager import QueryManager
 from .utils import (
+    CacheInfo,
+    LRUCache,
     extract_shared_optional,
     extract_shared_required,
     update_insert_values,
@@ -132,6 +140,62 @@ def _clean_bel_namespace_values(bel_resource):
 class NamespaceManager(BaseManager):
     """Manages BEL namespaces."""
 
+    #: The maximum number of namespace entry identifiers kept in memory by :meth:`get_namespace_entry_ids`. Set to
+    #: zero to disable the namespace entry cache.
+    namespace_entry_cache_max_size: int = 1_000_000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        #: A least recently used cache from namespace URLs and names to namespace entry identifiers
+        self._namespace_entry_cache: OrderedDict[tuple[str, str], int] = OrderedDict()
+
+    def get_namespace_entry_ids(self, url: str, names: Iterable[str]) -> dict[str, int]:
+        """Get the identifiers of the entries with the given names from the namespace at the given URL.
+
+        Names that are not in the namespace are left out. The names that are not already cached are looked up in
+        chunked ``IN (...)`` queries, so getting the entries for all nodes of a graph at once is much faster than
+        looking them up one at a time with :meth:`get_namespace_entry`.
+
+        :param url: The url of the namespace source
+        :param names: The values of the namespace from the given url's document
+        """
+        rv = {}
+        missing = []
+        for name in names:
+            entry_id = self._namespace_entry_cache.get((url, name))
+            if entry_id is None:
+                missing.append(name)
+            else:
+                self._namespace_entry_cache.move_to_end((url, name))
+                rv[name] = entry_id
+
+        if missing:
+            found = select_ids(
+                self.session,
+                NamespaceEntry.name,
+                NamespaceEntry.id,
+                missing,
+                Namespace.url == url,
+                join=Namespace,
+            )
+            rv.update(found)
+            for name, entry_id in found.items():
+                self._namespace_entry_cache[url, name] = entry_id
+            while self.namespace_entry_cache_max_size < len(self._namespace_entry_cache):
+                self._namespace_entry_cache.popitem(last=False)
+
+        return rv
+
+    def clear_namespace_entry_cache(self) -> None:
+        """Remove all namespace entry identifiers from the namespace entry cache."""
+        self._namespace_entry_cache.clear()
+
+    def drop_all(self, checkfirst: bool = True) -> None:
+        """Drop all data, tables, and databases for the PyBEL cache."""
+        super().drop_all(checkfirst=checkfirst)
+        self.clear_namespace_entry_cache()
+
     def list_namespaces(self) -> list[Namespace]:
         """List all namespaces."""
         return self._list_model(Namespace)
@@ -149,6 +213,7 @@ class NamespaceManager(BaseManager):
         self.session.query(NamespaceEntry).delete()
         self.session.query(Namespace).delete()
         self.session.commit()
+        self.clear_namespace_entry_cache()
 
     def drop_namespace_by_url(self, url: str) -> None:
         """Drop the namespace at the given URL.
@@ -161,6 +226,7 @@ class NamespaceManager(BaseManager):
         self.session.query(NamespaceEntry).filter(NamespaceEntry.namespace == namespace).delete()
         self.session.delete(namespace)
         self.session.commit()
+        self.clear_namespace_entry_cache()
 
     def get_namespace_by_url(self, url: str) -> Namespace | None:
         """Look up a namespace by url."""
@@ -379,6 +445,58 @@ class NamespaceManager(BaseManager):
 class NetworkManager(NamespaceManager):
     """Groups functions for inserting and querying networks in the database's network store."""
 
+    #: The maximum number of nodes and edges summed over all graphs kept in memory by :meth:`get_graph_by_id` and
+    #: :meth:`get_graph_by_ids`. The graph cache is disabled by default, since cached graphs are shared between calls
+    #: and therefore frozen. Set to a positive number to enable it.
+    graph_cache_max_elements: int = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        #: A least recently used cache from sorted tuples of network identifiers to frozen graphs
+        self._graph_cache: OrderedDict[tuple[int, ...], BELGraph] = OrderedDict()
+        self._graph_cache_elements = 0
+
+    def _get_cached_graph(self, key: tuple[int, ...]) -> BELGraph | None:
+        rv = self._graph_cache.get(key)
+        if rv is not None:
+            self._graph_cache.move_to_end(key)
+        return rv
+
+    def _set_cached_graph(self, key: tuple[int, ...], graph: BELGraph) -> BELGraph:
+        """Freeze the graph and add it to the graph cache, unless it is too big to fit."""
+        elements = graph.number_of_nodes() + graph.number_of_edges()
+        if self.graph_cache_max_elements < elements:
+            return graph
+
+        while self._graph_cache and self.graph_cache_max_elements < self._graph_cache_elements + elements:
+            _, evicted = self._graph_cache.popitem(last=False)
+            self._graph_cache_elements -= evicted.number_of_nodes() + evicted.number_of_edges()
+
+        self._graph_cache[key] = nx.freeze(graph)
+        self._graph_cache_elements += elements
+        return graph
+
+    def clear_graph_cache(self, network_ids: Iterable[int] | None = None) -> None:
+        """Remove graphs from the graph cache.
+
+        :param network_ids: If given, only removes the graphs and universes that contain these networks
+        """
+        if network_ids is None:
+            self._graph_cache.clear()
+            self._graph_cache_elements = 0
+            return
+
+        network_ids = set(network_ids)
+        for key in [key for key in self._graph_cache if network_ids.intersection(key)]:
+            graph = self._graph_cache.pop(key)
+            self._graph_cache_elements -= graph.number_of_nodes() + graph.number_of_edges()
+
+    def drop_all(self, checkfirst: bool = True) -> None:
+        """Drop all data, tables, and databases for the PyBEL cache."""
+        super().drop_all(checkfirst=checkfirst)
+        self.clear_graph_cache()
+
     def count_networks(self) -> int:
         """Count the networks in the database."""
         return self._count_model(Network)
@@ -413,6 +531,7 @@ class NetworkManager(NamespaceManager):
         """Drop all networks."""
         for network in self.session.query(Network).all():
             self.drop_network(network)
+        self.clear_graph_cache()
 
     def drop_network_by_id(self, network_id: int) -> None:
         """Drop a network by its database identifier."""
@@ -421,6 +540,9 @@ class NetworkManager(NamespaceManager):
 
     def drop_network(self, network: Network) -> None:
         """Drop a network, while also cleaning up any edges that are no longer part of any network."""
+        # the identifier can't be loaded from the expired network after the commit
+        network_id = network.id
+
         # get the IDs of the edges that will be orphaned by deleting this network
         # FIXME: this list could be a problem if it becomes very large; possible optimization is a temporary table in DB
         edge_ids = [result.edge_id for result in self.query_singleton_edges_from_network(network)]
@@ -449,6 +571,8 @@ class NetworkManager(NamespaceManager):
         # commit it!
         self.session.commit()
 
+        self.clear_graph_cache([network_id])
+
     def query_singleton_edges_from_network(self, network: Network) -> sqlalchemy.orm.query.Query:
         """Return a query selecting all edge ids that only belong to the given network."""
         ne1 = aliased(network_edge, name="ne1")
@@ -512,10 +636,20 @@ class NetworkManager(NamespaceManager):
         return self.session.query(Network).get(network_id)
 
     def get_graph_by_id(self, network_id: int) -> BELGraph:
-        """Get a network from the database by its identifier and converts it to a BEL graph."""
+        """Get a network from the database by its identifier and converts it to a BEL graph.
+
+        If the graph cache is enabled (see :data:`graph_cache_max_elements`), graphs are kept in a bounded cache and
+        cached graphs are frozen with :func:`networkx.freeze` since they are shared between calls. Use
+        :meth:`pybel.BELGraph.copy` to get a graph that can be modified. Otherwise, a new graph is returned by each
+        call.
+        """
+        rv = self._get_cached_graph((network_id,))
+        if rv is not None:
+            return rv
+
         network = self.get_network_by_id(network_id)
         logger.debug("converting network [id=%d] %s to bel graph", network_id, network)
-        return network.as_bel()
+        return self._set_cached_graph((network_id,), network.as_bel())
 
     def get_networks_by_ids(self, network_ids: Iterable[int]) -> list[Network]:
         """Get a list of networks with the given identifiers.
@@ -525,6 +659,14 @@ class NetworkManager(NamespaceManager):
         logger.debug("getting networks by identifiers: %s", network_ids)
         return self.session.query(Network).filter(Network.id_in(network_ids)).all()
 
+    def get_network_timestamps(self, network_ids: Iterable[int]) -> Mapping[int, datetime.datetime]:
+        """Get the upload timestamps of the networks with the given identifiers, without loading their blobs.
+
+        Identifiers of networks that are not in the database are not included.
+        """
+        query = self.session.query(Network.id, Network.created).filter(Network.id_in(network_ids))
+        return dict(query.all())
+
     def get_graphs_by_ids(self, network_ids: Iterable[int]) -> list[BELGraph]:
         """Get a list of networks with the given identifiers and converts to BEL graphs."""
         rv = [self.get_graph_by_id(network_id) for network_id in network_ids]
@@ -532,41 +674,121 @@ class NetworkManager(NamespaceManager):
         return rv
 
     def get_graph_by_ids(self, network_ids: list[int]) -> BELGraph:
-        """Get a combine BEL Graph from a list of network identifiers."""
-        if len(network_ids) == 1:
-            return self.get_graph_by_id(network_ids[0])
+        """Get a combine BEL Graph from a list of network identifiers.
+
+        The union is taken in the order of the sorted identifiers and, like the graphs for each network, is kept in
+        the graph cache and frozen if the graph cache is enabled. See :meth:`get_graph_by_id`.
+        """
+        key = tuple(sorted(set(network_ids)))
+        if len(key) == 1:
+            return self.get_graph_by_id(key[0])
+
+        rv = self._get_cached_graph(key)
+        if rv is not None:
+            return rv
 
-        logger.debug("getting graph by identifiers: %s", network_ids)
-        graphs = self.get_graphs_by_ids(network_ids)
+        logger.debug("getting graph by identifiers: %s", key)
+        graphs = self.get_graphs_by_ids(key)
 
-        logger.debug("getting union of graphs: %s", network_ids)
+        logger.debug("getting union of graphs: %s", key)
         rv = union(graphs)
 
-        return rv
+        return self._set_cached_graph(key, rv)
 
 
-class InsertManager(NamespaceManager, LookupManager):
+class InsertManager(NetworkManager, LookupManager):
     """Manages inserting data into the edge store."""
 
-    def __init__(self, *args, **kwargs):
+    #: The default maximum number of models kept by each of the object caches. Set to zero to disable them.
+    object_cache_max_size: int = 100_000
+
+    def __init__(self, *args, object_cache_max_size: int | None = None, **kwargs):
+        """Initialize the object caches.
+
+        :param object_cache_max_size: The maximum number of models kept by each of the object caches. Defaults to
+         the configuration as ``manager_object_cache_max_size``, then to :data:`object_cache_max_size`.
+        """
         super().__init__(*args, **kwargs)
 
+        self.object_cache_max_size = pystow.get_config(
+            "pybel",
+            "manager_object_cache_max_size",
+            passthrough=object_cache_max_size,
+            dtype=int,
+            default=type(self).object_cache_max_size,
+        )
+
         # A set of dictionaries that contains objects of the type described by the key
         self.object_cache_modification = {}
         self.object_cache_property = {}
-        self.object_cache_node = {}
-        self.object_cache_edge = {}
-        self.object_cache_evidence = {}
-        self.curie_to_citation = {}
-        self.object_cache_author = {}
+
+        # Least recently used caches from the keys of nodes, edges, evidences, citations, and authors to their models.
+        # Models that are evicted can be garbage collected once they are flushed, and are looked up again if needed.
+        self.object_cache_node = LRUCache(self.object_cache_max_size, on_evict=self._flush_evicted)
+        self.object_cache_edge = LRUCache(self.object_cache_max_size, on_evict=self._flush_evicted)
+        self.object_cache_evidence = LRUCache(self.object_cache_max_size, on_evict=self._flush_evicted)
+        self.curie_to_citation = LRUCache(self.object_cache_max_size, on_evict=self._flush_evicted)
+        self.object_cache_author = LRUCache(self.object_cache_max_size, on_evict=self._flush_evicted)
+
+    def _iter_object_caches(self) -> Iterable[tuple[str, LRUCache]]:
+        yield "node", self.object_cache_node
+        yield "edge", self.object_cache_edge
+        yield "evidence", self.object_cache_evidence
+        yield "citation", self.curie_to_citation
+        yield "author", self.object_cache_author
+
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Get the hit and miss counts and the sizes of the object caches."""
+        return {name: cache.cache_info() for name, cache in self._iter_object_caches()}
+
+    def clear_caches(self) -> None:
+        """Remove all primary keys from the object caches.
+
+        This is called after each network is committed by :meth:`insert_graph`. The hit and miss counts are kept.
+        """
+        for _, cache in self._iter_object_caches():
+            cache.clear()
+
+    def _get_cached_model(self, cache: LRUCache, key):
+        """Get a cached model, or none if it is not cached or is no longer in the session.
+
+        Models leave the session if they were rolled back, deleted, or expunged.
+        """
+        rv = cache.get(key)
+        if rv is None:
+            return
+        if rv not in self.session:
+            cache.pop(key)
+            return
+        return rv
+
+    def _cache_model(self, cache: LRUCache, key, model) -> None:
+        """Add the model to the session and cache it."""
+        self.session.add(model)
+        cache[key] = model
+
+    def _flush_evicted(self, _key, model) -> None:
+        """Flush the session if an evicted model is new, so it can be found by looking it up again.
+
+        New models are otherwise only flushed when the session is committed, or on the next query when autoflush is
+        on. Flushing writes all new models at once, so this happens at most once for every cache full of them.
+        """
+        if model in self.session.new:
+            self.session.flush()
 
     def insert_graph(
         self,
         graph: BELGraph,
         use_tqdm: bool = True,
+        bulk: bool = False,
     ) -> Network:
         """Insert a graph in the database and returns the corresponding Network model.
 
+        :param graph: A BEL graph
+        :param use_tqdm: Should progress bars be shown?
+        :param bulk: Should the nodes and edges be stored with multi-row inserts from
+         :func:`pybel.manager.bulk.store_graph_parts_bulk` instead of one at a time through the ORM? This is much
+         faster for large graphs and stores the same rows.
         :raises: pybel.resources.exc.ResourceError
         """
         if not graph.name:
@@ -591,10 +813,15 @@ class InsertManager(NamespaceManager, LookupManager):
 
         network.store_bel(graph)
 
-        network.nodes, network.edges = self._store_graph_parts(graph, use_tqdm=use_tqdm)
-
-        self.session.add(network)
-        self.session.commit()
+        if bulk:
+            self._insert_network_bulk(graph, network, use_tqdm=use_tqdm)
+        else:
+            network.nodes, network.edges = self._store_graph_parts(graph, use_tqdm=use_tqdm)
+            self.session.add(network)
+            self.session.commit()
+        self.clear_caches()
+        # Databases may reuse the identifiers of dropped networks
+        self.clear_graph_cache([network.id])
 
         logger.info(
             "inserted %s v%s in %.2f seconds",
@@ -605,6 +832,29 @@ class InsertManager(NamespaceManager, LookupManager):
 
         return network
 
+    def _insert_network_bulk(self, graph: BELGraph, network: Network, use_tqdm: bool = False) -> None:
+        """Store the nodes and edges of the graph with multi-row inserts, then link them to the network."""
+        try:
+            node_ids, edge_ids = store_graph_parts_bulk(self, graph, use_tqdm=use_tqdm)
+            self.session.add(network)
+            self.session.flush()
+            insert_ignore(
+                self.session,
+                network_node,
+                [{"network_id": network.id, "node_id": node_id} for node_id in node_ids],
+            )
+            insert_ignore(
+                self.session,
+                network_edge,
+                [{"network_id": network.id, "edge_id": edge_id} for edge_id in edge_ids],
+            )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        # the relationships were filled in behind the ORM's back
+        self.session.expire(network, ["nodes", "edges"])
+
     def _store_graph_parts(self, graph: BELGraph, use_tqdm: bool = False) -> tuple[list[Node], list[Edge]]:
         """Store the given graph into the edge store.
 
@@ -619,6 +869,8 @@ class InsertManager(NamespaceManager, LookupManager):
         if use_tqdm:
             nodes = tqdm(nodes, total=graph.number_of_nodes(), desc="nodes")
 
+        self._prefetch_namespace_entry_ids(graph, graph)
+
         node_model = {}
         for node in nodes:
             node_object = self.get_or_create_node(graph, node)
@@ -652,7 +904,10 @@ class InsertManager(NamespaceManager, LookupManager):
         if use_tqdm:
             edges = tqdm(edges, total=graph.number_of_edges(), desc="edges")
 
-        edge_models = list(self._get_edge_models(graph, node_model, edges))
+        # new citations, evidences, authors, and edges are found in the object caches, so they don't need to be
+        # flushed before each lookup query
+        with self.session.no_autoflush:
+            edge_models = list(self._get_edge_models(graph, node_model, edges))
 
         logger.debug(
             "built %d edge models in %.2f seconds",
@@ -671,6 +926,15 @@ class InsertManager(NamespaceManager, LookupManager):
 
         return node_models, edge_models
 
+    def _prefetch_namespace_entry_ids(self, graph: BELGraph, nodes: Iterable[BaseEntity]) -> None:
+        """Warm the namespace entry cache with the entries of the given concept nodes, with one batch per URL."""
+        names_by_url = defaultdict(list)
+        for node in nodes:
+            if isinstance(node, BaseConcept) and node.namespace in graph.namespace_url:
+                names_by_url[graph.namespace_url[node.namespace]].append(node.name)
+        for url, names in names_by_url.items():
+            self.get_namespace_entry_ids(url, names)
+
     def _get_edge_models(
         self,
         graph: BELGraph,
@@ -679,12 +943,12 @@ class InsertManager(NamespaceManager, LookupManager):
     ) -> Iterable[Edge]:
         for u, v, key, data in edges:
             source = tuple_model.get(u)
-            if source is None or source.md5 not in self.object_cache_node:
+            if source is None:
                 logger.warning("skipping uncached source node: %s", u)
                 continue
 
             target = tuple_model.get(v)
-            if target is None or target.md5 not in self.object_cache_node:
+            if target is None:
                 logger.warning("skipping uncached target node: %s", v)
                 continue
 
@@ -807,48 +1071,42 @@ class InsertManager(NamespaceManager, LookupManager):
     def get_or_create_evidence(self, citation: Citation, text: str) -> Evidence:
         """Create an entry and object for given evidence if it does not exist."""
         evidence_tuple = citation.db, citation.db_id, text
-        if evidence_tuple in self.object_cache_evidence:
-            evidence = self.object_cache_evidence[evidence_tuple]
-            self.session.add(evidence)
-            return evidence
-
-        evidence = self.get_evidence_by_citation_text(citation, text)
+        evidence = self._get_cached_model(self.object_cache_evidence, evidence_tuple)
         if evidence is not None:
-            self.object_cache_evidence[evidence_tuple] = evidence
             return evidence
 
-        self.object_cache_evidence[evidence_tuple] = evidence = Evidence(
-            citation=citation,
-            text=text,
-        )
+        # a citation that is not flushed yet can't have evidences in the database
+        evidence = None if citation.id is None else self.get_evidence_by_citation_text(citation, text)
+        if evidence is None:
+            evidence = Evidence(citation=citation, text=text)
 
-        self.session.add(evidence)
+        self._cache_model(self.object_cache_evidence, evidence_tuple, evidence)
         return evidence
 
     def get_or_create_node(self, graph: BELGraph, node: BaseEntity) -> Node | None:
         """Create an entry and object for given node if it does not exist."""
         node_md5 = node.md5
-        if node_md5 in self.object_cache_node:
-            return self.object_cache_node[node_md5]
+        node_model = self._get_cached_model(self.object_cache_node, node_md5)
+        if node_model is not None:
+            return node_model
 
         node_model = self.get_node_by_hash(node_md5)
         if node_model is not None:
-            self.object_cache_node[node_md5] = node_model
+            self._cache_model(self.object_cache_node, node_md5, node_model)
             return node_model
 
         node_model = Node._start_from_base_entity(node)
 
         if not isinstance(node, BaseConcept):
-            self.session.add(node_model)
-            self.object_cache_node[node_md5] = node_model
+            self._cache_model(self.object_cache_node, node_md5, node_model)
             return node_model
 
         if node.namespace in graph.namespace_url:
             url = graph.namespace_url[node.namespace]
             name = node.name
-            entry = self.get_namespace_entry(url, name)
+            entry_id = self.get_namespace_entry_ids(url, [name]).get(name)
 
-            if entry is None:
+            if entry_id is None:
                 logger.debug(
                     "skipping node with entity %s:%s from url=%s",
                     node.namespace,
@@ -857,8 +1115,7 @@ class InsertManager(NamespaceManager, LookupManager):
                 )
                 return
 
-            self.session.add(entry)
-            node_model.namespace_entry = entry
+            node_model.namespace_entry_id = entry_id
 
         elif node.namespace in graph.namespace_pattern:
             entry = self.get_or_create_regex_namespace_entry(
@@ -872,8 +1129,7 @@ class InsertManager(NamespaceManager, LookupManager):
             logger.warning(f"No reference in BELGraph for namespace: {node.namespace}")
             return
 
-        self.session.add(node_model)
-        self.object_cache_node[node_md5] = node_model
+        self._cache_model(self.object_cache_node, node_md5, node_model)
         return node_model
 
     def drop_nodes(self) -> None:
@@ -916,15 +1172,14 @@ class InsertManager(NamespaceManager, LookupManager):
         :param evidence: Evidence object that proves the given relation
         :param annotations: List of all annotations that belong to the edge
         """
-        if md5 in self.object_cache_edge:
-            edge = self.object_cache_edge[md5]
-            self.session.add(edge)
+        edge = self._get_cached_model(self.object_cache_edge, md5)
+        if edge is not None:
             return edge
 
         edge = self.get_edge_by_hash(md5)
 
         if edge is not None:
-            self.object_cache_edge[md5] = edge
+            self._cache_model(self.object_cache_edge, md5, edge)
             return edge
 
         edge = Edge(
@@ -943,8 +1198,7 @@ class InsertManager(NamespaceManager, LookupManager):
         if annotations is not None:
             edge.annotations = annotations
 
-        self.session.add(edge)
-        self.object_cache_edge[md5] = edge
+        self._cache_model(self.object_cache_edge, md5, edge)
         return edge
 
     def get_or_create_citation(
@@ -962,37 +1216,28 @@ class InsertManager(NamespaceManager, LookupManager):
             namespace = CITATION_TYPE_PUBMED
 
         citation_curie = f"{namespace}:{identifier}"
-        if citation_curie in self.curie_to_citation:
-            citation = self.curie_to_citation[citation_curie]
-            self.session.add(citation)
+        citation = self._get_cached_model(self.curie_to_citation, citation_curie)
+        if citation is not None:
             return citation
 
         citation = self.get_citation_by_reference(namespace, identifier)
+        if citation is None:
+            citation = Citation(db=namespace, db_id=identifier)
 
-        if citation is not None:
-            self.curie_to_citation[citation_curie] = citation
-            return citation
-
-        self.curie_to_citation[citation_curie] = citation = Citation(db=namespace, db_id=identifier)
-        self.session.add(citation)
+        self._cache_model(self.curie_to_citation, citation_curie, citation)
         return citation
 
     def get_or_create_author(self, name: str) -> Author:
         """Get an author by name, or creates one if it does not exist."""
-        author = self.object_cache_author.get(name)
-
+        author = self._get_cached_model(self.object_cache_author, name)
         if author is not None:
-            self.session.add(author)
             return author
 
         author = self.get_author_by_name(name)
+        if author is None:
+            author = Author(name=name)
 
-        if author is not None:
-            self.object_cache_author[name] = author
-            return author
-
-        author = self.object_cache_author[name] = Author(name=name)
-        self.session.add(author)
+        self._cache_model(self.object_cache_author, name, author)
         return author
 
 
@@ -1011,7 +1256,14 @@ class _Manager(QueryManager, InsertManager, NetworkManager):
 class Manager(_Manager):
     """A manager for the PyBEL database."""
 
-    def __init__(self, connection: str | None = None, engine=None, session=None, **kwargs) -> None:
+    def __init__(
+        self,
+        connection: str | None = None,
+        engine=None,
+        session=None,
+        object_cache_max_size: int | None = None,
+        **kwargs,
+    ) -> None:
         """Create a connection to database and a persistent session using SQLAlchemy.
 
         A custom default can be set as an environment variable with the name :data:`pybel.constants.PYBEL_CONNECTION`,
@@ -1032,11 +1284,18 @@ class Manager(_Manager):
          value for ``PYBEL_CONNECTION`` defaults to :data:`pybel.constants.DEFAULT_CACHE_CONNECTION`.
         :param engine: Optional engine to use. Must be specified with a session and no connection.
         :param session: Optional session to use. Must be specified with an engine and no connection.
+        :param object_cache_max_size: The maximum number of models kept by each of the object caches used when
+         inserting graphs. Defaults to the configuration as ``manager_object_cache_max_size``, then to 100,000.
         :param bool echo: Turn on echoing sql
         :param Optional[bool] autoflush: Defaults to True if not specified in kwargs or configuration.
         :param Optional[bool] autocommit: Defaults to False if not specified in kwargs or configuration.
         :param Optional[bool] expire_on_commit: Defaults to False if not specified in kwargs or configuration.
         :param scopefunc: Scoped function to pass to :func:`sqlalchemy.orm.scoped_session`
+        :param Optional[int] pool_size: The number of connections kept open in the pool
+        :param Optional[int] max_overflow: The number of connections that can be opened beyond the pool size
+        :param Optional[bool] pool_pre_ping: Should connections be tested before they are used?
+        :param Optional[int] pool_recycle: The number of seconds after which connections are replaced
+        :param Optional[bool] sqlite_wal: Should SQLite databases use write-ahead logging?
 
         From the Flask-SQLAlchemy documentation:
 
@@ -1088,5 +1347,37 @@ class Manager(_Manager):
         elif kwargs:
             raise ValueError("keyword arguments should not be used with engine/session")
 
-        super().__init__(engine=engine, session=session)
+        super().__init__(engine=engine, session=session, object_cache_max_size=object_cache_max_size)
+        #: The keyword arguments for :func:`build_engine_session`, so :meth:`for_worker` can build the same ones
+        self._engine_session_kwargs = kwargs
         self.create_all()
+
+    def for_worker(self) -> "Manager":
+        """Make a manager with its own engine and session that connects to the same database with the same options.
+
+        Connections can't be shared between processes and sessions can't be shared between threads, so each worker of a
+        process or thread pool should make its own manager, like in the pool's initializer:
+
+        .. code-block:: python
+
+            from concurrent.futures import ProcessPoolExecutor
+
+            manager = Manager(sqlite_wal=True)
+            worker_manager = None
+
+            def initialize():
+                global worker_manager
+                worker_manager = manager.for_worker()
+
+            executor = ProcessPoolExecutor(initializer=initialize)
+
+        :raises ValueError: If the manager is connected to an in-memory SQLite database, which workers can't connect to
+        """
+        if is_sqlite_memory(self.engine.url):
+            raise ValueError("workers can not connect to an in-memory SQLite database. Use a file instead.")
+
+        return Manager(
+            connection=self.engine.url.render_as_string(hide_password=False),
+            object_cache_max_size=self.object_cache_max_size,
+            **self._engine_session_kwargs,
+        )
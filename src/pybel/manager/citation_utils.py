@@ -1,34 +1,57 @@
 """Citation utilities for the database manager."""
 
 import logging
+import random
 import re
-from collections.abc import Iterable, Mapping
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 from functools import lru_cache
-from typing import Any
+from typing import Any, TypeVar
 
-import ratelimit
+import pystow
 import requests
 from more_itertools import chunked
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.util import identity_key
 from tqdm.autonotebook import tqdm
 
 from . import models
+from .bulk import insert_ignore, iter_chunks, select_ids
 from .cache_manager import Manager
-from ..constants import CITATION
+from ..constants import CITATION, CITATION_TYPE_PUBMED
 from ..struct.filters import filter_edges
 from ..struct.filters.edge_predicates import CITATION_PREDICATES
 from ..struct.graph import BELGraph
 from ..struct.summary.provenance import get_citation_identifiers
 
 __all__ = [
+    "TokenBucket",
+    "EUtilsClient",
     "enrich_pmc_citations",
     "enrich_pubmed_citations",
 ]
 
 logger = logging.getLogger(__name__)
 
-EUTILS_URL_FMT = "http://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=pubmed&retmode=json&id={}"
+X = TypeVar("X")
+
+EUTILS_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi"
+
+#: The requests per second that NCBI allows without and with an API key, from
+#: https://ncbiinsights.ncbi.nlm.nih.gov/2018/08/14/release-plan-for-e-utility-api-keys/
+NCBI_RATE_LIMIT = 3
+NCBI_API_KEY_RATE_LIMIT = 10
+
+#: HTTP status codes of failed requests that are worth retrying
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+#: The default number of threads that download citation information at the same time
+DEFAULT_WORKERS = 4
 
 re1 = re.compile(r"^[12][0-9]{3} [a-zA-Z]{3} \d{1,2}$")
 re2 = re.compile(r"^[12][0-9]{3} [a-zA-Z]{3}$")
@@ -81,22 +104,189 @@ def clean_pubmed_identifiers(identifiers: Iterable[str]) -> list[str]:
     return sorted({i for i in _identifiers if i})
 
 
-@ratelimit.limits(calls=3, period=1)
-def get_pubmed_citation_response(pubmed_identifiers: Iterable[str]):
-    """Get the response from PubMed E-Utils for a given list of PubMed identifiers.
+class TokenBucket:
+    """A thread-safe token bucket that limits the rate of requests.
+
+    The bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens per second. Each request takes a token
+    and waits for one to be refilled if the bucket is empty.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        """Initialize the token bucket.
+
+        :param rate: The number of tokens refilled per second
+        :param capacity: The maximum number of tokens, which is the largest burst of requests. Defaults to the rate.
+        :param clock: A function returning the time in seconds
+        :param sleep: A function that waits for the given number of seconds
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive: {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, possibly borrowing it from the future, and return how long to wait until it is refilled."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available.
+
+        :return: The number of seconds waited
+        """
+        delay = self._reserve()
+        if delay:
+            self.sleep(delay)
+        return delay
+
+
+def _is_retryable(exception: Exception) -> bool:
+    if isinstance(exception, requests.HTTPError):
+        return exception.response is not None and exception.response.status_code in RETRY_STATUS_CODES
+    return isinstance(exception, (requests.ConnectionError, requests.Timeout))
+
+
+class EUtilsClient:
+    """A client for NCBI's services that is safe to share between threads.
+
+    All requests made by the client share a :class:`TokenBucket` that keeps to NCBI's limit of requests per second,
+    which is higher with an API key. Requests that fail with a connection error, a timeout, or a status code in
+    :data:`RETRY_STATUS_CODES` are retried after an exponential backoff with full jitter.
+    """
 
-    Rate limit of 3 requests per second is from:
-    https://ncbiinsights.ncbi.nlm.nih.gov/2018/08/14/release-plan-for-e-utility-api-keys/
+    def __init__(
+        self,
+        api_key: str | None = None,
+        url: str | None = None,
+        rate: float | None = None,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize the client.
+
+        :param api_key: An NCBI API key. Defaults to the ``ncbi_api_key`` setting in the ``pybel`` configuration.
+        :param url: The URL of the eSummary service. Defaults to :data:`EUTILS_URL`, and can be set to a local server
+         for testing.
+        :param rate: The maximum number of requests per second. Defaults to :data:`NCBI_API_KEY_RATE_LIMIT` with an
+         API key and :data:`NCBI_RATE_LIMIT` without one.
+        :param max_retries: The number of times a failed request is retried
+        :param backoff: The base of the exponential backoff in seconds
+        :param timeout: The timeout of each request in seconds
+        """
+        self.api_key = pystow.get_config("pybel", "ncbi_api_key", passthrough=api_key)
+        self.url = url if url is not None else EUTILS_URL
+        if rate is None:
+            rate = NCBI_API_KEY_RATE_LIMIT if self.api_key else NCBI_RATE_LIMIT
+        self.limiter = TokenBucket(rate)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the HTTP session for the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def call(self, func: Callable[..., X], *args, **kwargs) -> X:
+        """Call a function that makes a request, waiting for the rate limit and retrying failures."""
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = random.uniform(0, self.backoff * 2**attempt)
+                logger.debug("retrying in %.2f seconds after attempt %d failed: %s", delay, attempt + 1, e)
+                time.sleep(delay)
+            attempt += 1
+
+    def _get(self, params: Mapping[str, str]) -> Mapping[str, Any]:
+        response = self.session.get(self.url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def get_pubmed_summaries(self, pubmed_identifiers: Iterable[str]) -> Mapping[str, Any]:
+        """Get the response from PubMed E-Utils for the given PubMed identifiers."""
+        params = {
+            "db": "pubmed",
+            "retmode": "json",
+            "id": ",".join(pubmed_identifier for pubmed_identifier in pubmed_identifiers if pubmed_identifier),
+        }
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return self.call(self._get, params)
+
+
+@lru_cache(maxsize=1)
+def _get_default_client() -> EUtilsClient:
+    """Get a client shared by all enrichments that don't specify one, so they share its rate limit."""
+    return EUtilsClient()
+
+
+def get_pubmed_citation_response(pubmed_identifiers: Iterable[str], client: EUtilsClient | None = None):
+    """Get the response from PubMed E-Utils for a given list of PubMed identifiers.
 
-    :param pubmed_identifiers:
+    :param pubmed_identifiers: PubMed identifiers
+    :param client: A client for NCBI's services. Defaults to one that is shared between calls.
     :rtype: dict
     """
-    pubmed_identifiers = list(pubmed_identifiers)
-    url = EUTILS_URL_FMT.format(
-        ",".join(pubmed_identifier for pubmed_identifier in pubmed_identifiers if pubmed_identifier),
-    )
-    response = requests.get(url)
-    return response.json()
+    if client is None:
+        client = _get_default_client()
+    return client.get_pubmed_summaries(pubmed_identifiers)
+
+
+def _get_pubmed_citation_values(pmid: str, p: Mapping[str, Any]) -> dict[str, Any]:
+    """Get the values of a citation's columns from the dictionary from PubMed E-Utils, except for its authors."""
+    rv = {
+        "title": p["title"],
+        "journal": p["fulljournalname"],
+        "volume": p["volume"],
+        "issue": p["issue"],
+        "pages": p["pages"],
+    }
+    pubtypes = p["pubtype"]
+    if pubtypes:
+        rv["article_type"] = pubtypes[0]
+
+    publication_date = p["pubdate"]
+    try:
+        sanitized_publication_date = sanitize_date(publication_date)
+    except ValueError:
+        logger.warning(
+            "could not parse publication date %s for pubmed:%s",
+            publication_date,
+            pmid,
+        )
+        sanitized_publication_date = None
+
+    if sanitized_publication_date:
+        rv["date"] = datetime.strptime(sanitized_publication_date, "%Y-%m-%d")
+    else:
+        logger.info("result had date with strange format: %s", publication_date)
+
+    return rv
 
 
 def enrich_citation_model(manager: Manager, citation: models.Citation, p: Mapping[str, Any]) -> bool:
@@ -110,16 +300,10 @@ def enrich_citation_model(manager: Manager, citation: models.Citation, p: Mappin
         logger.warning("Error downloading PubMed")
         return False
 
-    citation.title = p["title"]
-    citation.journal = p["fulljournalname"]
-    citation.volume = p["volume"]
-    citation.issue = p["issue"]
-    citation.pages = p["pages"]
+    for key, value in _get_pubmed_citation_values(citation.db_id, p).items():
+        setattr(citation, key, value)
     citation.first = manager.get_or_create_author(p["sortfirstauthor"])
     citation.last = manager.get_or_create_author(p["lastauthor"])
-    pubtypes = p["pubtype"]
-    if pubtypes:
-        citation.article_type = pubtypes[0]
 
     if "authors" in p:
         for author in p["authors"]:
@@ -127,23 +311,99 @@ def enrich_citation_model(manager: Manager, citation: models.Citation, p: Mappin
             if author_model not in citation.authors:
                 citation.authors.append(author_model)
 
-    publication_date = p["pubdate"]
-    try:
-        sanitized_publication_date = sanitize_date(publication_date)
-    except ValueError:
-        logger.warning(
-            "could not parse publication date %s for pubmed:%s",
-            publication_date,
-            citation.db_id,
+    return True
+
+
+def _get_or_create_author_ids(manager: Manager, names: Iterable[str]) -> dict[str, int]:
+    """Get the identifiers of authors by their names, inserting the ones that don't exist in one statement."""
+    names = set(names)
+    author_ids = select_ids(manager.session, models.Author.name, models.Author.id, names)
+    missing = names.difference(author_ids)
+    if missing:
+        insert_ignore(manager.session, models.Author.__table__, [{"name": name} for name in sorted(missing)])
+        author_ids.update(select_ids(manager.session, models.Author.name, models.Author.id, missing))
+    for name, author_id in author_ids.items():
+        manager.object_cache_author[name] = author_id
+    return author_ids
+
+
+def enrich_citations_bulk(manager: Manager, summaries: Mapping[str, Mapping[str, Any]]) -> set[str]:
+    """Enrich the PubMed citations in the database with the information from PubMed E-Utils in a few statements.
+
+    Gives the same rows as :func:`enrich_citation_model`, but all authors are inserted in one statement and looked up
+    in one query, and the citations' columns and authors are written in batches. Citation models that are loaded in
+    the session are expired, so they are loaded again when they are next used.
+
+    :param manager: A database manager
+    :param summaries: A dictionary of PubMed identifiers to the dictionaries from PubMed E-Utils, like d["result"]
+    :return: The PubMed identifiers whose dictionaries had errors or that don't have citations in the database
+    """
+    citation_ids = select_ids(
+        manager.session,
+        models.Citation.db_id,
+        models.Citation.id,
+        summaries,
+        models.Citation.db == CITATION_TYPE_PUBMED,
+    )
+
+    errors = set()
+    values, author_names = {}, {}
+    for pmid, p in summaries.items():
+        if pmid not in citation_ids:
+            logger.warning("problem looking up pubmed:%s", pmid)
+            errors.add(pmid)
+            continue
+        if "error" in p:
+            logger.warning("Error downloading pubmed:%s", pmid)
+            errors.add(pmid)
+            continue
+        values[pmid] = _get_pubmed_citation_values(pmid, p)
+        author_names[pmid] = (
+            p["sortfirstauthor"],
+            p["lastauthor"],
+            [author["name"] for author in p.get("authors", [])],
         )
-        sanitized_publication_date = None
 
-    if sanitized_publication_date:
-        citation.date = datetime.strptime(sanitized_publication_date, "%Y-%m-%d")
-    else:
-        logger.info("result had date with strange format: %s", publication_date)
+    author_ids = _get_or_create_author_ids(
+        manager,
+        (name for first, last, names in author_names.values() for name in (first, last, *names)),
+    )
 
-    return True
+    # rows are grouped by their columns since an executemany needs the same columns in each row
+    rows_by_columns = defaultdict(list)
+    author_citation_rows = set()
+    for pmid, row in values.items():
+        citation_id = citation_ids[pmid]
+        first, last, names = author_names[pmid]
+        row.update(citation_id=citation_id, first_id=author_ids.get(first), last_id=author_ids.get(last))
+        rows_by_columns[tuple(sorted(row))].append(row)
+        author_citation_rows.update((author_ids[name], citation_id) for name in names if name in author_ids)
+
+    table = models.Citation.__table__
+    for columns, rows in rows_by_columns.items():
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("citation_id"))
+            .values({column: bindparam(column) for column in columns if column != "citation_id"})
+        )
+        for chunk in iter_chunks(rows):
+            manager.session.execute(statement, chunk)
+
+    insert_ignore(
+        manager.session,
+        models.author_citation,
+        [
+            {"author_id": author_id, "citation_id": citation_id}
+            for author_id, citation_id in sorted(author_citation_rows)
+        ],
+    )
+
+    for pmid in values:
+        citation = manager.session.identity_map.get(identity_key(models.Citation, citation_ids[pmid]))
+        if citation is not None:
+            manager.session.expire(citation)
+
+    return errors
 
 
 def get_citations_by_pmids(
@@ -152,6 +412,8 @@ def get_citations_by_pmids(
     *,
     group_size: int | None = None,
     offline: bool = False,
+    client: EUtilsClient | None = None,
+    n_workers: int | None = None,
 ) -> tuple[dict[str, dict], set[str]]:
     return _get_citations_by_identifiers(
         manager=manager,
@@ -159,6 +421,8 @@ def get_citations_by_pmids(
         group_size=group_size,
         offline=offline,
         prefix="pubmed",
+        client=client,
+        n_workers=n_workers,
     )
 
 
@@ -169,21 +433,30 @@ def _get_citations_by_identifiers(
     group_size: int | None = None,
     offline: bool = False,
     prefix: str | None = None,
+    client: EUtilsClient | None = None,
+    n_workers: int | None = None,
 ) -> tuple[dict[str, dict], set[str]]:
     """Get citation information for the given list of PubMed identifiers using the NCBI's eUtils service.
 
+    Chunks of identifiers are downloaded in a thread pool and each chunk is committed to the database as soon as it
+    arrives, so an interrupted enrichment can be resumed by running it again, which only downloads the citations
+    that are not enriched yet.
+
     :type manager: pybel.Manager
     :param identifiers: an iterable of PubMed identifiers
     :param group_size: The number of PubMed identifiers to query at a time. Defaults to 200 identifiers.
+    :param client: A client for NCBI's services. Defaults to one that is shared between calls.
+    :param n_workers: The number of chunks to download at the same time. Defaults to :data:`DEFAULT_WORKERS`.
     :return: A dictionary of {identifier: data dictionary} or a pair of this dictionary and a set ot erroneous
              identifiers.
     """
     if prefix is None:
         prefix = "pubmed"
 
-    helper = _HELPERS.get(prefix)
-    if helper is None:
+    helpers = _HELPERS.get(prefix)
+    if helpers is None:
         raise ValueError(f"can not work on prefix: {prefix}")
+    fetch, enrich = helpers
 
     group_size = group_size if group_size is not None else 200
 
@@ -224,59 +497,89 @@ def _get_citations_by_identifiers(
     if not unenriched_models or offline:
         return enriched_models, errors
 
-    it = tqdm(unenriched_models, desc=f"getting {prefix} data in chunks of {group_size}")
-    for identifier_chunk in chunked(it, n=group_size):
-        helper(
-            identifier_chunk,
-            manager=manager,
-            enriched_models=enriched_models,
-            unenriched_models=unenriched_models,
-            errors=errors,
-        )
+    if client is None:
+        client = _get_default_client()
 
-    return enriched_models, errors
+    # the session is only used from this thread, so workers only download and the results are stored here
+    executor = ThreadPoolExecutor(max_workers=n_workers or DEFAULT_WORKERS)
+    try:
+        futures = {
+            executor.submit(fetch, identifier_chunk, client): identifier_chunk
+            for identifier_chunk in chunked(unenriched_models, n=group_size)
+        }
+        it = tqdm(as_completed(futures), total=len(futures), desc=f"getting {prefix} data in chunks of {group_size}")
+        for future in it:
+            try:
+                data, failed = future.result()
+            except Exception as e:
+                logger.warning("could not get %s data for %d identifiers: %s", prefix, len(futures[future]), e)
+                errors.update(futures[future])
+                continue
+            errors.update(failed)
+            enrich(
+                data,
+                manager=manager,
+                enriched_models=enriched_models,
+                unenriched_models=unenriched_models,
+                errors=errors,
+            )
+    finally:
+        executor.shutdown(cancel_futures=True)
 
+    return enriched_models, errors
 
-def _help_enrich_pmids(identifiers: Iterable[str], *, manager, unenriched_models, enriched_models, errors):
-    response = get_pubmed_citation_response(identifiers)
-    response_pmids = response["result"]["uids"]
 
-    for pmid in response_pmids:
-        p = response["result"][pmid]
-        citation = unenriched_models.get(pmid)
-        if citation is None:
-            tqdm.write(f"problem looking up pubmed:{pmid}")
-            continue
+def _fetch_pmids(identifiers: list[str], client: EUtilsClient) -> tuple[Mapping[str, Any], set[str]]:
+    response = get_pubmed_citation_response(identifiers, client=client)
+    result = response["result"]
+    return {pmid: result[pmid] for pmid in result["uids"]}, set()
 
-        successful_enrichment = enrich_citation_model(manager, citation, p)
 
-        if not successful_enrichment:
-            tqdm.write(f"Error downloading pubmed:{pmid}")
-            errors.add(pmid)
-            continue
+_CITATION_OPTIONS = [
+    selectinload(models.Citation.authors),
+    joinedload(models.Citation.first),
+    joinedload(models.Citation.last),
+]
 
-        enriched_models[pmid] = citation.to_json()
-        manager.session.add(citation)
 
+def _help_enrich_pmids(data: Mapping[str, Any], *, manager, unenriched_models, enriched_models, errors):
+    failed = enrich_citations_bulk(manager, data)
+    for pmid in failed:
+        tqdm.write(f"Error downloading pubmed:{pmid}")
+    errors.update(failed)
     manager.session.commit()  # commit in groups
 
+    # load the enriched citations with their authors in a few queries to make their dictionaries
+    enriched_pmids = [pmid for pmid in data if pmid not in failed and pmid in unenriched_models]
+    for chunk in iter_chunks(enriched_pmids):
+        query = manager.session.query(models.Citation).filter(
+            models.Citation.db == CITATION_TYPE_PUBMED,
+            models.Citation.db_id.in_(chunk),
+        )
+        for citation in query.options(*_CITATION_OPTIONS).populate_existing():
+            enriched_models[citation.db_id] = citation.to_json()
+
+
+def _fetch_pmc_identifiers(identifiers: list[str], client: EUtilsClient) -> tuple[Mapping[str, Any], set[str]]:
+    rv, failed = {}, set()
+    for pmcid in identifiers:
+        try:
+            rv[pmcid] = client.call(get_pmc_csl_item, pmcid)
+        except Exception:
+            tqdm.write(f"Error downloading pmc:{pmcid}")
+            failed.add(pmcid)
+    return rv, failed
+
 
 def _help_enrich_pmc_identifiers(
-    identifiers: Iterable[str],
+    data: Mapping[str, Any],
     *,
     manager: Manager,
     unenriched_models,
     enriched_models,
     errors,
 ):
-    for pmcid in identifiers:
-        try:
-            csl = get_pmc_csl_item(pmcid)
-        except Exception:
-            tqdm.write(f"Error downloading pmc:{pmcid}")
-            errors.add(pmcid)
-            continue
-
+    for pmcid, csl in data.items():
         model = unenriched_models[pmcid]
         enrich_citation_model_from_pmc(manager=manager, citation=model, csl=csl)
         manager.session.add(model)
@@ -286,8 +589,8 @@ def _help_enrich_pmc_identifiers(
 
 
 _HELPERS = {
-    "pubmed": _help_enrich_pmids,
-    "pmc": _help_enrich_pmc_identifiers,
+    "pubmed": (_fetch_pmids, _help_enrich_pmids),
+    "pmc": (_fetch_pmc_identifiers, _help_enrich_pmc_identifiers),
 }
 
 
@@ -312,6 +615,8 @@ def enrich_pubmed_citations(
     manager: Manager | None = None,
     group_size: int | None = None,
     offline: bool = False,
+    client: EUtilsClient | None = None,
+    n_workers: int | None = None,
 ) -> set[str]:
     """Overwrite all PubMed citations with values from NCBI's eUtils lookup service.
 
@@ -319,6 +624,8 @@ def enrich_pubmed_citations(
     :param manager: A PyBEL database manager
     :param group_size: The number of PubMed identifiers to query at a time. Defaults to 200 identifiers.
     :param offline: An override for when you don't want to hit the eUtils
+    :param client: A client for NCBI's services. Defaults to one that is shared between calls.
+    :param n_workers: The number of chunks to download at the same time
     :return: A set of PMIDs for which the eUtils service crashed
     """
     return _enrich_citations(
@@ -326,6 +633,8 @@ def enrich_pubmed_citations(
         graph=graph,
         group_size=group_size,
         offline=offline,
+        client=client,
+        n_workers=n_workers,
         prefix="pubmed",
     )
 
@@ -336,6 +645,8 @@ def enrich_pmc_citations(
     manager: Manager | None = None,
     group_size: int | None = None,
     offline: bool = False,
+    client: EUtilsClient | None = None,
+    n_workers: int | None = None,
 ) -> set[str]:
     """Overwrite all PubMed citations with values from NCBI's eUtils lookup service.
 
@@ -343,6 +654,8 @@ def enrich_pmc_citations(
     :param manager: A PyBEL database manager
     :param group_size: The number of PubMed identifiers to query at a time. Defaults to 200 identifiers.
     :param offline: An override for when you don't want to hit the eUtils
+    :param client: A client for NCBI's services. Defaults to one that is shared between calls.
+    :param n_workers: The number of chunks to download at the same time
     :return: A set of PMIDs for which the eUtils service crashed
     """
     return _enrich_citations(
@@ -350,6 +663,8 @@ def enrich_pmc_citations(
         graph=graph,
         group_size=group_size,
         offline=offline,
+        client=client,
+        n_workers=n_workers,
         prefix="pmc",
     )
 
@@ -360,6 +675,8 @@ def _enrich_citations(
     group_size: int | None = None,
     offline: bool = False,
     prefix: str | None = None,
+    client: EUtilsClient | None = None,
+    n_workers: int | None = None,
 ) -> set[str]:
     """Overwrite all citations of the given prefix using the predefined lookup functions.
 
@@ -379,6 +696,8 @@ def _enrich_citations(
         group_size=group_size,
         offline=offline,
         prefix=prefix,
+        client=client,
+        n_workers=n_workers,
     )
 
     for u, v, k in filter_edges(graph, CITATION_PREDICATES[prefix]):
@@ -392,6 +711,9 @@ def _enrich_citations(
 
         graph[u][v][k][CITATION].update(identifier_data)
 
+    # the authors of the citations were edited in place
+    graph.clear_indexes()
+
     return errors
 
 
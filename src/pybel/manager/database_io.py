@@ -18,10 +18,13 @@ def to_database(
     graph,
     manager: Manager | None = None,
     use_tqdm: bool = True,
+    bulk: bool = False,
 ):
     """Store a graph in a database.
 
     :param BELGraph graph: A BEL graph
+    :param bulk: Should the nodes and edges be stored with multi-row inserts? See
+     :meth:`pybel.manager.Manager.insert_graph`.
     :return: If successful, returns the network object from the database.
     :rtype: Optional[Network]
     """
@@ -29,7 +32,7 @@ def to_database(
         manager = Manager()
 
     try:
-        return manager.insert_graph(graph, use_tqdm=use_tqdm)
+        return manager.insert_graph(graph, use_tqdm=use_tqdm, bulk=bulk)
     except (IntegrityError, OperationalError):
         manager.session.rollback()
         logger.exception("Error storing graph")
@@ -672,21 +672,21 @@ class Edge(Base):
     bel = Column(Text, nullable=False, doc="Valid BEL statement that represents the given edge")
     relation = Column(String(32), nullable=False)
 
-    source_id = Column(Integer, ForeignKey(f"{NODE_TABLE_NAME}.id"), nullable=False)
+    source_id = Column(Integer, ForeignKey(f"{NODE_TABLE_NAME}.id"), nullable=False, index=True)
     source = relationship(
         Node,
         foreign_keys=[source_id],
         backref=backref("out_edges", lazy="dynamic", cascade="all, delete-orphan"),
     )
 
-    target_id = Column(Integer, ForeignKey(f"{NODE_TABLE_NAME}.id"), nullable=False)
+    target_id = Column(Integer, ForeignKey(f"{NODE_TABLE_NAME}.id"), nullable=False, index=True)
     target = relationship(
         Node,
         foreign_keys=[target_id],
         backref=backref("in_edges", lazy="dynamic", cascade="all, delete-orphan"),
     )
 
-    evidence_id = Column(Integer, ForeignKey(f"{EVIDENCE_TABLE_NAME}.id"), nullable=True)
+    evidence_id = Column(Integer, ForeignKey(f"{EVIDENCE_TABLE_NAME}.id"), nullable=True, index=True)
     evidence = relationship(Evidence, backref=backref("edges", lazy="dynamic"))
 
     annotations = relationship(
@@ -1,22 +1,75 @@
 """The query manager for the database."""
 
 import datetime
-from collections.abc import Iterable
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import aliased
+from sqlalchemy import and_, case, literal, or_, select
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Query, Session, aliased, joinedload, selectinload
 
+from . import search
+from .bulk import iter_chunks
 from .lookup_manager import LookupManager
-from .models import Author, Citation, Edge, Evidence, Namespace, NamespaceEntry, Node
-from ..constants import CITATION_TYPE_PUBMED
+from .models import (
+    Author,
+    Citation,
+    Edge,
+    Evidence,
+    Namespace,
+    NamespaceEntry,
+    Network,
+    Node,
+    edge_annotation,
+    network_edge,
+)
+from ..constants import (
+    CITATION_TYPE_PUBMED,
+    RELATION,
+    RELATION_CLASS_CAUSAL,
+    RELATION_CLASSES,
+)
+from ..dsl import BaseEntity
 from ..struct import BELGraph
+from ..tokens import parse_result_to_dsl
 from ..utils import parse_datetime
 
 __all__ = [
     "QueryManager",
+    "EDGE_LOADERS",
+    "NEIGHBORHOOD_DIRECTIONS",
     "graph_from_edges",
+    "graph_from_edge_store",
 ]
 
+logger = logging.getLogger(__name__)
+
+#: The strategies for eagerly loading the source, target, evidence, citation, and authors of edges. Edges'
+#: annotations are a dynamic relationship that can't be eagerly loaded, so use
+#: :meth:`QueryManager.get_annotations_by_edge`.
+EDGE_LOADERS = {
+    "selectin": selectinload,
+    "joined": joinedload,
+}
+
+
+#: The directions in which neighborhoods can be expanded from their nodes
+NEIGHBORHOOD_DIRECTIONS = {"both", "upstream", "downstream"}
+
+
+def _get_edge_options(eager: str | None) -> list:
+    if eager is None:
+        return []
+    loader = EDGE_LOADERS.get(eager)
+    if loader is None:
+        raise ValueError(f"invalid eager loading strategy: {eager}. Use one of {sorted(EDGE_LOADERS)}")
+    return [
+        loader(Edge.source),
+        loader(Edge.target),
+        loader(Edge.evidence).options(loader(Evidence.citation).options(loader(Citation.authors))),
+    ]
+
 
 def graph_from_edges(edges: Iterable[Edge], **kwargs) -> BELGraph:
     """Build a BEL graph from edges."""
@@ -31,6 +84,51 @@ def graph_from_edges(edges: Iterable[Edge], **kwargs) -> BELGraph:
     return graph
 
 
+def graph_from_edge_store(session: Session, *criteria, yield_per: int = 1000, **kwargs) -> BELGraph:
+    """Build a BEL graph from the edges in the database that match the given criteria.
+
+    This gives the same graph as :func:`graph_from_edges` without loading any ORM models. Only the needed columns
+    of the edges are selected and streamed in batches, the nodes of each batch are loaded with a single query, and
+    each node is only deserialized once. The stored hashes of the edges are used as their keys.
+
+    :param session: A database session
+    :param criteria: Filters on the edges, e.g., ``Edge.relation == 'increases'``
+    :param yield_per: The number of edges to load at a time
+    :param kwargs: Keyword arguments to pass to :class:`pybel.BELGraph`
+    """
+    graph = BELGraph(**kwargs)
+    graph.raise_on_missing_annotations = False
+
+    nodes: dict[int, BaseEntity] = {}
+    query = select(Edge.source_id, Edge.target_id, Edge.md5, Edge.relation, Edge.evidence_id, Edge.data)
+    result = session.execute(query.where(*criteria).order_by(Edge.id).execution_options(yield_per=yield_per))
+    for rows in result.partitions():
+        _load_nodes(session, graph, nodes, {node_id for row in rows for node_id in row[:2]})
+        graph.add_edges_from(
+            (
+                (
+                    nodes[source_id],
+                    nodes[target_id],
+                    md5,
+                    {RELATION: relation} if evidence_id is None else graph._build_attr(**data),
+                )
+                for source_id, target_id, md5, relation, evidence_id, data in rows
+            ),
+        )
+
+    graph.raise_on_missing_annotations = True
+
+    return graph
+
+
+def _load_nodes(session: Session, graph: BELGraph, nodes: dict[int, BaseEntity], node_ids: Iterable[int]) -> None:
+    """Deserialize the nodes that have not been loaded yet and add them to the graph."""
+    for chunk in iter_chunks(node_id for node_id in node_ids if node_id not in nodes):
+        for node_id, data in session.execute(select(Node.id, Node.data).where(Node.id.in_(chunk))):
+            node = nodes[node_id] = parse_result_to_dsl(data)
+            graph.add_node_from_data(node)
+
+
 class QueryManager(LookupManager):
     """An extension to the Manager to make queries over the database."""
 
@@ -75,27 +173,88 @@ class QueryManager(LookupManager):
         """Count the number of edges in the database."""
         return self._count_model(Edge)
 
-    def get_edges_with_citation(self, citation: Citation) -> list[Edge]:
+    def _query_edges(self, eager: str | None = None) -> Query:
+        """Start a query over edges that eagerly loads their relationships with the given strategy.
+
+        :param eager: A key of :data:`EDGE_LOADERS`, or none to lazily load relationships on access
+        """
+        return self.session.query(Edge).options(*_get_edge_options(eager))
+
+    def get_edges_with_citation(self, citation: Citation, eager: str | None = None) -> list[Edge]:
         """Get the edges with the given citation."""
-        return self.session.query(Edge).join(Evidence).filter(Evidence.citation == citation)
+        return self._query_edges(eager).join(Evidence).filter(Evidence.citation == citation)
 
     def get_edges_with_citations(self, citations: Iterable[Citation]) -> list[Edge]:
         """Get edges with one of the given citations."""
         return self.session.query(Edge).join(Evidence).filter(Evidence.citation.in_(citations)).all()
 
-    def search_edges_with_evidence(self, evidence: str) -> list[Edge]:
+    def search_edges_with_evidence(self, evidence: str, eager: str | None = None) -> list[Edge]:
         """Search edges with the given evidence.
 
         :param evidence: A string to search evidences. Can use wildcard percent symbol (%).
+        :param eager: A key of :data:`EDGE_LOADERS` to eagerly load the edges' relationships
         """
-        return self.session.query(Edge).join(Evidence).filter(Evidence.text.like(evidence)).all()
+        return self._query_edges(eager).join(Evidence).filter(Evidence.text.like(evidence)).all()
 
-    def search_edges_with_bel(self, bel: str) -> list[Edge]:
+    def search_edges_with_bel(self, bel: str, eager: str | None = None) -> list[Edge]:
         """Search edges with given BEL.
 
         :param bel: A BEL string to use as a search
+        :param eager: A key of :data:`EDGE_LOADERS` to eagerly load the edges' relationships
         """
-        return self.session.query(Edge).filter(Edge.bel.like(bel))
+        return self._query_edges(eager).filter(Edge.bel.like(bel))
+
+    def search_edges(
+        self,
+        query: str,
+        field: str = "evidence",
+        limit: int | None = 25,
+        eager: str | None = None,
+    ) -> list[tuple[Edge, float]]:
+        """Search edges with full-text search, ranked by relevance.
+
+        Finds the edges whose evidence or BEL statement has all the terms of the query. If the database has no
+        full-text search index (see :meth:`create_search_index`), falls back to a case-insensitive substring match of
+        each term and gives all edges a score of zero.
+
+        :param query: The terms to search for
+        :param field: A key of :data:`pybel.manager.SEARCH_FIELDS`, either ``evidence`` or ``bel``
+        :param limit: The maximum number of edges to return, or none to return all of them
+        :param eager: A key of :data:`EDGE_LOADERS` to eagerly load the edges' relationships
+        :return: Pairs of edges and their scores, from the most to the least relevant
+        :raises ValueError: If the field is not searchable
+        """
+        if field not in search.SEARCH_FIELDS:
+            raise ValueError(f"invalid search field: {field}. Use one of {sorted(search.SEARCH_FIELDS)}")
+        if not query.split():
+            return []
+
+        connection = self.session.connection()
+        if search.has_search_index(connection, field):
+            scores = search.select_search_scores(connection, field, query).subquery()
+            on = (Edge.evidence_id if field == "evidence" else Edge.id) == scores.c.id
+            q = self._query_edges(eager).join(scores, on).add_columns(scores.c.score)
+            q = q.order_by(scores.c.score.desc(), Edge.id)
+        else:
+            logger.debug("no full-text search index for %s. Falling back to substring search", field)
+            q = self._query_edges(eager).add_columns(literal(0.0))
+            if field == "evidence":
+                q = q.join(Evidence)
+            column = Evidence.text if field == "evidence" else Edge.bel
+            q = q.filter(*(column.icontains(term, autoescape=True) for term in query.split())).order_by(Edge.id)
+
+        if limit is not None:
+            q = q.limit(limit)
+        return [(edge, score) for edge, score in q]
+
+    def create_search_index(self, rebuild: bool = True) -> None:
+        """Create the full-text search indexes for :meth:`search_edges` in a database that was made without them.
+
+        :param rebuild: Should the SQLite indexes be rebuilt from the evidences and edges that are already stored?
+        :raises ValueError: If the database does not support full-text search
+        """
+        search.create_search_index(self.session.connection(), rebuild=rebuild)
+        self.session.commit()
 
     def get_edges_with_annotation(self, annotation: str, value: str) -> list[Edge]:
         """Search edges with the given annotation/value pair."""
@@ -116,6 +275,7 @@ class QueryManager(LookupManager):
         target_function: str | None = None,
         target: None | str | Node = None,
         relation: str | None = None,
+        eager: str | None = None,
     ):
         """Return a query over the edges in the database.
 
@@ -127,11 +287,12 @@ class QueryManager(LookupManager):
         :param target_function: Filter target nodes with the given BEL function
         :param target: BEL term of target node e.g. ``p(HGNC:APP)`` or :class:`Node` object.
         :param relation: The relation that should be present between source and target node.
+        :param eager: A key of :data:`EDGE_LOADERS` to eagerly load the edges' relationships
         """
         if bel:
-            return self.search_edges_with_bel(bel)
+            return self.search_edges_with_bel(bel, eager=eager)
 
-        query = self.session.query(Edge)
+        query = self._query_edges(eager)
 
         if relation:
             query = query.filter(Edge.relation.like(relation))
@@ -227,6 +388,31 @@ class QueryManager(LookupManager):
         fi = and_(Citation.db == CITATION_TYPE_PUBMED, Citation.db_id.in_(pubmed_identifiers))
         return self.session.query(Edge).join(Evidence).join(Citation).filter(fi).all()
 
+    def get_graph_by_pubmed_identifiers(self, pubmed_identifiers: list[str], **kwargs) -> BELGraph:
+        """Get a graph of the edges from :meth:`query_edges_by_pubmed_identifiers`.
+
+        The graph is built with :func:`graph_from_edge_store`, to which the keyword arguments are passed.
+        """
+        evidence_ids = (
+            select(Evidence.id)
+            .join(Citation)
+            .where(Citation.db == CITATION_TYPE_PUBMED, Citation.db_id.in_(pubmed_identifiers))
+        )
+        return graph_from_edge_store(self.session, Edge.evidence_id.in_(evidence_ids), **kwargs)
+
+    def get_graph_from_edge_store(self, network_id: int, **kwargs) -> BELGraph:
+        """Get a graph of the edges stored for the given network with :func:`graph_from_edge_store`.
+
+        Unlike :meth:`pybel.manager.Manager.get_graph_by_id`, this doesn't unpickle the network's stored graph. It
+        doesn't contain the nodes without edges and the edges that could not be stored, like the ones whose nodes are
+        missing from their namespaces.
+        """
+        network = self.session.execute(select(Network.name, Network.version).where(Network.id == network_id)).one()
+        kwargs.setdefault("name", network.name)
+        kwargs.setdefault("version", network.version)
+        edge_ids = select(network_edge.c.edge_id).where(network_edge.c.network_id == network_id)
+        return graph_from_edge_store(self.session, Edge.id.in_(edge_ids), **kwargs)
+
     @staticmethod
     def _edge_both_nodes(nodes: list[Node]):
         """Get edges where both the source and target are in the list of nodes."""
@@ -237,12 +423,19 @@ class QueryManager(LookupManager):
             Edge.target_id.in_(node_ids),
         )
 
-    def query_induction(self, nodes: list[Node]) -> list[Edge]:
+    def query_induction(self, nodes: list[Node], eager: str | None = None) -> list[Edge]:
         """Get all edges between any of the given nodes (minimum length of 2)."""
         if len(nodes) < 2:
             raise ValueError("not enough nodes given to induce over")
 
-        return self.session.query(Edge).filter(self._edge_both_nodes(nodes)).all()
+        return self._query_edges(eager).filter(self._edge_both_nodes(nodes)).all()
+
+    def get_induction_graph(self, nodes: list[Node], **kwargs) -> BELGraph:
+        """Get a graph of the edges from :meth:`query_induction` with :func:`graph_from_edge_store`."""
+        if len(nodes) < 2:
+            raise ValueError("not enough nodes given to induce over")
+
+        return graph_from_edge_store(self.session, self._edge_both_nodes(nodes), **kwargs)
 
     @staticmethod
     def _edge_one_node(nodes: list[Node]):
@@ -264,6 +457,181 @@ class QueryManager(LookupManager):
             Edge.target_id.in_(node_ids),
         )
 
-    def query_neighbors(self, nodes: list[Node]) -> list[Edge]:
+    def query_neighbors(self, nodes: list[Node], eager: str | None = None) -> list[Edge]:
         """Get all edges incident to any of the given nodes."""
-        return self.session.query(Edge).filter(self._edge_one_node(nodes)).all()
+        return self._query_edges(eager).filter(self._edge_one_node(nodes)).all()
+
+    def get_neighbors_graph(self, nodes: list[Node], **kwargs) -> BELGraph:
+        """Get a graph of the edges from :meth:`query_neighbors` with :func:`graph_from_edge_store`."""
+        return graph_from_edge_store(self.session, self._edge_one_node(nodes), **kwargs)
+
+    @staticmethod
+    def _select_neighborhood_edge_ids(
+        nodes: Iterable[Node | int],
+        hops: int,
+        direction: str,
+        relation_class: str | None,
+        relations: Iterable[str] | None,
+    ):
+        """Build a query for the identifiers of the edges in the neighborhood with a recursive common table expression.
+
+        The expression starts from the given nodes and follows edges for up to ``hops - 1`` steps, keeping the depth
+        at which each node is reached. The neighborhood is all edges leaving (downstream), entering (upstream), or
+        touching (both) the reached nodes.
+        """
+        if hops < 0:
+            raise ValueError(f"number of hops must be non-negative: {hops}")
+        if direction not in NEIGHBORHOOD_DIRECTIONS:
+            raise ValueError(f"invalid direction: {direction}. Use one of {sorted(NEIGHBORHOOD_DIRECTIONS)}")
+
+        criteria = []
+        if relation_class is not None:
+            if relation_class not in RELATION_CLASSES:
+                raise ValueError(f"invalid relation class: {relation_class}. Use one of {sorted(RELATION_CLASSES)}")
+            criteria.append(Edge.relation.in_(sorted(RELATION_CLASSES[relation_class])))
+        if relations is not None:
+            criteria.append(Edge.relation.in_(sorted(relations)))
+
+        def _step(node_id):
+            """Get the join condition from a reached node to its edges, and the node at the other end."""
+            if direction == "downstream":
+                return Edge.source_id == node_id, Edge.target_id
+            if direction == "upstream":
+                return Edge.target_id == node_id, Edge.source_id
+            # a single join so the recursive term only refers to the expression once, as PostgreSQL requires
+            return (
+                or_(Edge.source_id == node_id, Edge.target_id == node_id),
+                case((Edge.source_id == node_id, Edge.target_id), else_=Edge.source_id),
+            )
+
+        node_ids = [node.id if isinstance(node, Node) else node for node in nodes]
+        reached = (
+            select(Node.id.label("node_id"), literal(0).label("depth"))
+            .where(Node.id.in_(node_ids))
+            .cte("reached", recursive=True)
+        )
+        previous = reached.alias("previous")
+        on, other_id = _step(previous.c.node_id)
+        reached = reached.union(
+            select(other_id, previous.c.depth + 1).join(previous, on).where(previous.c.depth < hops - 1, *criteria)
+        )
+        on, _ = _step(reached.c.node_id)
+        return select(Edge.id).join(reached, on).where(reached.c.depth < hops, *criteria).distinct()
+
+    def get_neighborhood_edge_ids(
+        self,
+        nodes: Iterable[Node | int],
+        hops: int = 1,
+        direction: str = "both",
+        relation_class: str | None = None,
+        relations: Iterable[str] | None = None,
+    ) -> list[int]:
+        """Get the identifiers of the edges within the given number of hops of the nodes, inside the database.
+
+        With one hop in both directions, these are the same edges as from :meth:`query_neighbors`.
+
+        :param nodes: Nodes or their identifiers
+        :param hops: The maximum number of edges between the given nodes and an edge's farther node
+        :param direction: Follow edges from sources to targets (``downstream``), from targets to sources
+         (``upstream``), or either way (``both``)
+        :param relation_class: Only follow edges whose relations are in this class from
+         :data:`pybel.constants.RELATION_CLASSES`
+        :param relations: Only follow edges with these relations
+        """
+        query = self._select_neighborhood_edge_ids(nodes, hops, direction, relation_class, relations)
+        return sorted(self.session.execute(query).scalars())
+
+    def get_neighborhood_graph(
+        self,
+        nodes: Iterable[Node | int],
+        hops: int = 1,
+        direction: str = "both",
+        relation_class: str | None = None,
+        relations: Iterable[str] | None = None,
+        **kwargs,
+    ) -> BELGraph:
+        """Get a graph of the edges from :meth:`get_neighborhood_edge_ids` with :func:`graph_from_edge_store`."""
+        query = self._select_neighborhood_edge_ids(nodes, hops, direction, relation_class, relations)
+        return graph_from_edge_store(self.session, Edge.id.in_(query), **kwargs)
+
+    def get_upstream_causal_graph(self, nodes: Iterable[Node | int], hops: int = 1, **kwargs) -> BELGraph:
+        """Get a graph of the causal edges that lead to the nodes in up to the given number of hops."""
+        return self.get_neighborhood_graph(nodes, hops, "upstream", relation_class=RELATION_CLASS_CAUSAL, **kwargs)
+
+    def get_downstream_causal_graph(self, nodes: Iterable[Node | int], hops: int = 1, **kwargs) -> BELGraph:
+        """Get a graph of the causal edges that lead from the nodes in up to the given number of hops."""
+        return self.get_neighborhood_graph(nodes, hops, "downstream", relation_class=RELATION_CLASS_CAUSAL, **kwargs)
+
+    def iter_edges(
+        self, query: Query | None = None, page_size: int = 1000, eager: str | None = "selectin"
+    ) -> Iterator[Edge]:
+        """Iterate over the edges of a query one page at a time, in the order of their identifiers.
+
+        Pages are fetched with keyset pagination (``WHERE edge.id > ? LIMIT ?``), so each page costs the same no
+        matter how far in the iteration it is, and each page's relationships are eagerly loaded together.
+
+        :param query: A query over edges, like from :meth:`query_edges`. Defaults to all edges.
+        :param page_size: The number of edges in each page
+        :param eager: A key of :data:`EDGE_LOADERS`, or none to lazily load relationships on access
+        """
+        if query is None:
+            query = self.session.query(Edge)
+        query = query.options(*_get_edge_options(eager)).order_by(None).order_by(Edge.id)
+
+        last_id = None
+        while True:
+            page_query = query if last_id is None else query.filter(Edge.id > last_id)
+            page = page_query.limit(page_size).all()
+            yield from page
+            if len(page) < page_size:
+                return
+            last_id = page[-1].id
+
+    def query_edge_rows(self, *criteria, yield_per: int = 1000) -> Result:
+        """Query lightweight rows describing the edges that match the criteria, without loading ORM models.
+
+        Each row has the ``id``, ``md5``, ``bel``, and ``relation`` of the edge, the ``source_bel`` and
+        ``target_bel`` of its nodes, and its ``evidence``, ``citation_db``, and ``citation_db_id``, which are none for
+        unqualified edges. Rows are streamed from the database in batches.
+
+        :param criteria: Filters on the edges, e.g., ``Edge.relation == 'increases'``
+        :param yield_per: The number of rows to fetch at a time
+        """
+        source, target = aliased(Node), aliased(Node)
+        query = (
+            select(
+                Edge.id,
+                Edge.md5,
+                Edge.bel,
+                Edge.relation,
+                source.bel.label("source_bel"),
+                target.bel.label("target_bel"),
+                Evidence.text.label("evidence"),
+                Citation.db.label("citation_db"),
+                Citation.db_id.label("citation_db_id"),
+            )
+            .join(source, Edge.source_id == source.id)
+            .join(target, Edge.target_id == target.id)
+            .outerjoin(Evidence, Edge.evidence_id == Evidence.id)
+            .outerjoin(Citation, Evidence.citation_id == Citation.id)
+            .where(*criteria)
+            .order_by(Edge.id)
+        )
+        return self.session.execute(query.execution_options(yield_per=yield_per))
+
+    def get_annotations_by_edge(self, edges: Iterable[Edge]) -> Mapping[int, list[NamespaceEntry]]:
+        """Get the annotation entries of many edges, with their namespaces, in one query per 500 edges.
+
+        :return: A dictionary from the identifiers of the edges that have annotations to their annotation entries
+        """
+        rv = defaultdict(list)
+        for chunk in iter_chunks(edge.id for edge in edges):
+            query = (
+                self.session.query(edge_annotation.c.edge_id, NamespaceEntry)
+                .join(NamespaceEntry, edge_annotation.c.name_id == NamespaceEntry.id)
+                .options(joinedload(NamespaceEntry.namespace))
+                .filter(edge_annotation.c.edge_id.in_(chunk))
+            )
+            for edge_id, entry in query:
+                rv[edge_id].append(entry)
+        return dict(rv)
@@ -0,0 +1,197 @@
+"""Full-text search over the evidences and BEL statements in the edge store.
+
+Searching with ``LIKE '%...%'`` scans every row of the evidence or edge table. This module builds full-text indexes
+instead: an external content FTS5 table on SQLite that is kept in sync with triggers, and a GIN index over
+``to_tsvector(...)`` on PostgreSQL, which the database keeps in sync by itself. The indexes are made along with the
+tables by :meth:`pybel.manager.Manager.create_all`, and can be added to a database that was made before with
+:func:`create_search_index` or ``pybel manage search-index``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import NamedTuple
+
+from sqlalchemy import column, event, func, literal_column, select, table, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+
+from .models import Edge, Evidence
+
+__all__ = [
+    "SEARCH_FIELDS",
+    "supports_search_index",
+    "has_search_index",
+    "create_search_index",
+    "select_search_scores",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class SearchField(NamedTuple):
+    """A column that is indexed for full-text search."""
+
+    #: The table that has the column
+    table: str
+    #: The column with the text
+    column: str
+    #: The FTS5 tokenizer used on SQLite
+    tokenize: str
+    #: The text search configuration used on PostgreSQL
+    config: str
+
+    @property
+    def fts_table(self) -> str:
+        """The name of the FTS5 table on SQLite."""
+        return f"{self.table}_fts"
+
+    @property
+    def gin_index(self) -> str:
+        """The name of the GIN index on PostgreSQL."""
+        return f"ix_{self.table}_{self.column}_fts"
+
+
+#: The fields that can be searched. Evidences are stemmed like English text, but BEL statements are only split into
+#: words so searching for an identifier only matches the identifier.
+SEARCH_FIELDS = {
+    "evidence": SearchField(Evidence.__tablename__, "text", "porter unicode61", "english"),
+    "bel": SearchField(Edge.__tablename__, "bel", "unicode61", "simple"),
+}
+
+
+def _has_fts5(connection: Connection) -> bool:
+    options = connection.exec_driver_sql("PRAGMA compile_options").scalars()
+    return any(option == "ENABLE_FTS5" for option in options)
+
+
+def supports_search_index(connection: Connection) -> bool:
+    """Check if the database can have full-text search indexes."""
+    if connection.dialect.name == "postgresql":
+        return True
+    if connection.dialect.name == "sqlite":
+        return _has_fts5(connection)
+    return False
+
+
+def _get_sqlite_ddl(field: SearchField) -> list[str]:
+    fts, table_name, column_name = field.fts_table, field.table, field.column
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_name}, content='{table_name}', content_rowid='id', tokenize='{field.tokenize}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {column_name}) VALUES (new.id, new.{column_name}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_name}) VALUES ('delete', old.id, old.{column_name}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_name} ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {column_name}) VALUES ('delete', old.id, old.{column_name}); "
+        f"INSERT INTO {fts}(rowid, {column_name}) VALUES (new.id, new.{column_name}); END",
+    ]
+
+
+def _regconfig(field: SearchField):
+    return literal_column(f"'{field.config}'::regconfig")
+
+
+def _create_field_index(connection: Connection, field: SearchField, rebuild: bool = False) -> None:
+    if connection.dialect.name == "sqlite":
+        for statement in _get_sqlite_ddl(field):
+            connection.exec_driver_sql(statement)
+        if rebuild:
+            connection.exec_driver_sql(f"INSERT INTO {field.fts_table}({field.fts_table}) VALUES ('rebuild')")
+    elif connection.dialect.name == "postgresql":
+        connection.exec_driver_sql(
+            f"CREATE INDEX IF NOT EXISTS {field.gin_index} ON {field.table} "
+            f"USING gin (to_tsvector('{field.config}'::regconfig, {field.column}))",
+        )
+    else:
+        raise ValueError(f"full-text search is not supported on {connection.dialect.name}")
+
+
+def has_search_index(connection: Connection, field: str) -> bool:
+    """Check if the database has a full-text search index for the given field.
+
+    :param connection: A connection to the database
+    :param field: A key of :data:`SEARCH_FIELDS`
+    """
+    search_field = SEARCH_FIELDS[field]
+    if connection.dialect.name == "sqlite":
+        statement = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+        name = search_field.fts_table
+    elif connection.dialect.name == "postgresql":
+        statement = text("SELECT 1 FROM pg_indexes WHERE indexname = :name")
+        name = search_field.gin_index
+    else:
+        return False
+    return connection.execute(statement, {"name": name}).first() is not None
+
+
+def create_search_index(connection: Connection, rebuild: bool = True) -> None:
+    """Create the full-text search indexes in a database that does not have them yet.
+
+    :param connection: A connection to the database
+    :param rebuild: Should the SQLite indexes be rebuilt from the rows that are already in the tables? Indexes on
+     PostgreSQL are always built from the existing rows.
+    :raises ValueError: If the database does not support full-text search
+    """
+    if not supports_search_index(connection):
+        raise ValueError(f"full-text search is not supported on this {connection.dialect.name} database")
+    # evidences that match are joined to their edges, which needs the index that new databases have on this column
+    for index in Edge.__table__.indexes:
+        if index.columns.keys() == ["evidence_id"]:
+            index.create(connection, checkfirst=True)
+    for field in SEARCH_FIELDS.values():
+        logger.info("creating full-text search index on %s.%s", field.table, field.column)
+        _create_field_index(connection, field, rebuild=rebuild)
+
+
+def _format_fts5_query(query: str) -> str:
+    """Quote each term of the query so that punctuation in BEL, like ``p(HGNC:AKT1)``, is not read as FTS5 syntax."""
+    return " ".join('"{}"'.format(term.replace('"', '""')) for term in query.split())
+
+
+def select_search_scores(connection: Connection, field: str, query: str) -> Select:
+    """Select the identifiers and relevance scores of the rows matching all terms of the query.
+
+    The identifiers are of evidences for the ``evidence`` field and of edges for the ``bel`` field. Higher scores are
+    more relevant, and are comparable only within the same search.
+
+    :param connection: A connection to a database that has the search index for the field
+    :param field: A key of :data:`SEARCH_FIELDS`
+    :param query: The terms to search for
+    """
+    search_field = SEARCH_FIELDS[field]
+    if connection.dialect.name == "sqlite":
+        fts = table(search_field.fts_table, column("rowid"))
+        fts_name = literal_column(search_field.fts_table)
+        return select(fts.c.rowid.label("id"), (-func.bm25(fts_name)).label("score")).where(
+            fts_name.op("MATCH")(_format_fts5_query(query)),
+        )
+
+    rows = table(search_field.table, column("id"), column(search_field.column))
+    vector = func.to_tsvector(_regconfig(search_field), rows.c[search_field.column])
+    tsquery = func.plainto_tsquery(_regconfig(search_field), query)
+    return select(rows.c.id, func.ts_rank(vector, tsquery).label("score")).where(vector.op("@@")(tsquery))
+
+
+def _after_create(field: SearchField):
+    def _listener(_target, connection: Connection, **_kwargs) -> None:
+        if supports_search_index(connection):
+            _create_field_index(connection, field)
+        else:
+            logger.debug("not creating full-text search index on %s.%s", field.table, field.column)
+
+    return _listener
+
+
+def _before_drop(field: SearchField):
+    def _listener(_target, connection: Connection, **_kwargs) -> None:
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {field.fts_table}")
+
+    return _listener
+
+
+for _field, _model in ((SEARCH_FIELDS["evidence"], Evidence), (SEARCH_FIELDS["bel"], Edge)):
+    event.listen(_model.__table__, "after_create", _after_create(_field))
+    event.listen(_model.__table__, "before_drop", _before_drop(_field))
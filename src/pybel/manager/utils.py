@@ -1,6 +1,8 @@
 """Utilities for the PyBEL database manager."""
 
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from typing import Any, NamedTuple
 
 from ..utils import parse_datetime
 
@@ -66,3 +68,80 @@ def int_or_str(v: str | None) -> None | int | str:
         return int(v)
     except ValueError:
         return v
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about a :class:`LRUCache`, like the ones from :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """A mapping that holds at most a given number of items and evicts the least recently used ones first.
+
+    Looking up keys with :meth:`get` counts hits and misses, which are kept when the cache is cleared.
+    """
+
+    def __init__(self, max_size: int, on_evict: Callable[[Hashable, Any], None] | None = None) -> None:
+        """Initialize the cache.
+
+        :param max_size: The maximum number of items. If zero, nothing is stored.
+        :param on_evict: A function called with the key and value of each item evicted to make room for another
+        """
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"LRUCache(max_size={self.max_size}, size={len(self._data)})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while self.max_size < len(self._data):
+            evicted_key, evicted_value = self._data.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get the value for the key and mark it as the most recently used, or get the default if it is missing."""
+        try:
+            rv = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return rv
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove the key and get its value, or get the default if it is missing."""
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._data.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups with :meth:`get` that found their key."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def cache_info(self) -> CacheInfo:
+        """Get the statistics of the cache."""
+        return CacheInfo(self.hits, self.misses, self.max_size, len(self._data))
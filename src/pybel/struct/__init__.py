@@ -16,7 +16,16 @@ code. Because the data structure is the same in Neo4J, the data can be directly
 Neo4J supports the Cypher querying language so that the same queries can be written in an elegant and simple way.
 """
 
-from . import filters, graph, grouping, mutation, node_utils, operations, summary
+from . import (
+    filters,
+    graph,
+    grouping,
+    indexes,
+    mutation,
+    node_utils,
+    operations,
+    summary,
+)
 from .filters import *
 from .graph import *
 from .grouping import *
@@ -8,6 +8,7 @@ from . import (
     edge_filters,
     edge_predicate_builders,
     edge_predicates,
+    expressions,
     node_filters,
     node_predicate_builders,
     node_predicates,
@@ -11,6 +11,7 @@ A general use for an edge predicate is to use the built-in :func:`filter` in cod
 
 from collections.abc import Iterable
 
+from .expressions import And, Expression, as_edge_expression, get_edge_data_predicate
 from .typing import EdgeIterator, EdgePredicate, EdgePredicates
 from ..graph import BELGraph
 from ...dsl import BaseEntity
@@ -44,6 +45,10 @@ def and_edge_predicates(edge_predicates: EdgePredicates) -> EdgePredicate:
     if 1 == len(edge_predicates):
         return edge_predicates[0]
 
+    # Compile expressions together with the other predicates so the edge data is only looked up once
+    if any(isinstance(edge_predicate, Expression) for edge_predicate in edge_predicates):
+        return And(*map(as_edge_expression, edge_predicates))
+
     def concatenated_edge_predicate(graph: BELGraph, u: BaseEntity, v: BaseEntity, k: str) -> bool:
         """Pass only for an edge that pass all enclosed predicates.
 
@@ -60,6 +65,13 @@ def filter_edges(graph: BELGraph, edge_predicates: EdgePredicates) -> EdgeIterat
     :return: An iterable of edges that pass all predicates
     """
     compound_edge_predicate = and_edge_predicates(edge_predicates=edge_predicates)
+    if isinstance(compound_edge_predicate, Expression):
+        compiled = get_edge_data_predicate(compound_edge_predicate)
+        for u, v, k, d in graph.edges(keys=True, data=True):
+            if compiled(graph, u, v, k, d):
+                yield u, v, k
+        return
+
     for u, v, k in graph.edges(keys=True):
         if compound_edge_predicate(graph, u, v, k):
             yield u, v, k
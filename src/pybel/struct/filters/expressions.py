@@ -0,0 +1,378 @@
+"""Declarative node and edge predicates that are compiled into a single function.
+
+Predicates built by composing closures, like with :func:`pybel.struct.filters.and_edge_predicates`, look up the data
+of each edge once per predicate and pay for a Python function call for each. An expression describes the same tests as
+a small tree that gets compiled into the source of one function, so an edge's data dictionary is looked up at most once
+and all tests are inlined.
+
+Expressions can be combined with ``&``, ``|``, and ``~`` and are callable like the predicates they replace, so they can
+be passed to anything that takes a node or edge predicate. Existing predicates can be mixed into an expression by
+wrapping them with :class:`NodePredicateExpression` or :class:`EdgePredicateExpression`.
+
+>>> from pybel.constants import DECREASES, INCREASES
+>>> from pybel.struct.filters.expressions import AnnotationHas, FunctionIs, RelationIn, Source
+>>> predicate = RelationIn(INCREASES, DECREASES) & AnnotationHas("Species", "9606") & ~Source(FunctionIs("Complex"))
+"""
+
+from __future__ import annotations
+
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from functools import cached_property
+from typing import Any
+
+from ..graph import BELGraph
+from ...constants import ANNOTATIONS, CITATION, IDENTIFIER, NAME, NAMESPACE, RELATION
+from ...dsl import BaseConcept, BaseEntity
+from ...typing import EdgeData
+
+__all__ = [
+    "Expression",
+    "NodeExpression",
+    "EdgeExpression",
+    "And",
+    "Or",
+    "Not",
+    "FunctionIs",
+    "NamespaceIs",
+    "NodePredicateExpression",
+    "RelationIn",
+    "AnnotationHas",
+    "CitationIn",
+    "Source",
+    "Target",
+    "EdgePredicateExpression",
+    "as_edge_expression",
+    "as_node_expression",
+    "get_edge_data_predicate",
+]
+
+#: A compiled edge expression, which also takes the edge's data dictionary
+EdgeDataPredicate = Callable[[BELGraph, BaseEntity, BaseEntity, str, EdgeData], bool]
+
+
+class _Compiler:
+    """Collects the constants and temporary variables used by the source of a compiled expression."""
+
+    def __init__(self) -> None:
+        self.constants: dict[str, Any] = {}
+        self._counter = itertools.count()
+
+    def constant(self, value: Any) -> str:
+        """Get the name under which the value is available to the compiled function."""
+        name = f"_c{next(self._counter)}"
+        self.constants[name] = value
+        return name
+
+    def variable(self) -> str:
+        """Get the name of a new temporary variable."""
+        return f"_t{next(self._counter)}"
+
+
+class Expression(ABC):
+    """An expression that is compiled into a predicate."""
+
+    def __and__(self, other: Expression) -> Expression:
+        return And(self, other)
+
+    def __or__(self, other: Expression) -> Expression:
+        return Or(self, other)
+
+    def __invert__(self) -> Expression:
+        return Not(self)
+
+    @property
+    @abstractmethod
+    def is_edge(self) -> bool:
+        """Is this an expression over edges, as opposed to over nodes?"""
+
+    @abstractmethod
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        """Write this expression as Python source.
+
+        :param compiler: The compiler to which constants are given
+        :param node: The name of the variable with the node, for expressions over nodes
+        """
+
+    @cached_property
+    def source(self) -> str:
+        """The source of the compiled function."""
+        compiler = _Compiler()
+        body = self._emit(compiler, "node")
+        self._constants = compiler.constants
+        arguments = "graph, u, v, k, d" if self.is_edge else "graph, node"
+        return f"def compiled_predicate({arguments}):\n    return {body}\n"
+
+    @cached_property
+    def compiled(self) -> Callable[..., bool]:
+        """The compiled function.
+
+        Expressions over nodes compile to a node predicate. Expressions over edges compile to a function that takes
+        the graph, source, target, key, and data dictionary of an edge.
+        """
+        source = self.source
+        namespace = dict(self._constants)
+        exec(compile(source, f"<{type(self).__name__}>", "exec"), namespace)  # noqa: S102
+        return namespace["compiled_predicate"]
+
+    def __call__(self, graph: BELGraph, *args) -> bool:
+        if self.is_edge:
+            u, v, k = args
+            return self.compiled(graph, u, v, k, graph[u][v][k])
+        return self.compiled(graph, *args)
+
+    def __getstate__(self):
+        # compiled functions can not be pickled, so they are compiled again after unpickling
+        state = self.__dict__.copy()
+        for key in ("source", "compiled", "_constants"):
+            state.pop(key, None)
+        return state
+
+
+class NodeExpression(Expression):
+    """An expression over nodes."""
+
+    @property
+    def is_edge(self) -> bool:
+        """Is this an expression over edges, as opposed to over nodes?"""
+        return False
+
+
+class EdgeExpression(Expression):
+    """An expression over edges."""
+
+    @property
+    def is_edge(self) -> bool:
+        """Is this an expression over edges, as opposed to over nodes?"""
+        return True
+
+
+class _Operator(Expression):
+    """An expression over the results of other expressions, which have to be all over nodes or all over edges."""
+
+    def __init__(self, *operands: Expression) -> None:
+        if not operands:
+            raise ValueError(f"{type(self).__name__} needs at least one operand")
+        if len({operand.is_edge for operand in operands}) != 1:
+            raise TypeError(f"can not combine expressions over nodes and over edges: {operands}")
+        self.operands = operands
+
+    @property
+    def is_edge(self) -> bool:
+        """Is this an expression over edges, as opposed to over nodes?"""
+        return self.operands[0].is_edge
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.operands))})"
+
+
+class And(_Operator):
+    """An expression that passes if all of its operands pass."""
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return "(" + " and ".join(operand._emit(compiler, node) for operand in self.operands) + ")"
+
+    def __and__(self, other: Expression) -> Expression:
+        return And(*self.operands, other)
+
+
+class Or(_Operator):
+    """An expression that passes if any of its operands pass."""
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return "(" + " or ".join(operand._emit(compiler, node) for operand in self.operands) + ")"
+
+    def __or__(self, other: Expression) -> Expression:
+        return Or(*self.operands, other)
+
+
+class Not(_Operator):
+    """An expression that passes if its operand does not."""
+
+    def __init__(self, operand: Expression) -> None:
+        super().__init__(operand)
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return f"(not {self.operands[0]._emit(compiler, node)})"
+
+
+def _to_frozenset(values: Iterable[str]) -> frozenset[str]:
+    if not values:
+        raise ValueError("no values given")
+    return frozenset(values)
+
+
+class FunctionIs(NodeExpression):
+    """An expression that passes for nodes with one of the given functions."""
+
+    def __init__(self, *functions: str) -> None:
+        self.functions = _to_frozenset(functions)
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return f"({node}.function in {compiler.constant(self.functions)})"
+
+    def __repr__(self) -> str:
+        return f"FunctionIs({', '.join(map(repr, sorted(self.functions)))})"
+
+
+class NamespaceIs(NodeExpression):
+    """An expression that passes for nodes with one of the given namespaces."""
+
+    def __init__(self, *namespaces: str) -> None:
+        self.namespaces = _to_frozenset(namespaces)
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        concept_cls = compiler.constant(BaseConcept)
+        return f"(isinstance({node}, {concept_cls}) and {node}.namespace in {compiler.constant(self.namespaces)})"
+
+    def __repr__(self) -> str:
+        return f"NamespaceIs({', '.join(map(repr, sorted(self.namespaces)))})"
+
+
+class NodePredicateExpression(NodeExpression):
+    """An expression that wraps a node predicate."""
+
+    def __init__(self, predicate: Callable[[BELGraph, BaseEntity], bool]) -> None:
+        self.predicate = predicate
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return f"{compiler.constant(self.predicate)}(graph, {node})"
+
+    def __repr__(self) -> str:
+        return f"NodePredicateExpression({getattr(self.predicate, '__name__', self.predicate)})"
+
+
+class RelationIn(EdgeExpression):
+    """An expression that passes for edges with one of the given relations."""
+
+    def __init__(self, *relations: str) -> None:
+        self.relations = _to_frozenset(relations)
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return f"(d[{RELATION!r}] in {compiler.constant(self.relations)})"
+
+    def __repr__(self) -> str:
+        return f"RelationIn({', '.join(map(repr, sorted(self.relations)))})"
+
+
+class AnnotationHas(EdgeExpression):
+    """An expression that passes for edges with the given annotation.
+
+    If values are given, the annotation has to have one of them, matching either their identifiers or names.
+    """
+
+    def __init__(self, annotation: str, *values: str) -> None:
+        self.annotation = annotation
+        self.values = frozenset(values)
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        annotations, entities = compiler.variable(), compiler.variable()
+        rv = (
+            f"(({annotations} := d.get({ANNOTATIONS!r})) is not None"
+            f" and ({entities} := {annotations}.get({self.annotation!r})) is not None"
+        )
+        if not self.values:
+            return rv + ")"
+        values = compiler.constant(self.values)
+        return (
+            rv + f" and any(entity.get({IDENTIFIER!r}) in {values} or entity.get({NAME!r}) in {values}"
+            f" for entity in {entities}))"
+        )
+
+    def __repr__(self) -> str:
+        return f"AnnotationHas({', '.join(map(repr, [self.annotation, *sorted(self.values)]))})"
+
+
+class CitationIn(EdgeExpression):
+    """An expression that passes for edges citing one of the given references.
+
+    If namespaces are given, the citation has to be from one of them, ignoring case.
+    """
+
+    def __init__(self, *identifiers: str, namespaces: Iterable[str] | None = None) -> None:
+        self.identifiers = _to_frozenset(identifiers)
+        self.namespaces = None if namespaces is None else _to_frozenset(namespace.lower() for namespace in namespaces)
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        citation = compiler.variable()
+        rv = (
+            f"(({citation} := d.get({CITATION!r})) is not None"
+            f" and {citation}.get({IDENTIFIER!r}) in {compiler.constant(self.identifiers)}"
+        )
+        if self.namespaces is not None:
+            rv += f" and {citation}[{NAMESPACE!r}].lower() in {compiler.constant(self.namespaces)}"
+        return rv + ")"
+
+    def __repr__(self) -> str:
+        return f"CitationIn({', '.join(map(repr, sorted(self.identifiers)))}, namespaces={self.namespaces!r})"
+
+
+class _Endpoint(EdgeExpression):
+    def __init__(self, expression: Expression) -> None:
+        if expression.is_edge:
+            raise TypeError(f"{type(self).__name__} needs an expression over nodes: {expression}")
+        self.expression = expression
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.expression!r})"
+
+
+class Source(_Endpoint):
+    """An expression that passes for edges whose source node passes the given expression over nodes."""
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return self.expression._emit(compiler, "u")
+
+
+class Target(_Endpoint):
+    """An expression that passes for edges whose target node passes the given expression over nodes."""
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return self.expression._emit(compiler, "v")
+
+
+class EdgePredicateExpression(EdgeExpression):
+    """An expression that wraps an edge predicate."""
+
+    def __init__(self, predicate: Callable[[BELGraph, BaseEntity, BaseEntity, str], bool]) -> None:
+        self.predicate = predicate
+
+    def _emit(self, compiler: _Compiler, node: str) -> str:
+        return f"{compiler.constant(self.predicate)}(graph, u, v, k)"
+
+    def __repr__(self) -> str:
+        return f"EdgePredicateExpression({getattr(self.predicate, '__name__', self.predicate)})"
+
+
+def as_node_expression(predicate) -> Expression:
+    """Get the node predicate as an expression, wrapping it if needed."""
+    if isinstance(predicate, Expression):
+        if predicate.is_edge:
+            raise TypeError(f"not an expression over nodes: {predicate}")
+        return predicate
+    return NodePredicateExpression(predicate)
+
+
+def as_edge_expression(predicate) -> Expression:
+    """Get the edge predicate as an expression, wrapping it if needed."""
+    if isinstance(predicate, Expression):
+        if not predicate.is_edge:
+            raise TypeError(f"not an expression over edges: {predicate}")
+        return predicate
+    return EdgePredicateExpression(predicate)
+
+
+def get_edge_data_predicate(predicate) -> EdgeDataPredicate:
+    """Get a function that evaluates the edge predicate given the data dictionary of the edge, too.
+
+    This lets loops that already have an edge's data, like over ``graph.edges(keys=True, data=True)``, skip looking it
+    up again for expressions.
+    """
+    if isinstance(predicate, Expression):
+        return predicate.compiled
+
+    def edge_data_predicate(graph: BELGraph, u: BaseEntity, v: BaseEntity, k: str, d: EdgeData) -> bool:
+        return predicate(graph, u, v, k)
+
+    return edge_data_predicate
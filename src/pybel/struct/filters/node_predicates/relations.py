@@ -1,7 +1,8 @@
 """Predicate functions for nodes based on their incident edges' relations."""
 
 from ...graph import BELGraph
-from ....constants import CAUSAL_RELATIONS, RELATION
+from ...indexes import get_relation_index
+from ....constants import CAUSAL_RELATIONS, RELATION, RELATION_CLASS_CAUSAL
 from ....dsl import BaseEntity
 
 __all__ = [
@@ -67,7 +68,10 @@ def has_causal_in_edges(graph: BELGraph, node: BaseEntity) -> bool:
     :param graph: A BEL graph
     :param node: A BEL term
     """
-    return has_in_edges(graph, node, CAUSAL_RELATIONS)
+    relation_index = get_relation_index(graph)
+    if relation_index is None:
+        return has_in_edges(graph, node, CAUSAL_RELATIONS)
+    return relation_index.has_in_edges(node, RELATION_CLASS_CAUSAL)
 
 
 def no_causal_in_edges(graph: BELGraph, node: BaseEntity) -> bool:
@@ -76,7 +80,7 @@ def no_causal_in_edges(graph: BELGraph, node: BaseEntity) -> bool:
     :param graph: A BEL graph
     :param node: A BEL term
     """
-    return no_in_edges(graph, node, CAUSAL_RELATIONS)
+    return not has_causal_in_edges(graph, node)
 
 
 def has_causal_out_edges(graph: BELGraph, node: BaseEntity) -> bool:
@@ -85,7 +89,10 @@ def has_causal_out_edges(graph: BELGraph, node: BaseEntity) -> bool:
     :param graph: A BEL graph
     :param node: A BEL term
     """
-    return has_out_edges(graph, node, CAUSAL_RELATIONS)
+    relation_index = get_relation_index(graph)
+    if relation_index is None:
+        return has_out_edges(graph, node, CAUSAL_RELATIONS)
+    return relation_index.has_out_edges(node, RELATION_CLASS_CAUSAL)
 
 
 def no_causal_out_edges(graph: BELGraph, node: BaseEntity) -> bool:
@@ -94,7 +101,7 @@ def no_causal_out_edges(graph: BELGraph, node: BaseEntity) -> bool:
     :param graph: A BEL graph
     :param node: A BEL term
     """
-    return no_out_edges(graph, node, CAUSAL_RELATIONS)
+    return not has_causal_out_edges(graph, node)
 
 
 def has_causal_edges(graph: BELGraph, node: BaseEntity) -> bool:
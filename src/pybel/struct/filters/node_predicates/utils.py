@@ -3,6 +3,7 @@
 from collections.abc import Callable, Iterable
 from functools import wraps
 
+from ..expressions import And, Expression, as_node_expression
 from ..typing import NodePredicate, NodePredicates
 from ...graph import BELGraph
 from ....dsl import BaseEntity
@@ -76,6 +77,9 @@ def concatenate_node_predicates(node_predicates: NodePredicates) -> NodePredicat
     if 1 == len(node_predicates):
         return node_predicates[0]
 
+    if any(isinstance(node_predicate, Expression) for node_predicate in node_predicates):
+        return And(*map(as_node_expression, node_predicates))
+
     def concatenated_node_predicate(graph: BELGraph, node: BaseEntity) -> bool:
         """Pass only for a nodes that pass all enclosed predicates."""
         return all(node_predicate(graph, node) for node_predicate in node_predicates)
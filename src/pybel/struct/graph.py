@@ -19,6 +19,7 @@ from typing import (
 import networkx as nx
 from tabulate import tabulate
 
+from .indexes import AnnotationIndex, ProvenanceIndex, RelationIndex
 from .operations import left_full_join, left_node_intersection_join, left_outer_join
 from .utils import update_metadata
 from ..canonicalize import edge_to_bel
@@ -121,6 +122,21 @@ class BELGraph(nx.MultiDiGraph):
     #: a pair for (hash(P(X) -> P(Y)), hash(P(Y) -> P(Z)))
     transitivities: set[tuple[str, str]]
 
+    #: Should a :class:`pybel.struct.indexes.RelationIndex` be built and used by causal traversals?
+    use_relation_index: bool = True
+
+    _relation_index: RelationIndex | None = None
+
+    #: Should a :class:`pybel.struct.indexes.AnnotationIndex` be built and used by annotation queries?
+    use_annotation_index: bool = True
+
+    _annotation_index: AnnotationIndex | None = None
+
+    #: Should a :class:`pybel.struct.indexes.ProvenanceIndex` be built and used by provenance queries?
+    use_provenance_index: bool = True
+
+    _provenance_index: ProvenanceIndex | None = None
+
     def __init__(
         self,
         name: str | None = None,
@@ -202,6 +218,91 @@ class BELGraph(nx.MultiDiGraph):
 
         self.raise_on_missing_annotations = True
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_relation_index", None)
+        state.pop("_annotation_index", None)
+        return state
+
+    @property
+    def relation_index(self) -> RelationIndex | None:
+        """The relation-typed adjacency index for this graph, built on first access.
+
+        Returns none if :data:`use_relation_index` is false or if this graph is a view, since views can change
+        underneath the index without notice. Frozen graphs that are not views get an index since they never change.
+        """
+        if not self.use_relation_index or getattr(self, "_graph", None) is not None:
+            return None
+        if self._relation_index is None:
+            self._relation_index = RelationIndex.from_graph(self)
+        return self._relation_index
+
+    @property
+    def annotation_index(self) -> AnnotationIndex | None:
+        """The index from edge annotations to edges for this graph, built on first access.
+
+        Returns none if :data:`use_annotation_index` is false or if this graph is a view.
+        """
+        if not self.use_annotation_index or getattr(self, "_graph", None) is not None:
+            return None
+        if self._annotation_index is None:
+            self._annotation_index = AnnotationIndex.from_graph(self)
+        return self._annotation_index
+
+    @property
+    def provenance_index(self) -> ProvenanceIndex | None:
+        """The index from the citations, authors, and evidences of edges to edges for this graph.
+
+        It is built on first access. Unlike the other indexes, it is pickled with the graph if it has already been
+        built, so it does not have to be rebuilt when the graph is loaded. Otherwise, it is built on first access
+        after loading. Returns none if :data:`use_provenance_index` is false or if this graph is a view.
+        """
+        if not self.use_provenance_index or getattr(self, "_graph", None) is not None:
+            return None
+        if self._provenance_index is None:
+            self._provenance_index = ProvenanceIndex.from_graph(self)
+        return self._provenance_index
+
+    def clear_indexes(self) -> None:
+        """Drop all secondary indexes so they are rebuilt on next access.
+
+        This is done automatically when nodes or edges are added or removed and after in-place transformations, but
+        has to be called after editing the data of edges in place elsewhere.
+        """
+        self._relation_index = None
+        self._annotation_index = None
+        self._provenance_index = None
+
+    def add_edge(self, u_for_edge, v_for_edge, key=None, **attr):
+        """Add an edge and drop the secondary indexes."""
+        self.clear_indexes()
+        return super().add_edge(u_for_edge, v_for_edge, key=key, **attr)
+
+    def remove_edge(self, u, v, key=None):
+        """Remove an edge and drop the secondary indexes."""
+        self.clear_indexes()
+        super().remove_edge(u, v, key=key)
+
+    def remove_node(self, n):
+        """Remove a node and drop the secondary indexes."""
+        self.clear_indexes()
+        super().remove_node(n)
+
+    def remove_nodes_from(self, nodes):
+        """Remove nodes and drop the secondary indexes."""
+        self.clear_indexes()
+        super().remove_nodes_from(nodes)
+
+    def clear(self):
+        """Remove all nodes, edges, and graph attributes, and drop the secondary indexes."""
+        self.clear_indexes()
+        super().clear()
+
+    def clear_edges(self):
+        """Remove all edges and drop the secondary indexes."""
+        self.clear_indexes()
+        super().clear_edges()
+
     def child(self) -> "BELGraph":
         """Create an empty graph with a "parent" reference back to this one."""
         rv = BELGraph()
@@ -1198,30 +1299,54 @@ def _iterate_authors(graph: BELGraph) -> Iterable[str]:
 class SummarizeDispatch(Dispatch):
     """A dispatch for summary printing functions that can be found at :data:`pybel.BELGraph.summarize`."""
 
-    def __call__(self, file: TextIO | None = None, examples: bool = True) -> None:
-        self.statistics(file=file)
+    def __call__(
+        self,
+        file: TextIO | None = None,
+        examples: bool = True,
+        time_budget: float | None = None,
+    ) -> None:
+        """Print the statistics and the node, namespace, and edge tables of the graph.
+
+        :param file: The file to print to
+        :param examples: Should an example be shown for each row of the tables?
+        :param time_budget: The number of seconds after which counting switches to approximate counts. See
+         :class:`pybel.struct.summary.supersummary.GraphSummary`.
+        """
+        summary = self._get_summary(examples=examples, time_budget=time_budget)
+        print(tabulate(self.list(summary=summary)), file=file)
         print("", file=file)
-        self.nodes(file=file, examples=examples)
+        print(summary.functions_str(), file=file)
         print("", file=file)
-        self.namespaces(file=file, examples=examples)
+        print(summary.namespaces_str(), file=file)
         print("", file=file)
-        self.edges(file=file, examples=examples)
+        print(summary.edges_str(), file=file)
         print("", file=file)
 
+    def _get_summary(self, examples: bool = True, time_budget: float | None = None):
+        from .summary.supersummary import GraphSummary
+
+        return GraphSummary(self.graph, examples=examples, time_budget=time_budget)
+
     def _repr_html_(self) -> str:
-        from .summary import supersummary as ss
+        return self.html()
+
+    def html(self, time_budget: float | None = None) -> str:
+        """Make an HTML summary of the graph, like the one shown in Jupyter.
 
+        :param time_budget: The number of seconds after which counting switches to approximate counts
+        """
+        summary = self._get_summary(time_budget=time_budget)
         return dedent(f"""\
             <h2>Metadata</h2>
             {tabulate(self._metadata_list(), tablefmt="html")}
             <h2>Statistics</h2>
-            {tabulate(self._statistics_list(prose_prefix=False), tablefmt="html")}
+            {tabulate(summary.statistics_list(prose_prefix=False), tablefmt="html")}
             <h2>Nodes</h2>
-            {ss.functions_str(self.graph, examples=True, add_count=False, tablefmt="html")}
+            {summary.functions_str(add_count=False, tablefmt="html")}
             <h2>Namespaces</h2>
-            {ss.namespaces_str(self.graph, examples=True, add_count=False, tablefmt="html")}
+            {summary.namespaces_str(add_count=False, tablefmt="html")}
             <h2>Edges</h2>
-            {ss.edges_str(self.graph, examples=True, add_count=False, tablefmt="html")}
+            {summary.edges_str(add_count=False, tablefmt="html")}
         """)
 
     def statistics(self, file: TextIO | None = None):
@@ -1269,28 +1394,19 @@ class SummarizeDispatch(Dispatch):
             rv.append(("Authors", self.graph.authors))
         return rv
 
-    def _statistics_list(self, prose_prefix: bool = True) -> list[tuple[str, Any]]:
-        number_nodes = self.graph.number_of_nodes()
-        rv = [
-            ("Nodes", number_nodes),
-            ("Namespaces", len(self.graph.count.namespaces())),
-            ("Edges", self.graph.number_of_edges()),
-            ("Annotations", len(self.graph.count.annotations())),
-            ("Citations", self.graph.number_of_citations()),
-            ("Authors", self.graph.number_of_authors()),
-            ("Components", nx.number_weakly_connected_components(self.graph)),
-            ("Warnings", self.graph.number_of_warnings()),
-        ]
-        if prose_prefix:
-            rv = [(f"Number of {x}", y) for x, y in rv]
-        rv.append(("Network Density", f"{nx.density(self.graph):.2E}"))
-        return rv
+    def _statistics_list(self, prose_prefix: bool = True, summary=None) -> list[tuple[str, Any]]:
+        if summary is None:
+            summary = self._get_summary(examples=False)
+        return summary.statistics_list(prose_prefix=prose_prefix)
 
-    def list(self) -> list[tuple[str, Any]]:
-        """Return a list of tuples that summarize the graph."""
+    def list(self, summary=None) -> list[tuple[str, Any]]:
+        """Return a list of tuples that summarize the graph.
+
+        :param pybel.struct.summary.supersummary.GraphSummary summary: A summary of the graph that was already built
+        """
         return [
             *self._metadata_list(),
-            *self._statistics_list(),
+            *self._statistics_list(summary=summary),
         ]
 
 
@@ -4,6 +4,7 @@ import logging
 from collections import defaultdict
 from collections.abc import Mapping
 
+from .utils import EdgeQuadruple, build_strata
 from ..graph import BELGraph
 from ...constants import ANNOTATIONS
 from ...language import Entity
@@ -15,57 +16,42 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
-def _get_subgraphs_by_annotation_disregard_undefined(graph: BELGraph, annotation: str) -> Mapping[Entity, BELGraph]:
-    result = defaultdict(graph.child)
-
-    for source, target, key, data in graph.edges(keys=True, data=True):
-        annotation_dict = data.get(ANNOTATIONS)
-
-        if annotation_dict is None:
-            continue
-
-        if annotation not in annotation_dict:
-            continue
-
-        for entity in annotation_dict[annotation]:
-            result[entity].add_edge(source, target, key=key, **data)
-
-    return dict(result)
-
-
-def _get_subgraphs_by_annotation_keep_undefined(
+def _bucket_edges_by_annotation(
     graph: BELGraph,
     annotation: str,
     sentinel: str | None,
-) -> Mapping[Entity, BELGraph]:
-    result = defaultdict(graph.child)
+) -> Mapping[Entity | str, list[EdgeQuadruple]]:
+    """Group the edges by the values of the given annotation in one pass over the graph.
+
+    :param sentinel: The value to stick unannotated edges into. If none, does not keep undefined.
+    """
+    rv = defaultdict(list)
 
     for source, target, key, data in graph.edges(keys=True, data=True):
         annotation_dict = data.get(ANNOTATIONS)
 
         if annotation_dict is None or annotation not in annotation_dict:
-            result[sentinel].add_edge(source, target, key=key, **data)
+            if sentinel is not None:
+                rv[sentinel].append((source, target, key, data))
         else:
             for entity in annotation_dict[annotation]:
-                result[entity].add_edge(source, target, key=key, **data)
+                rv[entity].append((source, target, key, data))
 
-    return dict(result)
+    return rv
 
 
 def get_subgraphs_by_annotation(
     graph: BELGraph,
     annotation: str,
     sentinel: str | None = None,
+    lazy: bool = False,
 ) -> Mapping[Entity, BELGraph]:
     """Stratify the given graph into sub-graphs based on the values for edges' annotations.
 
     :param graph: A BEL graph
     :param annotation: The annotation to group by
     :param sentinel: The value to stick unannotated edges into. If none, does not keep undefined.
+    :param lazy: If true, only builds each sub-graph the first time it is accessed
     """
-    if sentinel is not None:
-        subgraphs = _get_subgraphs_by_annotation_keep_undefined(graph, annotation, sentinel)
-    else:
-        subgraphs = _get_subgraphs_by_annotation_disregard_undefined(graph, annotation)
-
-    return subgraphs
+    buckets = _bucket_edges_by_annotation(graph, annotation, sentinel)
+    return build_strata(graph, buckets, lazy=lazy)
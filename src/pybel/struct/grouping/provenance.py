@@ -3,7 +3,9 @@
 from collections import defaultdict
 from collections.abc import Mapping
 
+from .utils import build_strata
 from ..graph import BELGraph
+from ..indexes import get_provenance_index
 from ...constants import CITATION, IDENTIFIER, NAMESPACE
 
 __all__ = [
@@ -11,19 +13,31 @@ __all__ = [
 ]
 
 
-def get_subgraphs_by_citation(graph: BELGraph) -> Mapping[tuple[str, str], BELGraph]:
+def get_subgraphs_by_citation(
+    graph: BELGraph,
+    lazy: bool = False,
+) -> Mapping[tuple[str, str], BELGraph]:
     """Stratify the graph based on citations.
 
     :param graph: A BEL graph
+    :param lazy: If true, only builds each sub-graph the first time it is accessed
     :return: A mapping of each citation db/id to the BEL graph from it.
     """
-    rv = defaultdict(graph.child)
+    provenance_index = get_provenance_index(graph)
+    if provenance_index is not None:
+        buckets = {
+            citation: list(provenance_index.iter_edges(positions))
+            for citation, positions in provenance_index.citations.items()
+        }
+        return build_strata(graph, buckets, lazy=lazy)
+
+    buckets = defaultdict(list)
 
     for u, v, key, data in graph.edges(keys=True, data=True):
         if CITATION not in data:
             continue
         dk = data[CITATION][NAMESPACE], data[CITATION][IDENTIFIER]
 
-        rv[dk].add_edge(u, v, key=key, **data)
+        buckets[dk].append((u, v, key, data))
 
-    return dict(rv)
+    return build_strata(graph, buckets, lazy=lazy)
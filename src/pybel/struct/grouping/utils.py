@@ -0,0 +1,66 @@
+"""Utilities for grouping sub-graphs."""
+
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+
+from ..graph import BELGraph
+from ...dsl import BaseEntity
+
+__all__ = [
+    "LazyStrata",
+    "build_strata",
+]
+
+EdgeQuadruple = tuple[BaseEntity, BaseEntity, str, Mapping]
+
+
+def _build_stratum(graph: BELGraph, edges: Iterable[EdgeQuadruple]) -> BELGraph:
+    rv = graph.child()
+    rv.add_edges_from(edges)
+    return rv
+
+
+class LazyStrata(Mapping):
+    """A mapping from strata to sub-graphs that only builds each sub-graph the first time it is accessed."""
+
+    def __init__(self, graph: BELGraph, buckets: Mapping[Hashable, list[EdgeQuadruple]]):
+        """Wrap the buckets of edges from the graph.
+
+        :param graph: A BEL graph
+        :param buckets: A mapping from each stratum's key to the (source, target, key, data) quadruples in it
+        """
+        self.graph = graph
+        self.buckets = buckets
+        self._cache: dict[Hashable, BELGraph] = {}
+
+    def __getitem__(self, stratum: Hashable) -> BELGraph:
+        rv = self._cache.get(stratum)
+        if rv is None:
+            rv = self._cache[stratum] = _build_stratum(self.graph, self.buckets[stratum])
+        return rv
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.buckets)
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def number_of_edges(self, stratum: Hashable) -> int:
+        """Count the edges in the given stratum without building its sub-graph."""
+        return len(self.buckets[stratum])
+
+
+def build_strata(
+    graph: BELGraph,
+    buckets: Mapping[Hashable, list[EdgeQuadruple]],
+    lazy: bool = False,
+) -> Mapping[Hashable, BELGraph]:
+    """Build a sub-graph for each bucket of edges from the graph.
+
+    :param graph: A BEL graph
+    :param buckets: A mapping from each stratum's key to the (source, target, key, data) quadruples in it
+    :param lazy: If true, returns a :class:`LazyStrata` that only builds the sub-graphs that get accessed
+    """
+    if lazy:
+        return LazyStrata(graph, buckets)
+
+    return {stratum: _build_stratum(graph, edges) for stratum, edges in buckets.items()}
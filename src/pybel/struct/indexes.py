@@ -0,0 +1,390 @@
+"""Secondary indexes over the edges of a :class:`pybel.BELGraph`.
+
+Indexes are built lazily from the graph the first time they are needed and are dropped by the graph whenever it is
+structurally modified through the :mod:`networkx` API (adding or removing nodes and edges). In-place modification of
+an edge's data dictionary is not tracked, so graphs whose edge relations or annotations are rewritten in place should
+call :meth:`pybel.BELGraph.clear_indexes` afterwards.
+
+The relation and annotation indexes are cheap to rebuild and are left out when a graph is pickled. The provenance
+index is pickled with the graph, since literature triage workflows load the same large graphs over and over.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+
+from ..constants import (
+    ANNOTATIONS,
+    CITATION,
+    CITATION_AUTHORS,
+    EVIDENCE,
+    IDENTIFIER,
+    NAMESPACE,
+    RELATION,
+    RELATION_CLASSES,
+)
+from ..dsl import BaseEntity
+
+__all__ = [
+    "RelationIndex",
+    "get_relation_index",
+    "AnnotationIndex",
+    "get_annotation_index",
+    "ProvenanceIndex",
+    "get_provenance_index",
+]
+
+#: A mapping from each relation to the relation class that contains it
+RELATION_TO_CLASS: Mapping[str, str] = {
+    relation: relation_class for relation_class, relations in RELATION_CLASSES.items() for relation in relations
+}
+
+_Adjacency = dict[BaseEntity, list[tuple[BaseEntity, str]]]
+
+
+class RelationIndex:
+    """A per-relation-class adjacency index over the edges of a graph.
+
+    For each relation class in :data:`pybel.constants.RELATION_CLASSES`, the index keeps the successors and
+    predecessors of each node along with the keys of the edges connecting them. This lets traversals that only care
+    about one class of relations (e.g., causal) skip over all other edges incident to a node.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty relation index."""
+        self._succ: dict[str, _Adjacency] = {relation_class: defaultdict(list) for relation_class in RELATION_CLASSES}
+        self._pred: dict[str, _Adjacency] = {relation_class: defaultdict(list) for relation_class in RELATION_CLASSES}
+
+    @classmethod
+    def from_graph(cls, graph) -> RelationIndex:
+        """Build a relation index from all edges in the graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        """
+        rv = cls()
+        # Walk the adjacency dictionaries directly and group by the outer node so that each node is only hashed
+        # once per relation class, since hashing a BEL node requires serializing it as BEL
+        for adjacency, index in ((graph._succ, rv._succ), (graph._pred, rv._pred)):
+            for node, neighbors in adjacency.items():
+                grouped = defaultdict(list)
+                for neighbor, keydict in neighbors.items():
+                    for key, data in keydict.items():
+                        relation_class = RELATION_TO_CLASS.get(data.get(RELATION))
+                        if relation_class is not None:
+                            grouped[relation_class].append((neighbor, key))
+                for relation_class, pairs in grouped.items():
+                    index[relation_class][node] = pairs
+        return rv
+
+    def add_edge(self, u: BaseEntity, v: BaseEntity, key: str, relation: str | None) -> None:
+        """Add an edge to the index, if its relation belongs to a relation class."""
+        relation_class = RELATION_TO_CLASS.get(relation)
+        if relation_class is None:
+            return
+        self._succ[relation_class][u].append((v, key))
+        self._pred[relation_class][v].append((u, key))
+
+    def _get_adjacency(self, adjacency: dict[str, _Adjacency], relation_class: str) -> _Adjacency:
+        try:
+            return adjacency[relation_class]
+        except KeyError:
+            raise ValueError(f"invalid relation class: {relation_class}") from None
+
+    def successors(self, node: BaseEntity, relation_class: str) -> list[tuple[BaseEntity, str]]:
+        """Get the successors and edge keys of the node by edges in the given relation class."""
+        return self._get_adjacency(self._succ, relation_class).get(node, [])
+
+    def predecessors(self, node: BaseEntity, relation_class: str) -> list[tuple[BaseEntity, str]]:
+        """Get the predecessors and edge keys of the node by edges in the given relation class."""
+        return self._get_adjacency(self._pred, relation_class).get(node, [])
+
+    def has_out_edges(self, node: BaseEntity, relation_class: str) -> bool:
+        """Check if the node has any out-edges in the given relation class."""
+        return bool(self.successors(node, relation_class))
+
+    def has_in_edges(self, node: BaseEntity, relation_class: str) -> bool:
+        """Check if the node has any in-edges in the given relation class."""
+        return bool(self.predecessors(node, relation_class))
+
+    def iter_out_edges(
+        self,
+        nodes: Iterable[BaseEntity],
+        relation_class: str,
+    ) -> Iterable[tuple[BaseEntity, BaseEntity, str]]:
+        """Iterate over the out-edges of the given nodes in the given relation class."""
+        succ = self._get_adjacency(self._succ, relation_class)
+        for u in nodes:
+            for v, key in succ.get(u, ()):
+                yield u, v, key
+
+    def iter_in_edges(
+        self,
+        nodes: Iterable[BaseEntity],
+        relation_class: str,
+    ) -> Iterable[tuple[BaseEntity, BaseEntity, str]]:
+        """Iterate over the in-edges of the given nodes in the given relation class."""
+        pred = self._get_adjacency(self._pred, relation_class)
+        for v in nodes:
+            for u, key in pred.get(v, ()):
+                yield u, v, key
+
+
+def get_relation_index(graph) -> RelationIndex | None:
+    """Get the relation index for the graph, or none if the graph does not support one.
+
+    Graphs that are not :class:`pybel.BELGraph` instances, subgraph views, and graphs on which
+    :data:`pybel.BELGraph.use_relation_index` has been switched off do not get an index.
+    """
+    return getattr(graph, "relation_index", None)
+
+
+_EdgeTuple = tuple[BaseEntity, BaseEntity, str, Mapping[str, Any]]
+
+_EMPTY = np.array([], dtype=np.int64)
+
+
+def _union(arrays: Iterable[np.ndarray]) -> np.ndarray:
+    """Get the sorted union of sorted arrays of edge positions."""
+    arrays = [array for array in arrays if len(array)]
+    if not arrays:
+        return _EMPTY
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.unique(np.concatenate(arrays))
+
+
+def _to_arrays(positions: Mapping[Any, list[int]]) -> dict[Any, np.ndarray]:
+    return {key: np.array(value, dtype=np.int64) for key, value in positions.items()}
+
+
+def _value_key(value: Mapping[str, str]) -> frozenset:
+    """Get a hashable key for an annotation value that is equal for equal :class:`pybel.language.Entity` values."""
+    return frozenset(value.items())
+
+
+class AnnotationIndex:
+    """An inverted index from the annotations of edges to the edges that carry them.
+
+    Each edge of the graph gets a position and each annotation key and value gets a sorted array of the positions of
+    the edges annotated with it. Queries over several annotations are answered by taking unions and intersections of
+    these arrays instead of checking the annotations of every edge.
+    """
+
+    def __init__(
+        self,
+        edges: list[_EdgeTuple],
+        postings: Mapping[str, Mapping[frozenset, np.ndarray]],
+        key_positions: Mapping[str, np.ndarray],
+    ) -> None:
+        """Initialize the annotation index.
+
+        :param edges: The edges of the graph as (source, target, key, data) quadruples, in position order
+        :param postings: A mapping from annotation keys to mappings from their values (as given by
+         :func:`_value_key`) to sorted arrays of the positions of the edges annotated with them
+        :param key_positions: A mapping from annotation keys to sorted arrays of the positions of the edges that
+         have them, with or without values
+        """
+        self.edges = edges
+        self._postings = postings
+        self._key_positions = key_positions
+
+    @classmethod
+    def from_graph(cls, graph) -> AnnotationIndex:
+        """Build an annotation index from all edges in the graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        """
+        edges = []
+        postings = defaultdict(lambda: defaultdict(list))
+        key_positions = defaultdict(list)
+        for position, (u, v, k, data) in enumerate(graph.edges(keys=True, data=True)):
+            edges.append((u, v, k, data))
+            annotations = data.get(ANNOTATIONS)
+            if not annotations:
+                continue
+            for key, values in annotations.items():
+                key_positions[key].append(position)
+                key_postings = postings[key]
+                for value in values:
+                    positions = key_postings[_value_key(value)]
+                    # an edge can list the same value twice, but its position only goes in once
+                    if not positions or positions[-1] != position:
+                        positions.append(position)
+        return cls(
+            edges=edges,
+            postings={key: _to_arrays(key_postings) for key, key_postings in postings.items()},
+            key_positions=_to_arrays(key_positions),
+        )
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def _get_positions(self, key: str, value: Mapping[str, str]) -> np.ndarray:
+        return self._postings.get(key, {}).get(_value_key(value), _EMPTY)
+
+    def get_positions_any(self, query: Mapping[str, Iterable[Mapping[str, str]]]) -> np.ndarray:
+        """Get the sorted positions of the edges that have any of the annotation values in the query.
+
+        An empty query matches all edges.
+
+        :param query: A cleaned annotation query, like from :meth:`pybel.BELGraph._clean_annotations`
+        """
+        if not query:
+            return self._get_all_positions()
+        return _union(self._get_positions(key, value) for key, values in query.items() for value in values)
+
+    def get_positions_all(self, query: Mapping[str, Iterable[Mapping[str, str]]]) -> np.ndarray:
+        """Get the sorted positions of the edges that have all of the annotation values in the query.
+
+        An empty query matches all edges.
+
+        :param query: A cleaned annotation query, like from :meth:`pybel.BELGraph._clean_annotations`
+        """
+        rv = None
+        for key, values in query.items():
+            values = list(values)
+            arrays = [self._get_positions(key, value) for value in values] if values else [self._get_key_positions(key)]
+            for positions in arrays:
+                rv = positions if rv is None else np.intersect1d(rv, positions, assume_unique=True)
+                if not len(rv):
+                    return _EMPTY
+        return self._get_all_positions() if rv is None else rv
+
+    def _get_all_positions(self) -> np.ndarray:
+        return np.arange(len(self.edges), dtype=np.int64)
+
+    def _get_key_positions(self, key: str) -> np.ndarray:
+        return self._key_positions.get(key, _EMPTY)
+
+    def iter_edges(self, positions: Iterable[int]) -> Iterable[_EdgeTuple]:
+        """Iterate over the (source, target, key, data) quadruples of the edges at the given positions."""
+        edges = self.edges
+        for position in positions:
+            yield edges[position]
+
+
+def get_annotation_index(graph) -> AnnotationIndex | None:
+    """Get the annotation index for the graph, or none if the graph does not support one.
+
+    Graphs that are not :class:`pybel.BELGraph` instances, subgraph views, and graphs on which
+    :data:`pybel.BELGraph.use_annotation_index` has been switched off do not get an index.
+    """
+    return getattr(graph, "annotation_index", None)
+
+
+class ProvenanceIndex:
+    """An inverted index from the citations, authors, and evidences of edges to the edges that carry them.
+
+    Like the :class:`AnnotationIndex`, each edge of the graph gets a position and each citation, author, and
+    evidence gets a sorted array of the positions of its edges.
+    """
+
+    def __init__(
+        self,
+        edges: list[_EdgeTuple],
+        citations: Mapping[tuple[str, str], np.ndarray],
+        authors: Mapping[str, np.ndarray],
+        evidences: Mapping[str, np.ndarray],
+    ) -> None:
+        """Initialize the provenance index.
+
+        :param edges: The edges of the graph as (source, target, key, data) quadruples, in position order
+        :param citations: A mapping from the (namespace, identifier) pairs of citations to the positions of their edges
+        :param authors: A mapping from the authors of citations to the positions of their edges
+        :param evidences: A mapping from evidence text to the positions of its edges
+        """
+        self.edges = edges
+        self.citations = citations
+        self.authors = authors
+        self.evidences = evidences
+
+    @classmethod
+    def from_graph(cls, graph) -> ProvenanceIndex:
+        """Build a provenance index from all edges in the graph.
+
+        :param pybel.BELGraph graph: A BEL graph
+        """
+        edges = []
+        citations = defaultdict(list)
+        authors = defaultdict(list)
+        evidences = defaultdict(list)
+        for position, (u, v, k, data) in enumerate(graph.edges(keys=True, data=True)):
+            edges.append((u, v, k, data))
+            citation = data.get(CITATION)
+            if citation is None:
+                continue
+            citations[citation[NAMESPACE], citation[IDENTIFIER]].append(position)
+            for author in citation.get(CITATION_AUTHORS) or ():
+                positions = authors[author]
+                # an author can be listed twice, but the edge's position only goes in once
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+            evidence = data.get(EVIDENCE)
+            if evidence is not None:
+                evidences[evidence].append(position)
+        return cls(
+            edges=edges,
+            citations=_to_arrays(citations),
+            authors=_to_arrays(authors),
+            evidences=_to_arrays(evidences),
+        )
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def get_positions_by_citation_identifiers(
+        self,
+        identifiers: str | Iterable[str],
+        namespaces: str | Iterable[str] = ("pubmed", "pmid"),
+    ) -> np.ndarray:
+        """Get the sorted positions of the edges citing any of the given identifiers.
+
+        :param identifiers: A citation identifier or identifiers
+        :param namespaces: The citation namespace(s) to look in, compared without case like
+         :func:`pybel.struct.filters.edge_predicates.has_pubmed` does
+        """
+        identifiers = {identifiers} if isinstance(identifiers, str) else set(identifiers)
+        if isinstance(namespaces, str):
+            namespaces = [namespaces]
+        namespaces = {namespace.lower() for namespace in namespaces}
+        # the same namespace can be written with different cases in the citations of one graph
+        namespaces = [namespace for namespace in self._get_namespaces() if namespace.lower() in namespaces]
+        return _union(
+            self.citations.get((namespace, identifier), _EMPTY)
+            for namespace in namespaces
+            for identifier in identifiers
+        )
+
+    def _get_namespaces(self) -> set[str]:
+        return {namespace for namespace, _ in self.citations}
+
+    def get_positions_by_authors(self, authors: str | Iterable[str]) -> np.ndarray:
+        """Get the sorted positions of the edges whose citations were written by any of the given authors."""
+        if isinstance(authors, str):
+            authors = [authors]
+        return _union(self.authors.get(author, _EMPTY) for author in set(authors))
+
+    def get_positions_by_evidences(self, evidences: str | Iterable[str]) -> np.ndarray:
+        """Get the sorted positions of the edges supported by any of the given evidence texts."""
+        if isinstance(evidences, str):
+            evidences = [evidences]
+        return _union(self.evidences.get(evidence, _EMPTY) for evidence in set(evidences))
+
+    def iter_edges(self, positions: Iterable[int]) -> Iterable[_EdgeTuple]:
+        """Iterate over the (source, target, key, data) quadruples of the edges at the given positions."""
+        edges = self.edges
+        for position in positions:
+            yield edges[position]
+
+
+def get_provenance_index(graph) -> ProvenanceIndex | None:
+    """Get the provenance index for the graph, or none if the graph does not support one.
+
+    Graphs that are not :class:`pybel.BELGraph` instances, subgraph views, and graphs on which
+    :data:`pybel.BELGraph.use_provenance_index` has been switched off do not get an index.
+    """
+    return getattr(graph, "provenance_index", None)
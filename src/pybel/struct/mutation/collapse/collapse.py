@@ -1,14 +1,15 @@
 """Utilities for functions for collapsing nodes."""
 
 import itertools as itt
-from collections.abc import Mapping
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 
 from ...filters.edge_filters import filter_edges
 from ...filters.edge_predicate_builders import build_relation_predicate
 from ...pipeline import in_place_transformation
 from ....constants import HAS_VARIANT
 from ....dsl import BaseEntity
-from ....utils import hash_edge
+from ....utils import hash_bel_edge
 
 __all__ = [
     "collapse_all_variants",
@@ -23,6 +24,81 @@ def _remove_self_edges(graph):
     graph.remove_edges_from(self_edges)
 
 
+def _resolve_victims(survivor_mapping: Mapping[BaseEntity, Iterable[BaseEntity]]) -> dict[BaseEntity, BaseEntity]:
+    """Build a mapping from each victim to the node it ultimately collapses into.
+
+    Transitive chains like ``{a: {b}, b: {c}}`` are resolved so that both ``b`` and ``c`` collapse into ``a``. If a
+    victim is given for several survivors, the first one wins.
+
+    :raises ValueError: If the mapping contains a cycle
+    """
+    victim_to_survivor: dict[BaseEntity, BaseEntity] = {}
+    for survivor, victims in survivor_mapping.items():
+        for victim in victims:
+            if victim != survivor:
+                victim_to_survivor.setdefault(victim, survivor)
+
+    rv: dict[BaseEntity, BaseEntity] = {}
+    for victim in victim_to_survivor:
+        chain = []
+        node = victim
+        while node in victim_to_survivor and node not in rv:
+            chain.append(node)
+            node = victim_to_survivor[node]
+            if node == victim or node in chain:
+                raise ValueError(f"survivor mapping has a cycle through {node}")
+        final = rv.get(node, node)
+        for chained in chain:
+            rv[chained] = final
+    return rv
+
+
+def _collapse_victims(graph, victim_to_survivor: Mapping[BaseEntity, BaseEntity]) -> None:
+    """Rewire all edges from the victims to their survivors in one pass, then remove the victims in one batch.
+
+    Edges between a victim and its survivor, or between two victims of the same survivor, are not kept.
+    """
+    victims = [victim for victim in victim_to_survivor if victim in graph]
+    if not victims:
+        return
+
+    # Serialize and resolve each node object only once, even though it might take part in many re-hashed edges.
+    # The caches are keyed by identity since hashing a BEL node requires serializing it.
+    bel_cache: dict[int, tuple[str, BaseEntity]] = {}
+    resolve_cache: dict[int, tuple[BaseEntity, BaseEntity]] = {}
+
+    def _get_bel(node: BaseEntity) -> str:
+        rv = bel_cache.get(id(node))
+        if rv is None:
+            rv = bel_cache[id(node)] = node.as_bel(), node
+        return rv[0]
+
+    def _resolve(node: BaseEntity) -> BaseEntity:
+        rv = resolve_cache.get(id(node))
+        if rv is None:
+            rv = resolve_cache[id(node)] = node, victim_to_survivor.get(node, node)
+        return rv[1]
+
+    rewired = []
+    for victim in victims:
+        survivor = victim_to_survivor[victim]
+        survivor_bel = _get_bel(survivor)
+        for _, successor, data in graph.out_edges(victim, data=True):
+            successor = _resolve(successor)
+            if _get_bel(successor) != survivor_bel:
+                rewired.append((survivor, successor, data))
+        for predecessor, _, data in graph.in_edges(victim, data=True):
+            if _resolve(predecessor) is not predecessor:  # already handled as an out-edge of the other victim
+                continue
+            if _get_bel(predecessor) != survivor_bel:
+                rewired.append((predecessor, survivor, data))
+
+    edges = [(u, v, hash_bel_edge(_get_bel(u), _get_bel(v), data), data) for u, v, data in rewired]
+
+    graph.remove_nodes_from(victims)
+    graph.add_edges_from(edges)
+
+
 @in_place_transformation
 def collapse_pair(graph, survivor: BaseEntity, victim: BaseEntity) -> None:
     """Rewire all edges from the synonymous node to the survivor node, then deletes the synonymous node.
@@ -33,41 +109,22 @@ def collapse_pair(graph, survivor: BaseEntity, victim: BaseEntity) -> None:
     :param survivor: The BEL node to collapse all edges on the synonym to
     :param victim: The BEL node to collapse into the surviving node
     """
-    graph.add_edges_from(
-        (survivor, successor, hash_edge(survivor, successor, edge_data), edge_data)
-        for _, successor, edge_data in graph.out_edges(victim, data=True)
-        if successor != survivor
-    )
-
-    graph.add_edges_from(
-        (predecessor, survivor, hash_edge(predecessor, survivor, edge_data), edge_data)
-        for predecessor, _, edge_data in graph.in_edges(victim, data=True)
-        if predecessor != survivor
-    )
-
-    if victim in graph:
-        graph.remove_node(victim)
-
-
-# TODO what happens when collapsing is not consistent? Need to build intermediate mappings and test their consistency.
+    _collapse_victims(graph, {victim: survivor})
 
 
 @in_place_transformation
 def collapse_nodes(graph, survivor_mapping: Mapping[BaseEntity, set[BaseEntity]]) -> None:
     """Collapse all nodes in values to the key nodes, in place.
 
+    All edges are rewired in a single pass and all victims are removed in a single batch. Transitive chains in the
+    mapping, like ``{a: {b}, b: {c}}``, are resolved so that ``c`` collapses into ``a``.
+
     :param pybel.BELGraph graph: A BEL graph
     :param survivor_mapping: A dictionary with survivors as their keys, and iterables of the corresponding victims as
      values.
+    :raises ValueError: If the survivor mapping contains a cycle
     """
-    inconsistencies = surviors_are_inconsistent(survivor_mapping)
-    if inconsistencies:
-        raise ValueError(f"survivor mapping is inconsistent: {inconsistencies}")
-
-    for survivor, victims in survivor_mapping.items():
-        for victim in victims:
-            collapse_pair(graph, survivor=survivor, victim=victim)
-
+    _collapse_victims(graph, _resolve_victims(survivor_mapping))
     _remove_self_edges(graph)
 
 
@@ -90,9 +147,9 @@ def collapse_all_variants(graph) -> None:
     """
     has_variant_predicate = build_relation_predicate(HAS_VARIANT)
 
-    edges = list(filter_edges(graph, has_variant_predicate))
-
-    for u, v, _ in edges:
-        collapse_pair(graph, survivor=u, victim=v)
+    survivor_mapping = defaultdict(set)
+    for u, v, _ in filter_edges(graph, has_variant_predicate):
+        survivor_mapping[u].add(v)
 
+    _collapse_victims(graph, _resolve_victims(survivor_mapping))
     _remove_self_edges(graph)
@@ -8,7 +8,11 @@ from ...filters.node_predicates import (
     is_isolated_list_abundance,
     is_pathology,
 )
-from ...pipeline import in_place_transformation
+from ...pipeline import (
+    in_place_transformation,
+    register_edge_removal,
+    register_node_removal,
+)
 
 __all__ = [
     "remove_associations",
@@ -21,6 +25,7 @@ __all__ = [
 ]
 
 
+@register_edge_removal(lambda graph, edge_predicates=None: edge_predicates)
 @in_place_transformation
 def remove_filtered_edges(graph, edge_predicates=None):
     """Remove edges passing the given edge predicates.
@@ -45,6 +50,7 @@ def remove_filtered_nodes(graph, node_predicates=None):
     graph.remove_nodes_from(nodes)
 
 
+@register_edge_removal(lambda graph: is_associative_relation)
 @in_place_transformation
 def remove_associations(graph):
     """Remove all associative relationships from the graph.
@@ -54,6 +60,7 @@ def remove_associations(graph):
     remove_filtered_edges(graph, is_associative_relation)
 
 
+@register_node_removal(lambda graph: is_pathology)
 @in_place_transformation
 def remove_pathologies(graph):
     """Remove pathology nodes from the graph.
@@ -63,6 +70,7 @@ def remove_pathologies(graph):
     remove_filtered_nodes(graph, node_predicates=is_pathology)
 
 
+@register_node_removal(lambda graph: is_biological_process)
 @in_place_transformation
 def remove_biological_processes(graph):
     """Remove biological process nodes from the graph.
@@ -81,6 +89,7 @@ def remove_isolated_list_abundances(graph):
     remove_filtered_nodes(graph, is_isolated_list_abundance)
 
 
+@register_edge_removal(lambda graph: not_causal_relation)
 @in_place_transformation
 def remove_non_causal_edges(graph):
     """Remove non-causal edges from the graph."""
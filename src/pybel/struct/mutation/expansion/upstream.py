@@ -1,11 +1,13 @@
 """Functions for expanding a graph based on the upstream/downstream edges."""
 
-from ..utils import expand_by_edge_filter
+from ..utils import expand_by_edge_filter, expand_by_edges
 from ...filters.edge_predicate_builders import (
     build_downstream_edge_predicate,
     build_upstream_edge_predicate,
 )
+from ...indexes import get_relation_index
 from ...pipeline import uni_in_place_transformation
+from ....constants import RELATION_CLASS_CAUSAL
 
 __all__ = [
     "expand_downstream_causal",
@@ -20,7 +22,11 @@ def expand_upstream_causal(universe, graph):
     :param pybel.BELGraph universe: A BEL graph representing the universe of all knowledge
     :param pybel.BELGraph graph: The target BEL graph to enrich with upstream causal controllers of contained nodes
     """
-    expand_by_edge_filter(universe, graph, build_upstream_edge_predicate(graph))
+    relation_index = get_relation_index(universe)
+    if relation_index is None:
+        expand_by_edge_filter(universe, graph, build_upstream_edge_predicate(graph))
+    else:
+        expand_by_edges(universe, graph, list(relation_index.iter_in_edges(list(graph), RELATION_CLASS_CAUSAL)))
 
 
 @uni_in_place_transformation
@@ -30,4 +36,8 @@ def expand_downstream_causal(universe, graph):
     :param pybel.BELGraph universe: A BEL graph representing the universe of all knowledge
     :param pybel.BELGraph graph: The target BEL graph to enrich with upstream causal controllers of contained nodes
     """
-    expand_by_edge_filter(universe, graph, build_downstream_edge_predicate(graph))
+    relation_index = get_relation_index(universe)
+    if relation_index is None:
+        expand_by_edge_filter(universe, graph, build_downstream_edge_predicate(graph))
+    else:
+        expand_by_edges(universe, graph, list(relation_index.iter_out_edges(list(graph), RELATION_CLASS_CAUSAL)))
@@ -9,7 +9,8 @@ from ...filters.edge_predicate_builders import (
     build_annotation_dict_any_filter,
 )
 from ...graph import AnnotationsHint, BELGraph
-from ...pipeline import transformation
+from ...indexes import get_annotation_index
+from ...pipeline import register_edge_induction, transformation
 
 __all__ = [
     "get_subgraph_by_annotation_value",
@@ -19,6 +20,34 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+def _build_annotations_predicate(graph: BELGraph, annotations: AnnotationsHint, or_: bool | None = None):
+    edge_filter_builder = build_annotation_dict_any_filter if (or_ is None or or_) else build_annotation_dict_all_filter
+    annotations = graph._clean_annotations(annotations)
+    return edge_filter_builder(annotations)
+
+
+def _get_subgraph_by_annotation_index(graph: BELGraph, annotations: AnnotationsHint, or_: bool | None = None):
+    """Induce a sub-graph given an annotations filter using the graph's annotation index, if it has one."""
+    annotation_index = get_annotation_index(graph)
+    if annotation_index is None:
+        return None
+    annotations = graph._clean_annotations(annotations)
+    if or_ is None or or_:
+        positions = annotation_index.get_positions_any(annotations)
+    else:
+        positions = annotation_index.get_positions_all(annotations)
+    rv = graph.child()
+    rv.add_edges_from(annotation_index.iter_edges(positions))
+    return rv
+
+
+def _build_annotation_value_predicate(graph: BELGraph, annotation: str, values: str | Iterable[str]):
+    if isinstance(values, str):
+        values = {values}
+    return _build_annotations_predicate(graph, {annotation: values})
+
+
+@register_edge_induction(_build_annotations_predicate)
 @transformation
 def get_subgraph_by_annotations(
     graph: BELGraph,
@@ -33,12 +62,13 @@ def get_subgraph_by_annotations(
      edge. Defaults to True.
     :return: A subgraph of the original BEL graph
     """
-    edge_filter_builder = build_annotation_dict_any_filter if (or_ is None or or_) else build_annotation_dict_all_filter
-
-    annotations = graph._clean_annotations(annotations)
-    return get_subgraph_by_edge_filter(graph, edge_filter_builder(annotations))
+    rv = _get_subgraph_by_annotation_index(graph, annotations, or_=or_)
+    if rv is not None:
+        return rv
+    return get_subgraph_by_edge_filter(graph, _build_annotations_predicate(graph, annotations, or_=or_))
 
 
+@register_edge_induction(_build_annotation_value_predicate)
 @transformation
 def get_subgraph_by_annotation_value(graph: BELGraph, annotation: str, values: str | Iterable[str]) -> BELGraph:
     """Induce a sub-graph over all edges whose annotations match the given key and value.
@@ -50,5 +80,4 @@ def get_subgraph_by_annotation_value(graph: BELGraph, annotation: str, values: s
     """
     if isinstance(values, str):
         values = {values}
-
     return get_subgraph_by_annotations(graph, {annotation: values})
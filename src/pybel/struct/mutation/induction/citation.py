@@ -7,7 +7,8 @@ from ...filters.edge_predicate_builders import (
     build_author_inclusion_filter,
     build_pmid_inclusion_filter,
 )
-from ...pipeline import transformation
+from ...indexes import get_provenance_index
+from ...pipeline import register_edge_induction, transformation
 
 __all__ = [
     "get_subgraph_by_authors",
@@ -17,6 +18,7 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+@register_edge_induction(lambda graph, pubmed_identifiers: build_pmid_inclusion_filter(pubmed_identifiers))
 @transformation
 def get_subgraph_by_pubmed(graph, pubmed_identifiers):
     """Induce a sub-graph over the edges retrieved from the given PubMed identifier(s).
@@ -25,9 +27,15 @@ def get_subgraph_by_pubmed(graph, pubmed_identifiers):
     :param str or list[str] pubmed_identifiers: A PubMed identifier or list of PubMed identifiers
     :rtype: pybel.BELGraph
     """
-    return get_subgraph_by_edge_filter(graph, build_pmid_inclusion_filter(pubmed_identifiers))
+    provenance_index = get_provenance_index(graph)
+    if provenance_index is None:
+        return get_subgraph_by_edge_filter(graph, build_pmid_inclusion_filter(pubmed_identifiers))
+    return _get_subgraph_by_positions(
+        graph, provenance_index, provenance_index.get_positions_by_citation_identifiers(pubmed_identifiers)
+    )
 
 
+@register_edge_induction(lambda graph, authors: build_author_inclusion_filter(authors))
 @transformation
 def get_subgraph_by_authors(graph, authors):
     """Induce a sub-graph over the edges retrieved publications by the given author(s).
@@ -36,4 +44,13 @@ def get_subgraph_by_authors(graph, authors):
     :param str or list[str] authors: An author or list of authors
     :rtype: pybel.BELGraph
     """
-    return get_subgraph_by_edge_filter(graph, build_author_inclusion_filter(authors))
+    provenance_index = get_provenance_index(graph)
+    if provenance_index is None:
+        return get_subgraph_by_edge_filter(graph, build_author_inclusion_filter(authors))
+    return _get_subgraph_by_positions(graph, provenance_index, provenance_index.get_positions_by_authors(authors))
+
+
+def _get_subgraph_by_positions(graph, provenance_index, positions):
+    rv = graph.child()
+    rv.add_edges_from(provenance_index.iter_edges(positions))
+    return rv
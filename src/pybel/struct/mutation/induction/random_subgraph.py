@@ -4,10 +4,12 @@ import bisect
 import logging
 import random
 from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from operator import itemgetter
 from typing import Any
 
-from ..utils import remove_isolated_nodes
+import numpy as np
+
 from ...graph import BELGraph
 from ...pipeline import transformation
 from ....dsl import BaseEntity
@@ -16,6 +18,7 @@ __all__ = [
     "get_graph_with_random_edges",
     "get_random_node",
     "get_random_subgraph",
+    "get_random_subgraphs",
 ]
 
 logger = logging.getLogger(__name__)
@@ -118,50 +121,208 @@ def get_random_node(
     return wrg.next()
 
 
+class FenwickTree:
+    """A binary indexed tree over non-negative weights supporting weighted sampling.
+
+    Both updating a weight and drawing an index proportionally to the weights take :math:`O(\\log n)` time, which
+    makes it possible to keep the sampling distribution up to date as a random subgraph grows.
+    """
+
+    def __init__(self, size: int):
+        """Build a Fenwick tree with all weights set to zero.
+
+        :param size: The number of weights
+        """
+        self.size = size
+        self.weights = [0.0] * size
+        self._tree = [0.0] * (size + 1)
+        #: The number of positive weights, since the total can drift above zero after all weights are zeroed
+        self._positive = 0
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+    def set(self, index: int, weight: float) -> None:
+        """Set the weight at the given index."""
+        delta = weight - self.weights[index]
+        if not delta:
+            return
+        self._positive += (weight > 0) - (self.weights[index] > 0)
+        self.weights[index] = weight
+        i = index + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    @property
+    def total(self) -> float:
+        """Get the sum of all weights."""
+        rv, i = 0.0, self.size
+        while i > 0:
+            rv += self._tree[i]
+            i -= i & -i
+        return rv
+
+    def find(self, target: float) -> int:
+        """Get the smallest index whose cumulative weight exceeds the target."""
+        position, step = 0, self._top
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self._tree[nxt] <= target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(position, self.size - 1)
+
+    def sample(self, rng: np.random.Generator) -> int | None:
+        """Draw an index proportionally to its weight, or none if all weights are zero."""
+        if not self._positive:
+            return None
+        total = self.total
+        while True:
+            index = self.find(rng.random() * total)
+            if self.weights[index] > 0:  # guards against floating point drift onto a zeroed weight
+                return index
+
+
+class RandomSubgraphSampler:
+    """Samples random subgraphs by weighted random walks from random seed edges.
+
+    The adjacency of the graph is precomputed once so that many subgraphs can be drawn from the same graph. The nodes
+    to grow from are chosen proportionally to their (inverted) degree in the subgraph being built using a
+    :class:`FenwickTree` that is updated incrementally as edges are added.
+    """
+
+    def __init__(self, graph: BELGraph, invert_degrees: bool | None = None):
+        """Precompute the node indexes and adjacency of the graph.
+
+        :param graph: A BEL graph
+        :param invert_degrees: Should the degrees be inverted? Defaults to true.
+        """
+        self.graph = graph
+        self.invert_degrees = invert_degrees is None or invert_degrees
+        self.nodes = list(graph)
+        self.node_to_index = {node: index for index, node in enumerate(self.nodes)}
+        self.successors = [[self.node_to_index[v] for v in graph[u]] for u in self.nodes]
+        self.edges = list(graph.edges(keys=True))
+
+    def _weight(self, degree: int) -> float:
+        return 1 / degree if self.invert_degrees else float(degree)
+
+    def sample(
+        self,
+        number_edges: int | None = None,
+        number_seed_edges: int | None = None,
+        seed: int | np.random.Generator | np.random.SeedSequence | None = None,
+    ) -> BELGraph:
+        """Generate a random subgraph.
+
+        :param number_edges: Maximum number of edges. Defaults to :data:`SAMPLE_RANDOM_EDGE_COUNT` (250).
+        :param number_seed_edges: Number of edges to start with (which likely results in different components
+         in large graphs). Defaults to :data:`SAMPLE_RANDOM_EDGE_SEED_COUNT` (5).
+        :param seed: A seed or generator passed to :func:`numpy.random.default_rng`
+        """
+        if number_edges is None:
+            number_edges = SAMPLE_RANDOM_EDGE_COUNT
+
+        if number_seed_edges is None:
+            number_seed_edges = SAMPLE_RANDOM_EDGE_SEED_COUNT
+
+        # Check if graph will sample full graph, and just return it if it would
+        if len(self.edges) <= number_edges:
+            logger.info("sampled full graph")
+            return self.graph.copy()
+
+        rng = np.random.default_rng(seed)
+
+        result = self.graph.child()
+        for position in rng.choice(len(self.edges), size=min(number_seed_edges, number_edges), replace=False):
+            u, v, k = self.edges[position]
+            result.add_edge(u, v, key=k, **self.graph[u][v][k])
+
+        self.grow(result, number_edges - result.number_of_edges(), node_blacklist=set(), rng=rng)
+        return result
+
+    def grow(
+        self,
+        result,
+        number_edges_remaining: int,
+        node_blacklist: set[BaseEntity],
+        rng: np.random.Generator,
+    ) -> None:
+        """Grow the result graph in place by adding edges from the graph adjacent to its nodes.
+
+        :param result: A subgraph of the graph
+        :param number_edges_remaining: The number of edges to add
+        :param node_blacklist: Nodes that should not be grown from. Nodes without any remaining edges to add are
+         added to this set.
+        :param rng: A random number generator
+        """
+        tree = FenwickTree(len(self.nodes))
+        degrees: dict[int, int] = {}
+        for node, degree in result.degree():
+            index = self.node_to_index.get(node)
+            if index is None:
+                continue
+            degrees[index] = degree
+            if node not in node_blacklist:
+                tree.set(index, self._weight(degree))
+
+        # Lazily filled lists of the successors of each node that are not yet connected to it in the result
+        remaining: dict[int, list[int]] = {}
+
+        logger.debug("adding remaining %d edges", number_edges_remaining)
+        for _ in range(number_edges_remaining):
+            while True:
+                source = tree.sample(rng)
+                if source is None:
+                    # Happens when after exhausting the connected components. Try increasing the number seed edges
+                    logger.debug("no nodes left to grow from")
+                    return
+
+                candidates = remaining.get(source)
+                if candidates is None:
+                    present = {self.node_to_index[v] for v in result[self.nodes[source]]}
+                    candidates = remaining[source] = [t for t in self.successors[source] if t not in present]
+                if candidates:
+                    break
+
+                # there aren't any possible nodes to step to, so try growing from somewhere else
+                node_blacklist.add(self.nodes[source])
+                tree.set(source, 0.0)
+
+            position = int(rng.integers(len(candidates)))
+            candidates[position], candidates[-1] = candidates[-1], candidates[position]
+            target = candidates.pop()
+
+            u, v = self.nodes[source], self.nodes[target]
+            # it's not really a big deal which, but it might be possible to weight this by the utility of edges later
+            keys = list(self.graph[u][v])
+            key = keys[int(rng.integers(len(keys)))]
+            result.add_edge(u, v, key=key, **self.graph[u][v][key])
+
+            for index in (source, target):
+                degrees[index] = degrees.get(index, 0) + 1
+                if self.nodes[index] not in node_blacklist:
+                    tree.set(index, self._weight(degrees[index]))
+
+
 def _helper(
     result,
     graph,
     number_edges_remaining: int,
     node_blacklist: set[BaseEntity],
     invert_degrees: bool | None = None,
+    seed: int | np.random.Generator | None = None,
 ) -> None:
     """Help build a random graph.
 
+    This precomputes the adjacency of the graph on every call, so use :meth:`RandomSubgraphSampler.grow` to grow
+    many graphs from the same one.
+
     :type result: networkx.Graph
     :type graph: networkx.Graph
     """
-    original_node_count = graph.number_of_nodes()
-
-    logger.debug("adding remaining %d edges", number_edges_remaining)
-    for _ in range(number_edges_remaining):
-        source, possible_step_nodes, c = None, set(), 0
-        while not source or not possible_step_nodes:
-            source = get_random_node(result, node_blacklist, invert_degrees=invert_degrees)
-
-            c += 1
-            if c >= original_node_count:
-                logger.warning("infinite loop happening")
-                logger.warning("source: %s", source)
-                logger.warning("no grow: %s", node_blacklist)
-                return  # Happens when after exhausting the connected components. Try increasing the number seed edges
-
-            if source is None:
-                continue  # maybe do something else?
-
-            # Only keep targets in the original graph that aren't in the result graph
-            possible_step_nodes = set(graph[source]) - set(result[source])
-
-            if not possible_step_nodes:
-                node_blacklist.add(
-                    source,
-                )  # there aren't any possible nodes to step to, so try growing from somewhere else
-
-        step_node = random.choice(list(possible_step_nodes))
-
-        # it's not really a big deal which, but it might be possible to weight this by the utility of edges later
-        key, attr_dict = random.choice(list(graph[source][step_node].items()))
-
-        result.add_edge(source, step_node, key=key, **attr_dict)
+    sampler = RandomSubgraphSampler(graph, invert_degrees=invert_degrees)
+    sampler.grow(result, number_edges_remaining, node_blacklist=node_blacklist, rng=np.random.default_rng(seed))
 
 
 @transformation
@@ -169,7 +330,7 @@ def get_random_subgraph(
     graph: BELGraph,
     number_edges: int | None = None,
     number_seed_edges: int | None = None,
-    seed: int | None = None,
+    seed: int | np.random.Generator | None = None,
     invert_degrees: bool | None = None,
 ) -> BELGraph:
     """Generate a random subgraph based on weighted random walks from random seed edges.
@@ -179,43 +340,67 @@ def get_random_subgraph(
      :data:`pybel_tools.constants.SAMPLE_RANDOM_EDGE_COUNT` (250).
     :param number_seed_edges: Number of nodes to start with (which likely results in different components
      in large graphs). Defaults to :data:`SAMPLE_RANDOM_EDGE_SEED_COUNT` (5).
-    :param seed: A seed for the random state
+    :param seed: A seed for a :class:`numpy.random.Generator` local to this call, or the generator itself
     :param invert_degrees: Should the degrees be inverted? Defaults to true.
     """
-    if number_edges is None:
-        number_edges = SAMPLE_RANDOM_EDGE_COUNT
-
-    if number_seed_edges is None:
-        number_seed_edges = SAMPLE_RANDOM_EDGE_SEED_COUNT
-
-    if seed is not None:
-        random.seed(seed)
-
-    # Check if graph will sample full graph, and just return it if it would
-    if graph.number_of_edges() <= number_edges:
-        logger.info("sampled full graph")
-        return graph.copy()
-
     logger.debug(
-        "getting random sub-graph with %d seed edges, %d final edges, and seed=%s",
+        "getting random sub-graph with %s seed edges, %s final edges, and seed=%s",
         number_seed_edges,
         number_edges,
         seed,
     )
+    sampler = RandomSubgraphSampler(graph, invert_degrees=invert_degrees)
+    return sampler.sample(number_edges=number_edges, number_seed_edges=number_seed_edges, seed=seed)
 
-    # Get initial graph with `number_seed_edges` edges
-    result = get_graph_with_random_edges(graph, number_seed_edges)
 
-    number_edges_remaining = number_edges - result.number_of_edges()
-    _helper(
-        result,
-        graph,
-        number_edges_remaining,
-        node_blacklist=set(),  # This is the set of nodes that should no longer be chosen to grow from
-        invert_degrees=invert_degrees,
-    )
+#: The sampler used by worker processes in :func:`get_random_subgraphs`
+_WORKER_SAMPLER: RandomSubgraphSampler | None = None
+
+
+def _initialize_worker(graph: BELGraph, invert_degrees: bool | None) -> None:
+    global _WORKER_SAMPLER
+    _WORKER_SAMPLER = RandomSubgraphSampler(graph, invert_degrees=invert_degrees)
 
-    logger.debug("removing isolated nodes")
-    remove_isolated_nodes(result)
 
-    return result
+def _sample_in_worker(kwargs: Mapping[str, Any]) -> BELGraph:
+    return _WORKER_SAMPLER.sample(**kwargs)
+
+
+def get_random_subgraphs(
+    graph: BELGraph,
+    number_samples: int,
+    number_edges: int | None = None,
+    number_seed_edges: int | None = None,
+    seed: int | None = None,
+    invert_degrees: bool | None = None,
+    n_jobs: int | None = None,
+) -> list[BELGraph]:
+    """Generate many random subgraphs, e.g., for bootstrapping.
+
+    Each sample gets its own random number generator spawned from the seed, so the samples are the same regardless
+    of how many workers are used.
+
+    :param graph: A BEL graph
+    :param number_samples: The number of subgraphs to generate
+    :param number_edges: Maximum number of edges in each subgraph
+    :param number_seed_edges: Number of seed edges for each subgraph
+    :param seed: A seed for the random state
+    :param invert_degrees: Should the degrees be inverted? Defaults to true.
+    :param n_jobs: The number of worker processes. If none or 1, samples serially. Each worker gets the graph when it
+     starts (without copying it, where processes are forked) and precomputes its adjacency once.
+    """
+    kwargs_list = [
+        dict(number_edges=number_edges, number_seed_edges=number_seed_edges, seed=seed_sequence)
+        for seed_sequence in np.random.SeedSequence(seed).spawn(number_samples)
+    ]
+
+    if n_jobs is None or n_jobs == 1:
+        sampler = RandomSubgraphSampler(graph, invert_degrees=invert_degrees)
+        return [sampler.sample(**kwargs) for kwargs in kwargs_list]
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_initialize_worker,
+        initargs=(graph, invert_degrees),
+    ) as executor:
+        return list(executor.map(_sample_in_worker, kwargs_list))
@@ -4,11 +4,14 @@ import logging
 from collections.abc import Iterable
 
 from .utils import get_subgraph_by_edge_filter
+from ..utils import expand_by_edges
 from ...filters.edge_predicate_builders import (
     build_downstream_edge_predicate,
     build_upstream_edge_predicate,
 )
+from ...indexes import get_relation_index
 from ...pipeline import transformation
+from ....constants import RELATION_CLASS_CAUSAL
 from ....dsl import BaseEntity
 
 __all__ = [
@@ -26,7 +29,13 @@ def get_upstream_causal_subgraph(graph, nbunch: BaseEntity | Iterable[BaseEntity
     :type graph: pybel.BELGraph
     :rtype: pybel.BELGraph
     """
-    return get_subgraph_by_edge_filter(graph, build_upstream_edge_predicate(nbunch))
+    relation_index = get_relation_index(graph)
+    if relation_index is None:
+        return get_subgraph_by_edge_filter(graph, build_upstream_edge_predicate(nbunch))
+
+    rv = graph.child()
+    expand_by_edges(graph, rv, relation_index.iter_in_edges(set(nbunch), RELATION_CLASS_CAUSAL))
+    return rv
 
 
 @transformation
@@ -36,4 +45,10 @@ def get_downstream_causal_subgraph(graph, nbunch: BaseEntity | Iterable[BaseEnti
     :type graph: pybel.BELGraph
     :rtype: pybel.BELGraph
     """
-    return get_subgraph_by_edge_filter(graph, build_downstream_edge_predicate(nbunch))
+    relation_index = get_relation_index(graph)
+    if relation_index is None:
+        return get_subgraph_by_edge_filter(graph, build_downstream_edge_predicate(nbunch))
+
+    rv = graph.child()
+    expand_by_edges(graph, rv, relation_index.iter_out_edges(set(nbunch), RELATION_CLASS_CAUSAL))
+    return rv
@@ -10,7 +10,7 @@ from ...filters.node_filters import filter_nodes
 from ...filters.typing import EdgePredicates, NodePredicates
 from ...graph import BELGraph
 from ...operations import subgraph
-from ...pipeline import transformation
+from ...pipeline import register_edge_induction, transformation
 from ....dsl import BaseEntity
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
 ]
 
 
+@register_edge_induction(lambda graph, edge_predicates=None: edge_predicates)
 @transformation
 def get_subgraph_by_edge_filter(graph: BELGraph, edge_predicates: EdgePredicates | None = None) -> BELGraph:
     """Induce a sub-graph on all edges that pass the given filters.
@@ -70,6 +71,7 @@ def get_largest_component(graph: BELGraph) -> BELGraph:
     return subgraph(graph, biggest_component_nodes)
 
 
+@register_edge_induction(lambda graph: is_causal_relation)
 @transformation
 def get_causal_subgraph(graph: BELGraph) -> BELGraph:
     """Build a new sub-graph induced over the causal edges.
@@ -3,7 +3,7 @@
 import networkx as nx
 
 from ..filters.edge_filters import filter_edges
-from ..filters.typing import EdgePredicates
+from ..filters.typing import EdgeIterator, EdgePredicates
 from ..pipeline import (
     in_place_transformation,
     transformation,
@@ -13,6 +13,7 @@ from ..utils import update_metadata
 
 __all__ = [
     "expand_by_edge_filter",
+    "expand_by_edges",
     "remove_isolated_nodes",
     "remove_isolated_nodes_op",
 ]
@@ -57,3 +58,17 @@ def expand_by_edge_filter(source, target, edge_predicates: EdgePredicates):
 
     update_metadata(source, target)
     # TODO smarter ways of ensuring metadata
+
+
+def expand_by_edges(source, target, edges: EdgeIterator) -> None:
+    """Expand a target graph by the given edges from the source.
+
+    Unlike :func:`expand_by_edge_filter`, this is not registered as a pipeline function since the edges can not be
+    serialized with a pipeline.
+
+    :param pybel.BELGraph source: A BEL graph
+    :param pybel.BELGraph target: A BEL graph
+    :param edges: An iterable of (source node, target node, key) triples from the source graph
+    """
+    target.add_edges_from((u, v, k, source[u][v][k]) for u, v, k in edges)
+    update_metadata(source, target)
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import itertools as itt
 import logging
+from collections.abc import Callable, Iterable
+from functools import partial
 from itertools import chain
 
 from networkx import relabel_nodes
 
 from ..constants import ANNOTATIONS, CITATION, EVIDENCE, INCREASES, RELATION
 from ..dsl import BaseAbundance, BaseEntity, ListAbundance, Reaction
+from ..typing import EdgeData
 
 __all__ = [
+    "estimate_cartesian_expansion",
     "flatten_list_abundance",
+    "iter_cartesian_expansion",
     "list_abundance_cartesian_expansion",
     "reaction_cartesian_expansion",
 ]
@@ -38,54 +43,47 @@ def list_abundance_expansion(graph) -> None:
     relabel_nodes(graph, mapping, copy=False)
 
 
+#: An edge in an expanded network, before it is added to a graph. The last element is the data of the edge it was
+#: expanded from if the new edge should be qualified with the same citation, evidence, and annotations, or none if it
+#: should be unqualified.
+_ExpandedEdge = tuple[BaseEntity, BaseEntity, str, EdgeData | None]
+
+
 def list_abundance_cartesian_expansion(graph) -> None:
-    """Expand all list abundances to simple subject-predicate-object networks."""
-    for u, v, d in list(graph.edges(data=True)):
+    """Expand all list abundances to simple subject-predicate-object networks.
+
+    .. seealso:: :func:`iter_cartesian_expansion` for exporting the expanded network without modifying the graph
+    """
+    for u, v, relation, d in list(_iter_list_abundance_expansion(graph.edges(data=True))):
+        _add_expanded_edge(graph, u, v, relation, d)
+
+    _remove_list_abundance_nodes(graph)
+
+
+def _iter_list_abundance_expansion(edges: Iterable[tuple[BaseEntity, BaseEntity, EdgeData]]) -> Iterable[_ExpandedEdge]:
+    """Iterate over the edges made by expanding the list abundances in the given edges."""
+    for u, v, d in edges:
         if CITATION not in d:
             continue
 
         if isinstance(u, ListAbundance) and isinstance(v, ListAbundance):
             for u_member, v_member in itt.product(u.members, v.members):
-                graph.add_qualified_edge(
-                    u_member,
-                    v_member,
-                    relation=d[RELATION],
-                    citation=d.get(CITATION),
-                    evidence=d.get(EVIDENCE),
-                    annotations=d.get(ANNOTATIONS),
-                )
+                yield u_member, v_member, d[RELATION], d
 
         elif isinstance(u, ListAbundance):
             for member in u.members:
-                graph.add_qualified_edge(
-                    member,
-                    v,
-                    relation=d[RELATION],
-                    citation=d.get(CITATION),
-                    evidence=d.get(EVIDENCE),
-                    annotations=d.get(ANNOTATIONS),
-                )
+                yield member, v, d[RELATION], d
 
         elif isinstance(v, ListAbundance):
             for member in v.members:
-                graph.add_qualified_edge(
-                    u,
-                    member,
-                    relation=d[RELATION],
-                    citation=d.get(CITATION),
-                    evidence=d.get(EVIDENCE),
-                    annotations=d.get(ANNOTATIONS),
-                )
+                yield u, member, d[RELATION], d
 
-    _remove_list_abundance_nodes(graph)
 
+def _get_members(node: BaseEntity) -> list[BaseEntity]:
+    return node.members if isinstance(node, ListAbundance) else [node]
 
-def _reaction_cartesian_expansion_unqualified_helper(
-    graph,
-    u: BaseEntity,
-    v: BaseEntity,
-    d: dict,
-) -> None:
+
+def _iter_reaction_expansion_unqualified_helper(u: BaseEntity, v: BaseEntity, d: EdgeData) -> Iterable[_ExpandedEdge]:
     """Help deal with cartesian expansion in unqualified edges."""
     if isinstance(u, Reaction) and isinstance(v, Reaction):
         enzymes = _get_catalysts_in_reaction(u) | _get_catalysts_in_reaction(v)
@@ -94,17 +92,13 @@ def _reaction_cartesian_expansion_unqualified_helper(
             if reactant in enzymes or product in enzymes:
                 continue
 
-            graph.add_unqualified_edge(reactant, product, INCREASES)
+            yield reactant, product, INCREASES, None
 
         for product, reactant in itt.product(u.products, u.reactants):
             if reactant in enzymes or product in enzymes:
                 continue
 
-            graph.add_unqualified_edge(
-                product,
-                reactant,
-                d[RELATION],
-            )
+            yield product, reactant, d[RELATION], None
 
     elif isinstance(u, Reaction):
         enzymes = _get_catalysts_in_reaction(u)
@@ -117,9 +111,9 @@ def _reaction_cartesian_expansion_unqualified_helper(
             # Only add edge between v and reaction if the node is not part of the reaction
             # In practice skips hasReactant, hasProduct edges
             if v not in u.products and v not in u.reactants:
-                graph.add_unqualified_edge(product, v, INCREASES)
+                yield product, v, INCREASES, None
             for reactant in u.reactants:
-                graph.add_unqualified_edge(reactant, product, INCREASES)
+                yield reactant, product, INCREASES, None
 
     elif isinstance(v, Reaction):
         enzymes = _get_catalysts_in_reaction(v)
@@ -132,9 +126,9 @@ def _reaction_cartesian_expansion_unqualified_helper(
             # Only add edge between v and reaction if the node is not part of the reaction
             # In practice skips hasReactant, hasProduct edges
             if u not in v.products and u not in v.reactants:
-                graph.add_unqualified_edge(u, reactant, INCREASES)
+                yield u, reactant, INCREASES, None
             for product in v.products:
-                graph.add_unqualified_edge(reactant, product, INCREASES)
+                yield reactant, product, INCREASES, None
 
 
 def _get_catalysts_in_reaction(reaction: Reaction) -> set[BaseAbundance]:
@@ -144,11 +138,25 @@ def _get_catalysts_in_reaction(reaction: Reaction) -> set[BaseAbundance]:
 
 
 def reaction_cartesian_expansion(graph, accept_unqualified_edges: bool = True) -> None:
-    """Expand all reactions to simple subject-predicate-object networks."""
-    for u, v, d in list(graph.edges(data=True)):
+    """Expand all reactions to simple subject-predicate-object networks.
+
+    .. seealso:: :func:`iter_cartesian_expansion` for exporting the expanded network without modifying the graph
+    """
+    for u, v, relation, d in list(_iter_reaction_expansion(graph.edges(data=True), accept_unqualified_edges)):
+        _add_expanded_edge(graph, u, v, relation, d)
+
+    _remove_reaction_nodes(graph)
+
+
+def _iter_reaction_expansion(
+    edges: Iterable[tuple[BaseEntity, BaseEntity, EdgeData]],
+    accept_unqualified_edges: bool = True,
+) -> Iterable[_ExpandedEdge]:
+    """Iterate over the edges made by expanding the reactions in the given edges."""
+    for u, v, d in edges:
         # Deal with unqualified edges
         if CITATION not in d and accept_unqualified_edges:
-            _reaction_cartesian_expansion_unqualified_helper(graph, u, v, d)
+            yield from _iter_reaction_expansion_unqualified_helper(u, v, d)
             continue
 
         if isinstance(u, Reaction) and isinstance(v, Reaction):
@@ -160,26 +168,13 @@ def reaction_cartesian_expansion(graph, accept_unqualified_edges: bool = True) -
             ):
                 if reactant in catalysts or product in catalysts:
                     continue
-                graph.add_increases(
-                    reactant,
-                    product,
-                    citation=d.get(CITATION),
-                    evidence=d.get(EVIDENCE),
-                    annotations=d.get(ANNOTATIONS),
-                )
+                yield reactant, product, INCREASES, d
 
             for product, reactant in itt.product(u.products, u.reactants):
                 if reactant in catalysts or product in catalysts:
                     continue
 
-                graph.add_qualified_edge(
-                    product,
-                    reactant,
-                    relation=d[RELATION],
-                    citation=d.get(CITATION),
-                    evidence=d.get(EVIDENCE),
-                    annotations=d.get(ANNOTATIONS),
-                )
+                yield product, reactant, d[RELATION], d
 
         elif isinstance(u, Reaction):
             catalysts = _get_catalysts_in_reaction(u)
@@ -192,22 +187,10 @@ def reaction_cartesian_expansion(graph, accept_unqualified_edges: bool = True) -
                 # Only add edge between v and reaction if the node is not part of the reaction
                 # In practice skips hasReactant, hasProduct edges
                 if v not in u.products and v not in u.reactants:
-                    graph.add_increases(
-                        product,
-                        v,
-                        citation=d.get(CITATION),
-                        evidence=d.get(EVIDENCE),
-                        annotations=d.get(ANNOTATIONS),
-                    )
+                    yield product, v, INCREASES, d
 
                 for reactant in u.reactants:
-                    graph.add_increases(
-                        reactant,
-                        product,
-                        citation=d.get(CITATION),
-                        evidence=d.get(EVIDENCE),
-                        annotations=d.get(ANNOTATIONS),
-                    )
+                    yield reactant, product, INCREASES, d
 
         elif isinstance(v, Reaction):
             catalysts = _get_catalysts_in_reaction(v)
@@ -220,23 +203,138 @@ def reaction_cartesian_expansion(graph, accept_unqualified_edges: bool = True) -
                 # Only add edge between v and reaction if the node is not part of the reaction
                 # In practice skips hasReactant, hasProduct edges
                 if u not in v.products and u not in v.reactants:
-                    graph.add_increases(
-                        u,
-                        reactant,
-                        citation=d.get(CITATION),
-                        evidence=d.get(EVIDENCE),
-                        annotations=d.get(ANNOTATIONS),
-                    )
+                    yield u, reactant, INCREASES, d
                 for product in v.products:
-                    graph.add_increases(
-                        reactant,
-                        product,
-                        citation=d.get(CITATION),
-                        evidence=d.get(EVIDENCE),
-                        annotations=d.get(ANNOTATIONS),
-                    )
+                    yield reactant, product, INCREASES, d
 
-    _remove_reaction_nodes(graph)
+
+def _count_reaction_expansion(u: BaseEntity, v: BaseEntity) -> int:
+    """Count the edges made by expanding the reactions in the given edge, without enumerating them."""
+    if isinstance(u, Reaction) and isinstance(v, Reaction):
+        catalysts = _get_catalysts_in_reaction(u) | _get_catalysts_in_reaction(v)
+        u_reactants, u_products, v_reactants, v_products = (
+            sum(node not in catalysts for node in nodes) for nodes in (u.reactants, u.products, v.reactants, v.products)
+        )
+        return 2 * u_reactants * u_products + v_reactants * v_products
+
+    if isinstance(u, Reaction):
+        reaction, other, nodes, partners = u, v, u.products, u.reactants
+    elif isinstance(v, Reaction):
+        reaction, other, nodes, partners = v, u, v.reactants, v.products
+    else:
+        return 0
+
+    catalysts = _get_catalysts_in_reaction(reaction)
+    rv_per_node = len(partners) + (other not in reaction.products and other not in reaction.reactants)
+    return rv_per_node * sum(node not in catalysts for node in nodes)
+
+
+def _add_expanded_edge(graph, u: BaseEntity, v: BaseEntity, relation: str, d: EdgeData | None) -> None:
+    if d is None:
+        graph.add_unqualified_edge(u, v, relation)
+    else:
+        graph.add_qualified_edge(
+            u,
+            v,
+            relation=relation,
+            citation=d.get(CITATION),
+            evidence=d.get(EVIDENCE),
+            annotations=d.get(ANNOTATIONS),
+        )
+
+
+def _build_expanded_edge_data(relation: str, d: EdgeData | None) -> EdgeData:
+    """Build the data dictionary that :func:`_add_expanded_edge` would add to the graph."""
+    if d is None:
+        return {RELATION: relation}
+    rv = {
+        RELATION: relation,
+        EVIDENCE: d.get(EVIDENCE),
+        CITATION: d.get(CITATION),
+    }
+    if d.get(ANNOTATIONS):
+        rv[ANNOTATIONS] = d[ANNOTATIONS]
+    return rv
+
+
+def _iter_expanded_edges(
+    edges: Iterable[tuple[BaseEntity, BaseEntity, EdgeData]],
+    cls: type[BaseEntity],
+    expand: Callable[[Iterable[tuple[BaseEntity, BaseEntity, EdgeData]]], Iterable[_ExpandedEdge]],
+) -> Iterable[tuple[BaseEntity, BaseEntity, EdgeData]]:
+    """Stream the edges of the expanded network without the nodes of the given class, like the in-place expansions."""
+    for u, v, d in edges:
+        if not isinstance(u, cls) and not isinstance(v, cls):
+            yield u, v, d
+            continue
+        for source, target, relation, source_data in expand([(u, v, d)]):
+            if not isinstance(source, cls) and not isinstance(target, cls):
+                yield source, target, _build_expanded_edge_data(relation, source_data)
+
+
+def iter_cartesian_expansion(
+    graph,
+    *,
+    list_abundances: bool = True,
+    reactions: bool = True,
+    accept_unqualified_edges: bool = True,
+) -> Iterable[tuple[BaseEntity, BaseEntity, EdgeData]]:
+    """Iterate over the edges of the cartesian expansion of the graph without modifying it.
+
+    This yields the same edges as applying :func:`list_abundance_cartesian_expansion` and then
+    :func:`reaction_cartesian_expansion` to a copy of the graph, but never materializes the expanded network, so
+    large complexes and reactions can be exported with constant memory overhead. Unlike the graph, the stream is not
+    deduplicated, so an edge implied several times is yielded several times.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param list_abundances: Should list abundances (e.g., complexes) be expanded to their members?
+    :param reactions: Should reactions be expanded to their reactants and products?
+    :param accept_unqualified_edges: Should unqualified edges incident to reactions be expanded?
+    :return: An iterable of source node, target node, and edge data triples
+
+    .. seealso:: :func:`estimate_cartesian_expansion` for counting the edges ahead of time
+    """
+    rv = graph.edges(data=True)
+    if list_abundances:
+        rv = _iter_expanded_edges(rv, ListAbundance, _iter_list_abundance_expansion)
+    if reactions:
+        rv = _iter_expanded_edges(
+            rv, Reaction, partial(_iter_reaction_expansion, accept_unqualified_edges=accept_unqualified_edges)
+        )
+    return rv
+
+
+def estimate_cartesian_expansion(graph, *, list_abundances: bool = True, reactions: bool = True) -> int:
+    """Count the edges yielded by :func:`iter_cartesian_expansion` in time linear in the number of edges.
+
+    The count is exact for the stream except for the edges to nested list abundances, which are counted even though
+    they are skipped. Since the stream is not deduplicated, it is an upper bound on the number of edges in the graph
+    that the corresponding in-place expansions would produce. Whether unqualified edges are accepted does not change
+    the count.
+
+    :param pybel.BELGraph graph: A BEL graph
+    :param list_abundances: Should list abundances (e.g., complexes) be expanded to their members?
+    :param reactions: Should reactions be expanded to their reactants and products?
+    """
+    rv = 0
+    for u, v, d in graph.edges(data=True):
+        has_reaction = reactions and (isinstance(u, Reaction) or isinstance(v, Reaction))
+        if list_abundances and (isinstance(u, ListAbundance) or isinstance(v, ListAbundance)):
+            if CITATION not in d:
+                continue
+            if not has_reaction:
+                rv += len(_get_members(u)) * len(_get_members(v))
+                continue
+            # the other node is a reaction, so each of the edges to the members gets expanded again
+            rv += sum(
+                _count_reaction_expansion(source, target)
+                for source, target in itt.product(_get_members(u), _get_members(v))
+            )
+        elif has_reaction:
+            rv += _count_reaction_expansion(u, v)
+        else:
+            rv += 1
+    return rv
 
 
 def remove_reified_nodes(graph) -> None:
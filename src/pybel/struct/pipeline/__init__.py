@@ -1,8 +1,10 @@
 """This module assists in running complex workflows on BEL graphs."""
 
-from . import decorators, exc, pipeline
+from . import decorators, exc, pipeline, planner, trace
 from .decorators import *
 from .exc import *
 from .pipeline import *
+from .planner import *
+from .trace import *
 
 __all__ = [k for k in locals() if not k.startswith("_")]
@@ -5,6 +5,7 @@ A transformation function takes in a :class:`pybel.BELGraph` and either returns
 """
 
 import logging
+from functools import wraps
 from inspect import signature
 
 from .exc import MissingPipelineFunctionError, PipelineNameError
@@ -15,6 +16,9 @@ __all__ = [
     "in_place_transformation",
     "mapped",
     "no_arguments_map",
+    "register_edge_induction",
+    "register_edge_removal",
+    "register_node_removal",
     "transformation",
     "uni_in_place_transformation",
     "uni_transformation",
@@ -28,12 +32,45 @@ in_place_map = {}
 has_arguments_map = {}
 no_arguments_map = {}
 
+#: The kind of a transformation that induces a sub-graph over the edges passing some edge predicates
+EDGE_INDUCTION = "edge induction"
+#: The kind of a transformation that removes the edges passing some edge predicates
+EDGE_REMOVAL = "edge removal"
+#: The kind of a transformation that removes the nodes passing some node predicates
+NODE_REMOVAL = "node removal"
+
+#: A mapping from the names of transformations that filter nodes or edges to their kind and to a function that takes
+#: the graph and the transformation's arguments and returns the predicates it filters by. The pipeline planner fuses
+#: consecutive filter transformations into a single pass.
+filter_map = {}
+
 
 def _has_arguments(func, universe):
     sig = signature(func)
     return (universe and 3 <= len(sig.parameters)) or (not universe and 2 <= len(sig.parameters))
 
 
+def _clear_indexes_after(func, universe: bool):
+    """Wrap an in-place transformation so it drops the secondary indexes of the graph it modifies.
+
+    In-place transformations can edit the data of edges without adding or removing them, which the graph can not
+    notice on its own.
+    """
+    position = 1 if universe else 0
+    parameter = list(signature(func).parameters)[position]
+
+    @wraps(func)
+    def wrapped(*args, **kwargs):
+        rv = func(*args, **kwargs)
+        graph = args[position] if position < len(args) else kwargs[parameter]
+        clear_indexes = getattr(graph, "clear_indexes", None)
+        if clear_indexes is not None:
+            clear_indexes()
+        return rv
+
+    return wrapped
+
+
 def _register_function(name: str, func, universe: bool, in_place: bool):
     """Register a transformation function under the given name.
 
@@ -49,6 +86,9 @@ def _register_function(name: str, func, universe: bool, in_place: bool):
             f"{name} is already registered with {mapped_func.__module__}.{mapped_func.__name__}",
         )
 
+    if in_place:
+        func = _clear_indexes_after(func, universe)
+
     mapped[name] = func
 
     if universe:
@@ -93,6 +133,45 @@ uni_transformation = _build_register_function(universe=True, in_place=False)
 transformation = _build_register_function(universe=False, in_place=False)
 
 
+def _build_register_filter(kind: str):
+    """Build a decorator factory to tag transformation functions that filter nodes or edges.
+
+    :param kind: The kind of filter
+    """
+
+    def register_filter(get_predicates):
+        """Build a decorator to tag a transformation function as a filter.
+
+        :param get_predicates: A function that takes the graph and the same arguments as the transformation function,
+         and returns a predicate or list of predicates. Predicates must only depend on the node or edge they are given,
+         and not on the rest of the graph, since fused filters evaluate all predicates on the graph before any of
+         the filters are applied.
+        """
+
+        def register(func):
+            """Tag a transformation function as a filter.
+
+            :param func: A registered transformation function
+            :return: The same function
+            """
+            if func.__name__ not in mapped:
+                raise MissingPipelineFunctionError(f"{func.__name__} is not registered as a pipeline function")
+            filter_map[func.__name__] = kind, get_predicates
+            return func
+
+        return register
+
+    return register_filter
+
+
+#: A decorator factory for transformations that induce a sub-graph over the edges passing some edge predicates
+register_edge_induction = _build_register_filter(EDGE_INDUCTION)
+#: A decorator factory for in-place transformations that remove the edges passing some edge predicates
+register_edge_removal = _build_register_filter(EDGE_REMOVAL)
+#: A decorator factory for in-place transformations that remove the nodes passing some node predicates
+register_node_removal = _build_register_filter(NODE_REMOVAL)
+
+
 def get_transformation(name: str):
     """Get a transformation function and error if its name is not registered.
 
@@ -3,12 +3,15 @@
 import json
 import logging
 import types
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from functools import wraps
 from typing import Any, TextIO, Union
 
 from .decorators import get_transformation, in_place_map, mapped, universe_map
 from .exc import MetaValueError, MissingPipelineFunctionError, MissingUniverseError
+from .planner import FusedFilters, explain_protocol, format_entry, plan_protocol
+from .trace import Trace, trace_stage
 from ..operations import node_intersection, union
 
 __all__ = [
@@ -26,6 +29,20 @@ def _get_protocol_tuple(data: dict[str, Any]) -> tuple[str, list, dict]:
     return data["function"], data.get("args", []), data.get("kwargs", {})
 
 
+#: The pipeline, seed graph, and sub-protocols of a meta-entry used by worker processes in :meth:`Pipeline.run`
+_WORKER_STATE: tuple["Pipeline", Any, Sequence[Iterable[dict]], bool] | None = None
+
+
+def _initialize_worker(pipeline: "Pipeline", graph, protocols: Sequence[Iterable[dict]], optimize: bool) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = pipeline, graph, protocols, optimize
+
+
+def _run_branch_in_worker(index: int):
+    pipeline, graph, protocols, optimize = _WORKER_STATE
+    return pipeline._run_helper(graph.copy(), protocols[index], optimize=optimize)
+
+
 class Pipeline:
     """Build and runs analytical pipelines on BEL graphs.
 
@@ -160,47 +177,138 @@ class Pipeline:
 
         return self
 
-    def _run_helper(self, graph, protocol: Iterable[dict]):
+    def _run_helper(
+        self,
+        graph,
+        protocol: Iterable[dict],
+        optimize: bool = False,
+        n_jobs: int | None = None,
+        trace: Trace | None = None,
+    ):
         """Help run the protocol.
 
         :param pybel.BELGraph graph: A BEL graph
         :param protocol: The protocol to run, as JSON
+        :param optimize: Should consecutive filters be fused with :func:`plan_protocol`?
+        :param n_jobs: The number of worker processes for running the pipelines of meta-entries
+        :param trace: A trace in which each entry is measured
         :rtype: pybel.BELGraph
         """
         result = graph
 
-        for entry in protocol:
+        for entry in plan_protocol(protocol) if optimize else protocol:
+            if isinstance(entry, FusedFilters):
+                name = f"single pass over {len(entry.entries)} filters"
+                with trace_stage(trace, name, result, args=[format_entry(step) for step in entry.entries]) as stage:
+                    result = entry.run(result)
+                    stage.set_output(result)
+                continue
+
             meta_entry = entry.get("meta")
 
             if meta_entry is None:
                 name, args, kwargs = _get_protocol_tuple(entry)
                 func = self._get_function(name)
-                result = func(result, *args, **kwargs)
+                with trace_stage(trace, name, result, args=args, kwargs=kwargs) as stage:
+                    result = func(result, *args, **kwargs)
+                    stage.set_output(result)
             else:
-                networks = (self._run_helper(graph, subprotocol) for subprotocol in entry["pipelines"])
+                with trace_stage(trace, meta_entry, graph) as stage:
+                    networks = self._run_branches(
+                        graph, entry["pipelines"], optimize=optimize, n_jobs=n_jobs, trace=trace
+                    )
 
-                if meta_entry == META_UNION:
-                    result = union(networks)
+                    if meta_entry == META_UNION:
+                        result = union(networks)
 
-                elif meta_entry == META_INTERSECTION:
-                    result = node_intersection(networks)
+                    elif meta_entry == META_INTERSECTION:
+                        result = node_intersection(networks)
 
-                else:
-                    raise MetaValueError(f"invalid meta-command: {meta_entry}")
+                    else:
+                        raise MetaValueError(f"invalid meta-command: {meta_entry}")
+
+                    stage.set_output(result)
 
         return result
 
-    def run(self, graph, universe=None):
+    def _run_branches(
+        self,
+        graph,
+        protocols: Sequence[Iterable[dict]],
+        optimize: bool,
+        n_jobs: int | None,
+        trace: Trace | None = None,
+    ):
+        """Run each of the pipelines of a meta-entry on its own copy of the graph.
+
+        The results are in the same order as the pipelines, regardless of how many workers are used. Worker processes
+        get the universe and the graph when they start (without copying them, where processes are forked) and only
+        send back their results.
+
+        :param pybel.BELGraph graph: A BEL graph
+        :param protocols: The protocols of the pipelines
+        :param optimize: Should consecutive filters be fused with :func:`plan_protocol`?
+        :param n_jobs: The number of worker processes. If none or 1, runs the pipelines serially.
+        :param trace: A trace in which each pipeline is measured. Entries run in worker processes are not.
+        :rtype: list[pybel.BELGraph]
+        """
+        if n_jobs is None or n_jobs == 1 or len(protocols) < 2:
+            rv = []
+            for number, protocol in enumerate(protocols, start=1):
+                with trace_stage(trace, f"pipeline {number}", graph) as stage:
+                    rv.append(self._run_helper(graph.copy(), protocol, optimize=optimize, n_jobs=n_jobs, trace=trace))
+                    stage.set_output(rv[-1])
+            return rv
+
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(protocols)),
+            initializer=_initialize_worker,
+            initargs=(self, graph, protocols, optimize),
+        ) as executor:
+            return list(executor.map(_run_branch_in_worker, range(len(protocols))))
+
+    def run(
+        self,
+        graph,
+        universe=None,
+        optimize: bool = False,
+        n_jobs: int | None = None,
+        trace: Trace | None = None,
+    ):
         """Run the contained protocol on a seed graph.
 
         :param pybel.BELGraph graph: The seed BEL graph
         :param pybel.BELGraph universe: Allows just-in-time setting of the universe in case it wasn't set before.
                                         Defaults to the given network.
+        :param optimize: Should runs of consecutive filters be applied in a single pass? See :meth:`explain`. The
+         predicates of fused filters are all evaluated on the graph as it was before the run, so this gives the same
+         graph only if the predicates given to filters like ``remove_filtered_edges`` and
+         ``get_subgraph_by_edge_filter`` depend only on the node or edge they are given, and not on the rest of
+         the graph.
+        :param n_jobs: The number of worker processes for running the pipelines of a union or intersection
+         concurrently. If none or 1, runs them serially. The result is the same regardless. Where processes are not
+         forked, the pipeline and its arguments have to be picklable and its functions have to be registered on import.
+        :param trace: A trace in which the time, peak memory, and input and output sizes of each entry are recorded
         :return: The new graph is returned if not applied in-place
         :rtype: pybel.BELGraph
         """
         self.universe = universe or graph.copy()
-        return self._run_helper(graph.copy(), self.protocol)
+        return self._run_helper(graph.copy(), self.protocol, optimize=optimize, n_jobs=n_jobs, trace=trace)
+
+    def explain(self, optimize: bool = False) -> str:
+        """Describe how this pipeline is run, including which filters are fused into a single pass.
+
+        :param optimize: Should the description be of the optimized plan, as run with ``optimize=True``?
+
+        >>> from pybel.struct.pipeline import Pipeline
+        >>> pipeline = Pipeline.from_functions(["remove_associations", "remove_pathologies", "get_largest_component"])
+        >>> print(pipeline.explain(optimize=True))
+        1. single pass over 2 filters:
+           - remove_associations() [edge removal]
+           - remove_pathologies() [node removal]
+        2. get_largest_component()
+        """
+        return "\n".join(explain_protocol(self.protocol, optimize=optimize))
 
     def __call__(self, graph, universe=None):
         """Call :meth:`Pipeline.run`.
@@ -0,0 +1,192 @@
+"""Planning for pipelines.
+
+Most filter transformations make a full pass over the graph, and the ones that induce sub-graphs also allocate a new
+graph, so a pipeline of several filters pays for several passes and copies. The planner finds runs of consecutive
+transformations that were registered as filters with :func:`pybel.struct.pipeline.register_edge_induction`,
+:func:`pybel.struct.pipeline.register_edge_removal`, or :func:`pybel.struct.pipeline.register_node_removal` and runs
+each of them as a single pass that gives the same graph as running them one after another.
+
+Other transformations are barriers that filters are never moved across, since they can depend on or add back the
+nodes and edges that a filter removes (e.g., expansions from the universe).
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from .decorators import EDGE_INDUCTION, EDGE_REMOVAL, NODE_REMOVAL, filter_map
+from ..filters.edge_filters import and_edge_predicates
+from ..filters.expressions import get_edge_data_predicate
+from ..filters.node_predicates import concatenate_node_predicates
+
+__all__ = [
+    "FusedFilters",
+    "plan_protocol",
+    "explain_protocol",
+    "format_entry",
+]
+
+
+class FusedFilters:
+    """A run of consecutive filter transformations in a protocol that are applied in a single pass."""
+
+    def __init__(self, entries: Sequence[Mapping[str, Any]]) -> None:
+        """Initialize the fused filters.
+
+        :param entries: The protocol entries of filter transformations, in order
+        """
+        self.entries = list(entries)
+
+    def __repr__(self) -> str:
+        return f"FusedFilters({[entry['function'] for entry in self.entries]})"
+
+    def run(self, graph):
+        """Apply the filters to the graph.
+
+        Returns the same graph, modified in place, if there are only removals, or a new graph if there is an
+        induction, like the filters do when run one after another.
+
+        :param pybel.BELGraph graph: A BEL graph
+        :rtype: pybel.BELGraph
+        """
+        stages = []
+        for entry in self.entries:
+            kind, get_predicates = filter_map[entry["function"]]
+            predicates = get_predicates(graph, *entry.get("args", []), **entry.get("kwargs", {}))
+            if kind == NODE_REMOVAL:
+                stages.append((kind, concatenate_node_predicates(predicates)))
+            else:
+                stages.append((kind, get_edge_data_predicate(and_edge_predicates(predicates))))
+        return _run_fused_stages(graph, stages)
+
+
+def _run_fused_stages(graph, stages):
+    """Apply a sequence of node removals, edge removals, and edge inductions to the graph in a single pass.
+
+    Node predicates take the graph and a node. Edge predicates take the graph, source, target, key, and data
+    dictionary, like the ones from :func:`pybel.struct.filters.expressions.get_edge_data_predicate`.
+    """
+    node_stages = [(i, predicate) for i, (kind, predicate) in enumerate(stages) if kind == NODE_REMOVAL]
+    last_induction = max((i for i, (kind, _) in enumerate(stages) if kind == EDGE_INDUCTION), default=None)
+
+    # Find the stage at which each removed node is removed. Since node predicates only depend on the node, they
+    # can all be evaluated on the input graph.
+    node_removed_at = {}
+    if node_stages:
+        for node in graph:
+            for i, predicate in node_stages:
+                if predicate(graph, node):
+                    node_removed_at[node] = i
+                    break
+
+    # Find the edges that make it through all stages, and the nodes kept by the last induction. Nodes are looked up
+    # by identity since hashing a BEL node requires serializing it.
+    node_removed_at_by_id = {id(node): i for node, i in node_removed_at.items()}
+    kept_edges = []
+    dead_edges = []
+    induced_nodes = {}
+    for u, v, k, data in graph.edges(keys=True, data=True):
+        end_removed_at = min(
+            node_removed_at_by_id.get(id(u), math.inf),
+            node_removed_at_by_id.get(id(v), math.inf),
+        )
+        died_at = math.inf
+        for i, (kind, predicate) in enumerate(stages):
+            if end_removed_at <= i:
+                died_at = end_removed_at
+                break
+            if kind == EDGE_INDUCTION and not predicate(graph, u, v, k, data):
+                died_at = i
+                break
+            if kind == EDGE_REMOVAL and predicate(graph, u, v, k, data):
+                died_at = i
+                break
+
+        if last_induction is not None and last_induction < died_at:
+            induced_nodes[id(u)] = u
+            induced_nodes[id(v)] = v
+        if died_at == math.inf:
+            kept_edges.append((u, v, k, data))
+        elif end_removed_at == math.inf:
+            dead_edges.append((u, v, k))
+
+    if last_induction is None:
+        graph.remove_nodes_from(node_removed_at)
+        graph.remove_edges_from(dead_edges)
+        return graph
+
+    rv = graph.child()
+    rv.add_edges_from(kept_edges)
+    # nodes whose edges were all removed after the last induction stay in the graph
+    rv.add_nodes_from(node for node in induced_nodes.values() if id(node) not in node_removed_at_by_id)
+    return rv
+
+
+def plan_protocol(protocol: Iterable[Mapping[str, Any]]) -> list[Mapping[str, Any] | FusedFilters]:
+    """Plan the execution of a protocol by fusing runs of consecutive filter transformations.
+
+    Meta-entries are kept as they are and their sub-protocols are planned when they are run.
+
+    :param protocol: A pipeline's protocol
+    :return: A list containing the protocol entries that are run as they are, and the fused filters
+    """
+    rv = []
+    run = []
+
+    def _flush():
+        if len(run) == 1:
+            rv.append(run[0])
+        elif run:
+            rv.append(FusedFilters(run))
+        run.clear()
+
+    for entry in protocol:
+        if entry.get("meta") is None and entry["function"] in filter_map:
+            run.append(entry)
+        else:
+            _flush()
+            rv.append(entry)
+    _flush()
+
+    return rv
+
+
+def format_entry(entry: Mapping[str, Any]) -> str:
+    """Format a protocol entry like a function call."""
+    arguments = [_format_argument(arg) for arg in entry.get("args", [])]
+    arguments.extend(f"{key}={_format_argument(value)}" for key, value in entry.get("kwargs", {}).items())
+    return f"{entry['function']}({', '.join(arguments)})"
+
+
+def _format_argument(value) -> str:
+    name = getattr(value, "__name__", None)
+    return name if callable(value) and name is not None else repr(value)
+
+
+def explain_protocol(protocol: Iterable[Mapping[str, Any]], optimize: bool = True, indent: str = "") -> list[str]:
+    """Describe how a protocol is run.
+
+    :param protocol: A pipeline's protocol
+    :param optimize: Should the protocol be planned with :func:`plan_protocol`?
+    :param indent: A prefix for each line
+    :return: A list of lines
+    """
+    rv = []
+    steps = plan_protocol(protocol) if optimize else list(protocol)
+    for number, step in enumerate(steps, start=1):
+        prefix = f"{indent}{number}. "
+        if isinstance(step, FusedFilters):
+            rv.append(f"{prefix}single pass over {len(step.entries)} filters:")
+            for entry in step.entries:
+                kind, _ = filter_map[entry["function"]]
+                rv.append(f"{indent}   - {format_entry(entry)} [{kind}]")
+        elif step.get("meta") is not None:
+            rv.append(f"{prefix}{step['meta']} of {len(step['pipelines'])} pipelines:")
+            for subnumber, subprotocol in enumerate(step["pipelines"], start=1):
+                rv.append(f"{indent}   pipeline {subnumber}:")
+                rv.extend(explain_protocol(subprotocol, optimize=optimize, indent=indent + "      "))
+        else:
+            rv.append(f"{prefix}{format_entry(step)}")
+    return rv
@@ -0,0 +1,214 @@
+"""Instrumentation for the stages of pipelines and queries.
+
+A :class:`Trace` can be passed to :meth:`pybel.struct.pipeline.Pipeline.run`,
+:meth:`pybel.struct.query.Seeding.run`, and :meth:`pybel.struct.query.Query.run` to record how long each stage took,
+how much memory it used at its peak, and how big the graphs going into and coming out of it were.
+
+>>> from pybel.examples import egf_graph
+>>> from pybel.struct.pipeline import Pipeline, Trace
+>>> trace = Trace()
+>>> result = Pipeline.from_functions(["remove_associations", "get_largest_component"]).run(egf_graph, trace=trace)
+>>> print(trace.to_table())  # doctest: +SKIP
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Any, ContextManager
+
+from tabulate import tabulate
+
+__all__ = [
+    "Trace",
+    "TraceStage",
+]
+
+
+def _to_json_value(value):
+    """Convert arguments to JSON, naming functions and describing anything else that can not be serialized."""
+    return json.loads(json.dumps(value, default=lambda v: getattr(v, "__name__", None) or repr(v)))
+
+
+@dataclass
+class TraceStage:
+    """The measurements of a single stage."""
+
+    #: The name of the function or seeding method
+    name: str
+    args: Sequence[Any] = field(default_factory=list)
+    kwargs: Mapping[str, Any] = field(default_factory=dict)
+    #: The wall time in seconds
+    seconds: float | None = None
+    #: The peak memory allocated while running the stage, in bytes, if memory was tracked
+    memory: int | None = None
+    input_nodes: int | None = None
+    input_edges: int | None = None
+    output_nodes: int | None = None
+    output_edges: int | None = None
+    #: The stages run as part of this one, like the pipelines of a union
+    stages: list[TraceStage] = field(default_factory=list)
+
+    def set_input(self, graph) -> None:
+        """Record the size of the graph going into the stage."""
+        if graph is not None:
+            self.input_nodes, self.input_edges = graph.number_of_nodes(), graph.number_of_edges()
+
+    def set_output(self, graph) -> None:
+        """Record the size of the graph coming out of the stage."""
+        if graph is not None:
+            self.output_nodes, self.output_edges = graph.number_of_nodes(), graph.number_of_edges()
+
+    def to_json(self) -> dict[str, Any]:
+        """Return this stage as a JSON object."""
+        rv = {
+            "name": self.name,
+            "args": _to_json_value(list(self.args)),
+            "kwargs": _to_json_value(dict(self.kwargs)),
+            "seconds": self.seconds,
+            "memory": self.memory,
+            "input_nodes": self.input_nodes,
+            "input_edges": self.input_edges,
+            "output_nodes": self.output_nodes,
+            "output_edges": self.output_edges,
+        }
+        if self.stages:
+            rv["stages"] = [stage.to_json() for stage in self.stages]
+        return rv
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any]) -> TraceStage:
+        """Load a stage from a JSON object."""
+        data = dict(data)
+        stages = [cls.from_json(stage) for stage in data.pop("stages", [])]
+        return cls(stages=stages, **data)
+
+
+class Trace:
+    """A record of the stages that were run, in the order they finished running."""
+
+    def __init__(self, track_memory: bool = True) -> None:
+        """Initialize an empty trace.
+
+        :param track_memory: Should the peak memory of each stage be measured with :mod:`tracemalloc`? This slows
+         down allocation-heavy stages, so turn it off if only the timings are needed.
+        """
+        self.track_memory = track_memory
+        self.stages: list[TraceStage] = []
+        # the stages being run and the highest peak memory seen by each of them, from outermost to innermost
+        self._running: list[tuple[TraceStage, int, list[int]]] = []
+        self._started_tracemalloc = False
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    def __iter__(self) -> Iterator[TraceStage]:
+        return iter(self.stages)
+
+    @contextmanager
+    def stage(self, name: str, graph=None, args=None, kwargs=None) -> Iterator[TraceStage]:
+        """Measure a stage.
+
+        :param name: The name of the function or seeding method
+        :param graph: The graph going into the stage
+        :param args: The positional arguments of the stage
+        :param kwargs: The keyword arguments of the stage
+        :return: A context manager giving the :class:`TraceStage`, on which the output graph should be set with
+         :meth:`TraceStage.set_output`. Stages started inside of it are recorded as its children.
+        """
+        stage = TraceStage(name=name, args=list(args or []), kwargs=dict(kwargs or {}))
+        stage.set_input(graph)
+
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            if self._running:
+                # resetting the peak below would lose the enclosing stage's peak so far
+                self._running[-1][2].append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            memory_start = tracemalloc.get_traced_memory()[0]
+        else:
+            memory_start = 0
+
+        parent = self._running[-1][0] if self._running else None
+        self._running.append((stage, memory_start, []))
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - start
+            _, _, peaks = self._running.pop()
+            if self.track_memory:
+                peak = max([tracemalloc.get_traced_memory()[1], *peaks])
+                stage.memory = peak - memory_start
+                if self._running:
+                    self._running[-1][2].append(peak)
+                elif self._started_tracemalloc:
+                    tracemalloc.stop()
+                    self._started_tracemalloc = False
+            (parent.stages if parent is not None else self.stages).append(stage)
+
+    def to_json(self) -> list[dict[str, Any]]:
+        """Return this trace as a JSON list, e.g., to store next to :meth:`pybel.struct.query.Query.to_json`."""
+        return [stage.to_json() for stage in self.stages]
+
+    @classmethod
+    def from_json(cls, data: Sequence[Mapping[str, Any]]) -> Trace:
+        """Load a trace from a JSON list."""
+        rv = cls()
+        rv.stages = [TraceStage.from_json(stage) for stage in data]
+        return rv
+
+    def _iter_rows(self, stages: Sequence[TraceStage], depth: int = 0, max_width: int = 40) -> Iterator[list]:
+        for stage in stages:
+            arguments = ", ".join(
+                [_format_argument(arg) for arg in _to_json_value(list(stage.args))]
+                + [f"{key}={_format_argument(value)}" for key, value in _to_json_value(dict(stage.kwargs)).items()]
+            )
+            if len(arguments) > max_width:
+                arguments = arguments[: max_width - 3] + "..."
+            yield [
+                "| " * depth + stage.name,
+                arguments,
+                stage.seconds,
+                None if stage.memory is None else stage.memory / 2**20,
+                _format_size(stage.input_nodes, stage.input_edges),
+                _format_size(stage.output_nodes, stage.output_edges),
+            ]
+            yield from self._iter_rows(stage.stages, depth=depth + 1, max_width=max_width)
+
+    def to_table(self, max_width: int = 40, **kwargs) -> str:
+        """Render this trace as a table with :func:`tabulate.tabulate`.
+
+        :param max_width: The number of characters after which arguments are cut off
+        :param kwargs: Keyword arguments to pass to :func:`tabulate.tabulate`
+        """
+        kwargs.setdefault("floatfmt", ".3f")
+        return tabulate(
+            list(self._iter_rows(self.stages, max_width=max_width)),
+            headers=["Stage", "Arguments", "Seconds", "Peak MiB", "Input (nodes/edges)", "Output (nodes/edges)"],
+            **kwargs,
+        )
+
+
+def _format_argument(value) -> str:
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _format_size(nodes: int | None, edges: int | None) -> str:
+    return "" if nodes is None else f"{nodes}/{edges}"
+
+
+def trace_stage(trace: Trace | None, name: str, graph=None, args=None, kwargs=None) -> ContextManager[TraceStage]:
+    """Measure a stage with the trace, if one is given.
+
+    :return: A context manager giving a :class:`TraceStage`, which is thrown away if there is no trace
+    """
+    if trace is None:
+        return nullcontext(TraceStage(name=name))
+    return trace.stage(name, graph=graph, args=args, kwargs=kwargs)
@@ -1,5 +1,6 @@
 """Query builder for PyBEL."""
 
+from .cache import DirectoryQueryCache, MemoryQueryCache, QueryCache
 from .exc import *
 from .query import Query
 from .seeding import SEED_DATA, SEED_METHOD, Seeding
@@ -0,0 +1,277 @@
+"""Caches for the results of queries.
+
+The result of a query only depends on its JSON representation and on the contents of the networks it runs over.
+Networks are never modified in place once they have been stored, so results are keyed by a hash of the canonical
+query JSON together with the identifiers and upload timestamps of the query's networks. A network that is dropped and
+uploaded again therefore never gets the results computed from its previous version.
+
+Results are stored as pickles, so each hit returns a fresh graph that can be modified without corrupting the cache.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+from ..graph import BELGraph
+
+__all__ = [
+    "DirectoryQueryCache",
+    "MemoryQueryCache",
+    "QueryCache",
+    "get_query_cache_key",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def get_query_cache_key(query_json: Mapping[str, Any], timestamps: Mapping[int, datetime.datetime]) -> str:
+    """Get the key for the results of a query.
+
+    :param query_json: The JSON representation of the query, from :meth:`pybel.struct.query.Query.to_json`
+    :param timestamps: A mapping from the identifiers of the query's networks to their upload timestamps
+    :return: A hexadecimal SHA-256 digest
+    """
+    network_ids = sorted(set(query_json.get("network_ids", [])))
+    payload = {
+        "query": query_json,
+        "networks": [
+            [network_id, timestamps[network_id].isoformat() if network_id in timestamps else None]
+            for network_id in network_ids
+        ],
+    }
+    s = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+class QueryCache(ABC):
+    """A thread-safe cache for the results of queries with size-based eviction and hit/miss metrics."""
+
+    def __init__(self, max_size: int | None = None) -> None:
+        """Initialize the cache.
+
+        :param max_size: The maximum total size of the pickled results in bytes. If none, results are not evicted
+         by size. Results bigger than this on their own are not cached.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> BELGraph | None:
+        """Get the result stored under the key, or none if it is missing."""
+        with self._lock:
+            data = self._get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return pickle.loads(data)
+
+    def set(self, key: str, graph: BELGraph) -> None:
+        """Store the result under the key, evicting the least recently used results if the cache is full."""
+        data = pickle.dumps(graph, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.max_size is not None and self.max_size < len(data):
+            logger.debug("not caching query result %s of %d bytes", key, len(data))
+            return
+        with self._lock:
+            self._set(key, data)
+            self.evictions += self._evict()
+
+    @abstractmethod
+    def _get(self, key: str) -> bytes | None:
+        """Get the pickled result stored under the key and mark it as recently used."""
+
+    @abstractmethod
+    def _set(self, key: str, data: bytes) -> None:
+        """Store the pickled result under the key."""
+
+    @abstractmethod
+    def _evict(self) -> int:
+        """Evict the least recently used results until the cache fits its limits and return how many were."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all results from the cache."""
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """The total size of the pickled results in bytes."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Count the results in the cache."""
+
+    def get_stats(self) -> Mapping[str, Any]:
+        """Get the metrics of this cache."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self),
+                "size": self.size,
+                "max_size": self.max_size,
+            }
+
+
+class MemoryQueryCache(QueryCache):
+    """An in-memory least recently used cache for the results of queries."""
+
+    def __init__(self, max_size: int | None = None, max_entries: int | None = 128) -> None:
+        """Initialize the cache.
+
+        :param max_size: The maximum total size of the pickled results in bytes
+        :param max_entries: The maximum number of results. If none, results are not evicted by number.
+        """
+        super().__init__(max_size=max_size)
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    def _get(self, key: str) -> bytes | None:
+        data = self._data.get(key)
+        if data is not None:
+            self._data.move_to_end(key)
+        return data
+
+    def _set(self, key: str, data: bytes) -> None:
+        old = self._data.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._data[key] = data
+        self._size += len(data)
+
+    def _is_full(self) -> bool:
+        return (self.max_size is not None and self.max_size < self._size) or (
+            self.max_entries is not None and self.max_entries < len(self._data)
+        )
+
+    def _evict(self) -> int:
+        rv = 0
+        while self._data and self._is_full():
+            _, data = self._data.popitem(last=False)
+            self._size -= len(data)
+            rv += 1
+        return rv
+
+    def clear(self) -> None:
+        """Remove all results from the cache."""
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The total size of the pickled results in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        """Count the results in the cache."""
+        return len(self._data)
+
+
+class DirectoryQueryCache(QueryCache):
+    """A cache that stores the results of queries as pickles in a directory.
+
+    Files are written atomically and their modification times track when they were last used, so several processes
+    can share the same directory. Eviction removes the least recently used files.
+    """
+
+    suffix = ".bel.pickle"
+
+    def __init__(self, directory: str, max_size: int | None = None) -> None:
+        """Initialize the cache.
+
+        :param directory: The directory in which results are stored. Is created if it does not exist.
+        :param max_size: The maximum total size of the pickled results in bytes
+        """
+        super().__init__(max_size=max_size)
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _iter_entries(self) -> list[tuple[float, int, str]]:
+        """Get the modification time, size, and path of each result."""
+        rv = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.suffix):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # removed by another process
+                continue
+            rv.append((stat.st_mtime, stat.st_size, entry.path))
+        return rv
+
+    def _get(self, key: str) -> bytes | None:
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _set(self, key: str, data: bytes) -> None:
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, self._get_path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _evict(self) -> int:
+        if self.max_size is None:
+            return 0
+        entries = sorted(self._iter_entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        rv = 0
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # removed by another process
+                pass
+            else:
+                rv += 1
+            size -= entry_size
+        return rv
+
+    def clear(self) -> None:
+        """Remove all results from the cache."""
+        with self._lock:
+            for _, _, path in self._iter_entries():
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    @property
+    def size(self) -> int:
+        """The total size of the pickled results in bytes."""
+        return sum(entry_size for _, entry_size, _ in self._iter_entries())
+
+    def __len__(self) -> int:
+        """Count the results in the cache."""
+        return len(self._iter_entries())
@@ -3,6 +3,7 @@
 __all__ = [
     "NodeDegreeIterError",
     "QueryMissingNetworksError",
+    "SeedingSizeError",
 ]
 
 
@@ -12,3 +13,7 @@ class QueryMissingNetworksError(KeyError):
 
 class NodeDegreeIterError(ValueError):
     """Raised when failing to iterate over node degrees."""
+
+
+class SeedingSizeError(ValueError):
+    """Raised when seeding gives a graph that is bigger than allowed."""
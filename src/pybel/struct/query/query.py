@@ -5,9 +5,11 @@ import logging
 from collections.abc import Iterable, Mapping
 from typing import TextIO
 
+from .cache import QueryCache, get_query_cache_key
 from .exc import QueryMissingNetworksError
 from .seeding import Seeding
 from ..pipeline import Pipeline
+from ..pipeline.trace import Trace, trace_stage
 from ...dsl import BaseEntity
 
 __all__ = [
@@ -100,23 +102,78 @@ class Query:
         """
         return self.pipeline.append(name, *args, **kwargs)
 
-    def __call__(self, manager):
+    def __call__(
+        self,
+        manager,
+        cache: QueryCache | None = None,
+        trace: Trace | None = None,
+        n_jobs: int | None = None,
+    ):
         """Run this query and returns the resulting BEL graph with :meth:`Query.run`.
 
         :param pybel.manager.Manager manager: A cache manager
+        :param cache: A cache for the results of queries
+        :param trace: A trace in which each stage of the query is measured
+        :param n_jobs: The number of worker processes for seeding and for the pipelines of meta-entries
         :rtype: Optional[pybel.BELGraph]
         """
-        return self.run(manager)
+        return self.run(manager, cache=cache, trace=trace, n_jobs=n_jobs)
 
-    def run(self, manager):
+    def run(
+        self,
+        manager,
+        cache: QueryCache | None = None,
+        trace: Trace | None = None,
+        n_jobs: int | None = None,
+    ):
         """Run this query and returns the resulting BEL graph.
 
         :param manager: A cache manager
+        :param cache: A cache for the results of queries. If given, the result is looked up by
+         :meth:`get_cache_key` before the universe is built and stored afterwards.
+        :param trace: A trace in which the time, peak memory, and input and output sizes of building the universe,
+         each seeding method, and each pipeline entry are recorded. It can be stored as JSON next to
+         :meth:`to_json` with :meth:`pybel.struct.pipeline.Trace.to_json`.
+        :param n_jobs: The number of worker processes with which the seeding methods, and the pipelines of unions and
+         intersections, are run concurrently. See :meth:`Seeding.run` and :meth:`pybel.struct.pipeline.Pipeline.run`.
         :rtype: Optional[pybel.BELGraph]
         """
-        universe = self._get_universe(manager)
-        graph = self.seeding.run(universe)
-        return self.pipeline.run(graph, universe=universe)
+        if cache is None:
+            return self._run(manager, trace=trace, n_jobs=n_jobs)
+
+        with trace_stage(trace, "cache lookup") as stage:
+            key = self.get_cache_key(manager)
+            rv = cache.get(key)
+            stage.set_output(rv)
+        if rv is not None:
+            logger.debug("query result cache hit: %s", key)
+            return rv
+
+        rv = self._run(manager, trace=trace, n_jobs=n_jobs)
+        if rv is not None:
+            cache.set(key, rv)
+        return rv
+
+    def _run(self, manager, trace: Trace | None = None, n_jobs: int | None = None):
+        with trace_stage(trace, "universe", args=self.network_ids) as stage:
+            universe = self._get_universe(manager)
+            stage.set_output(universe)
+        graph = self.seeding.run(universe, trace=trace, n_jobs=n_jobs)
+        return self.pipeline.run(graph, universe=universe, trace=trace, n_jobs=n_jobs)
+
+    def get_cache_key(self, manager) -> str:
+        """Get the key for the result of this query in a :class:`pybel.struct.query.cache.QueryCache`.
+
+        The key changes if the query or any of its networks change. Only the upload timestamps of the networks
+        are looked up, so this is cheap even for large networks.
+
+        :param manager: A cache manager
+        :raises: QueryMissingNetworksError
+        """
+        if not self.network_ids:
+            raise QueryMissingNetworksError("can not run query without network identifiers")
+        timestamps = manager.get_network_timestamps(self.network_ids)
+        return get_query_cache_key(self.to_json(), timestamps)
 
     def _get_universe(self, manager):
         if not self.network_ids:
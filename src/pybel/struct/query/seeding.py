@@ -4,17 +4,28 @@ import json
 import logging
 import random
 from collections import UserList
+from collections.abc import Iterable, Mapping
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from typing import Any, TextIO, Union
 
 from .constants import (
+    NODE_SEED_TYPES,
     SEED_TYPE_ANNOTATION,
     SEED_TYPE_INDUCTION,
     SEED_TYPE_NEIGHBORS,
     SEED_TYPE_SAMPLE,
 )
+from .exc import SeedingSizeError
 from .selection import get_subgraph
+from ..operations import left_full_join
+from ..pipeline.trace import Trace, trace_stage
 from ...dsl import BaseEntity
-from ...struct import union
 from ...tokens import parse_result_to_dsl
 
 logger = logging.getLogger(__name__)
@@ -24,6 +35,23 @@ SEED_DATA = "data"
 
 MaybeNodeList = Union[BaseEntity, list[BaseEntity], list[dict]]
 
+#: The universe used by worker processes in :meth:`Seeding.run`
+_WORKER_GRAPH = None
+
+
+def _initialize_worker(graph) -> None:
+    global _WORKER_GRAPH
+    _WORKER_GRAPH = graph
+
+
+def _seed(graph, seed: Mapping[str, Any]):
+    logger.debug("seeding with %s: %s", seed[SEED_METHOD], seed[SEED_DATA])
+    return get_subgraph(graph, seed_method=seed[SEED_METHOD], seed_data=seed[SEED_DATA])
+
+
+def _seed_in_worker(seed: Mapping[str, Any]):
+    return _seed(_WORKER_GRAPH, seed)
+
 
 class Seeding(UserList):
     """Represents a container of seeding methods to apply to a network."""
@@ -96,35 +124,102 @@ class Seeding(UserList):
         """
         return self._append_seed(seed_type, _handle_nodes(nodes))
 
-    def run(self, graph):
+    def run(
+        self,
+        graph,
+        trace: Trace | None = None,
+        n_jobs: int | None = None,
+        use_threads: bool = False,
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
+    ):
         """Seed the graph or return none if not possible.
 
+        The sub-graphs from the seeding methods are merged as soon as they are available, in the order in which the
+        seeding methods finish, so the result has the same nodes and edges regardless of how many workers are used.
+
         :type graph: pybel.BELGraph
+        :param trace: A trace in which the time, peak memory, and input and output sizes of the seeding, and of each
+         seeding method if they are run serially, are recorded
+        :param n_jobs: The number of workers with which seeding methods are run concurrently. If none or 1, runs them
+         serially. Worker processes get the graph when they start (without copying it, where processes are forked).
+        :param use_threads: Should threads be used instead of processes? Seeding is bound by hashing nodes, so this
+         only pays off on free-threaded builds of Python, but it avoids sending the sub-graphs between processes.
+        :param max_nodes: The maximum number of nodes in the result
+        :param max_edges: The maximum number of edges in the result
+        :raises SeedingSizeError: As soon as the merged sub-graphs have more nodes or edges than allowed. Seeding
+         methods that have not started yet are cancelled.
         :rtype: Optional[pybel.BELGraph]
         """
         if not self:
             logger.debug("no seeding, returning graph: %s", graph)
             return graph
 
-        subgraphs = []
+        with trace_stage(trace, "seeding", graph) as stage:
+            if n_jobs is None or n_jobs == 1 or len(self) < 2:
+                rv = self._merge(self._iter_subgraphs(graph, trace=trace), max_nodes=max_nodes, max_edges=max_edges)
+            elif use_threads:
+                with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                    futures = {executor.submit(_seed, graph, seed): seed for seed in self}
+                    rv = self._merge_concurrently(executor, futures, max_nodes=max_nodes, max_edges=max_edges)
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=min(n_jobs, len(self)),
+                    initializer=_initialize_worker,
+                    initargs=(graph,),
+                ) as executor:
+                    futures = {executor.submit(_seed_in_worker, seed): seed for seed in self}
+                    rv = self._merge_concurrently(executor, futures, max_nodes=max_nodes, max_edges=max_edges)
+            stage.set_output(rv)
+
+        if rv is None:
+            logger.debug("no subgraphs returned")
+        return rv
 
+    def _iter_subgraphs(self, graph, trace: Trace | None = None) -> Iterable:
         for seed in self:
-            seed_method, seed_data = seed[SEED_METHOD], seed[SEED_DATA]
-
-            logger.debug("seeding with %s: %s", seed_method, seed_data)
-            subgraph = get_subgraph(graph, seed_method=seed_method, seed_data=seed_data)
-
+            with trace_stage(trace, f"seed by {seed[SEED_METHOD]}", graph, args=[seed[SEED_DATA]]) as stage:
+                subgraph = _seed(graph, seed)
+                stage.set_output(subgraph)
+            yield seed, subgraph
+
+    def _merge_concurrently(self, executor: Executor, futures: Mapping[Future, Mapping[str, Any]], **kwargs):
+        try:
+            return self._merge(
+                ((futures[future], future.result()) for future in as_completed(futures)),
+                **kwargs,
+            )
+        except SeedingSizeError:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def _merge(self, subgraphs: Iterable, max_nodes: int | None = None, max_edges: int | None = None):
+        """Merge pairs of seeding methods and their sub-graphs, checking the size after each.
+
+        As in :func:`pybel.struct.union`, the first sub-graph is copied before the others are merged into it, so the
+        sub-graphs are left unchanged.
+        """
+        rv = None
+        copied = False
+        for seed, subgraph in subgraphs:
             if subgraph is None:
                 logger.debug("seed returned empty graph: %s", seed)
                 continue
 
-            subgraphs.append(subgraph)
+            if rv is None:
+                rv = subgraph
+            else:
+                if not copied:
+                    rv = rv.copy()
+                    copied = True
+                left_full_join(rv, subgraph)
 
-        if not subgraphs:
-            logger.debug("no subgraphs returned")
-            return
+            if max_nodes is not None and max_nodes < rv.number_of_nodes():
+                raise SeedingSizeError(f"seeding gave more than {max_nodes} nodes after {seed[SEED_METHOD]}")
+            if max_edges is not None and max_edges < rv.number_of_edges():
+                raise SeedingSizeError(f"seeding gave more than {max_edges} edges after {seed[SEED_METHOD]}")
 
-        return union(subgraphs)
+        return rv
 
     def to_json(self) -> list[dict]:
         """Serialize this seeding container to a JSON object."""
@@ -140,8 +235,14 @@ class Seeding(UserList):
 
     @staticmethod
     def from_json(data) -> "Seeding":
-        """Build a seeding container from a JSON list."""
-        return Seeding(data)
+        """Build a seeding container from a JSON list, converting the nodes given as JSON to BEL entities."""
+        return Seeding(
+            {
+                SEED_METHOD: seed[SEED_METHOD],
+                SEED_DATA: _handle_nodes(seed[SEED_DATA]) if seed[SEED_METHOD] in NODE_SEED_TYPES else seed[SEED_DATA],
+            }
+            for seed in data
+        )
 
     @staticmethod
     def load(file: TextIO) -> "Seeding":
@@ -96,7 +96,13 @@ def _iterate_namespaces(graph: BELGraph) -> Iterable[str]:
 
 
 def _iterate_edge_entities(graph: BELGraph) -> Iterable[Entity]:
-    for (_, _, data), side in itt.product(graph.edges(data=True), (SOURCE_MODIFIER, TARGET_MODIFIER)):
+    for _, _, data in graph.edges(data=True):
+        yield from _iterate_edge_data_entities(data)
+
+
+def _iterate_edge_data_entities(data) -> Iterable[Entity]:
+    """Iterate over the named entities in the modifiers of an edge's data dictionary."""
+    for side in (SOURCE_MODIFIER, TARGET_MODIFIER):
         side_data = data.get(side)
         if side_data is None:
             continue
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 
 from ..filters.edge_predicates import CITATION_PREDICATES
 from ..graph import BELGraph
+from ..indexes import get_provenance_index
 from ...constants import CITATION, IDENTIFIER
 
 __all__ = [
@@ -25,6 +26,16 @@ def iterate_citation_identifiers(graph, prefix: str):
     if predicate is None:
         raise ValueError(f"Invalid citation prefix: {prefix}")
 
+    provenance_index = get_provenance_index(graph)
+    if provenance_index is not None:
+        # check the predicate on one edge per citation, then give the identifier once for each of its edges
+        return (
+            identifier.strip()
+            for (_, identifier), positions in provenance_index.citations.items()
+            if predicate(provenance_index.edges[positions[0]][3])
+            for _ in range(len(positions))
+        )
+
     return (data[CITATION][IDENTIFIER].strip() for _, _, data in graph.edges(data=True) if predicate(data))
 
 
@@ -1,46 +1,290 @@
-"""Utilities for BEL graphs."""
+"""Utilities for BEL graphs.
+
+The tables are built by :class:`GraphSummary`, which collects the counts and examples for all of them in a single
+traversal of the graph. Examples are picked by reservoir sampling, so only one example per row is kept in memory and
+only the examples that are shown are formatted as BEL.
+"""
 
 import logging
+import math
 import random
+import time
 from collections import Counter
-from typing import TextIO
+from collections.abc import MutableMapping
+from typing import Any, TextIO
 
 import bioregistry
+import networkx as nx
 import pandas as pd
 from humanize import intword
 from tabulate import tabulate
 
-from .node_summary import count_namespaces
+from .node_summary import _iterate_edge_data_entities, iterate_node_entities
 from ..graph import BELGraph
-from ...constants import CITATION, IDENTIFIER, NAMESPACE, RELATION, TWO_WAY_RELATIONS
+from ...constants import (
+    ANNOTATIONS,
+    CITATION,
+    CITATION_AUTHORS,
+    IDENTIFIER,
+    NAMESPACE,
+    RELATION,
+    TWO_WAY_RELATIONS,
+)
 from ...dsl import BaseConcept
-from ...utils import multidict
 
 logger = logging.getLogger(__name__)
 
+#: The number of nodes and edges that are always counted exactly before a time budget is checked
+CALIBRATION_SIZE = 1000
+
+
+class GraphSummary:
+    """The counts and examples for the summary tables of a graph, collected in a single traversal.
+
+    The nodes are visited once for the function and namespace tables and the edges are visited once for the edge
+    type, namespace, annotation, citation, and author counts and the number of components.
+
+    If a time budget is given and the first :data:`CALIBRATION_SIZE` nodes or edges show that a full traversal would
+    take longer, only every n-th of the remaining ones is counted with a weight of n. The counts in the tables are then
+    estimates, the numbers of distinct namespaces, annotations, citations, and authors are lower bounds, and
+    :attr:`approximate` is true. The numbers of nodes, edges, and components are always exact.
+    """
+
+    def __init__(
+        self,
+        graph: BELGraph,
+        examples: bool = True,
+        time_budget: float | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Summarize the graph.
+
+        :param graph: A BEL graph
+        :param examples: Should an example be sampled for each row of the tables?
+        :param time_budget: The number of seconds after which the traversal switches to approximate counts
+        :param rng: The random number generator used to pick examples. Defaults to the :mod:`random` module.
+        """
+        self.graph = graph
+        self.examples = examples
+        self.time_budget = time_budget
+        self._rng = random if rng is None else rng
+
+        #: The stride with which nodes and edges were sampled, where 1 means that the counts are exact
+        self.node_stride = 1
+        self.edge_stride = 1
+
+        self.functions: Counter = Counter()
+        self.namespaces: Counter = Counter()
+        self.edge_types: Counter = Counter()
+        self.annotations: Counter = Counter()
+        self.citations: Counter = Counter()
+        self.authors: set[str] = set()
+        self.number_of_nodes = 0
+        self.number_of_edges = 0
+        self.number_of_components = 0
+
+        self._function_examples: dict[str, Any] = {}
+        self._namespace_examples: dict[str, Any] = {}
+        self._namespace_example_weights: Counter = Counter()
+        self._edge_type_examples: dict[str, tuple] = {}
+        self._citation_examples: dict[tuple[str, str], tuple] = {}
+
+        self._start = time.perf_counter()
+        self._collect_nodes()
+        self._collect_edges()
+
+    @property
+    def approximate(self) -> bool:
+        """Are the counts estimated from a sample of the nodes or edges?"""
+        return self.node_stride > 1 or self.edge_stride > 1
+
+    def _offer(self, examples: dict, weights: MutableMapping, key, example, weight: int) -> None:
+        """Count the example and keep it with probability proportional to its weight (weighted reservoir sampling)."""
+        weights[key] += weight
+        if self.examples and self._rng.random() * weights[key] < weight:
+            examples[key] = example
+
+    def _get_stride(self, pass_start: float, count: int, total: int, budget_fraction: float) -> int:
+        """Get the stride for the rest of a pass from how long the first part of it took."""
+        if self.time_budget is None or total <= count:
+            return 1
+        remaining = self.time_budget * budget_fraction - (pass_start - self._start)
+        projected = (time.perf_counter() - pass_start) / count * (total - count)
+        if remaining <= 0:
+            return max(1, total - count)
+        return max(1, math.ceil(projected / remaining))
+
+    def _collect_nodes(self) -> None:
+        total = self.graph.number_of_nodes()
+        number_of_edges = self.graph.number_of_edges()
+        # give the nodes a share of the time budget proportional to their number
+        budget_fraction = total / (total + number_of_edges) if total else 0
+        start = time.perf_counter()
+        stride = 1
+        for i, node in enumerate(self.graph):
+            if i == CALIBRATION_SIZE:
+                stride = self.node_stride = self._get_stride(start, i, total, budget_fraction)
+            if i % stride:
+                continue
+            self._offer(self._function_examples, self.functions, node.function, node, stride)
+            for entity in iterate_node_entities(node):
+                self.namespaces[entity.namespace] += stride
+            if isinstance(node, BaseConcept):
+                self._offer(self._namespace_examples, self._namespace_example_weights, node.namespace, node, stride)
+        self.number_of_nodes = total
+
+    def _collect_edges(self) -> None:
+        graph = self.graph
+        # The components are counted with a union-find over the identities of the nodes, since hashing a BEL node
+        # requires serializing it. The node objects in the inner adjacency dictionaries can be equal copies of the
+        # ones in the outer dictionary, so each target is identified by the node in the predecessor dictionary that
+        # shares the edge's key dictionary.
+        targets = {id(keydict): id(v) for v, predecessors in graph._pred.items() for keydict in predecessors.values()}
+        parents: dict[int, int] = {}
+        unions = 0
+        total = graph.number_of_edges()
+        start = time.perf_counter()
+        stride = 1
+        i = 0
+        for u, neighbors in graph._succ.items():
+            for v, keydict in neighbors.items():
+                u_root, v_root = _find(parents, id(u)), _find(parents, targets[id(keydict)])
+                if u_root != v_root:
+                    parents[u_root] = v_root
+                    unions += 1
+                for data in keydict.values():
+                    if i == CALIBRATION_SIZE:
+                        stride = self.edge_stride = self._get_stride(start, i, total, 1.0)
+                    if not i % stride:
+                        self._collect_edge(u, v, data, stride)
+                    i += 1
+        self.number_of_edges = total
+        self.number_of_components = self.number_of_nodes - unions
+
+    def _collect_edge(self, u, v, data, weight: int) -> None:
+        relation = data[RELATION]
+        if relation not in TWO_WAY_RELATIONS or u.function > v.function:
+            edge_type = f"{u.function} {relation} {v.function}"
+            self._offer(self._edge_type_examples, self.edge_types, edge_type, (u, v, data), weight)
+        for entity in _iterate_edge_data_entities(data):
+            self.namespaces[entity.namespace] += weight
+        annotations = data.get(ANNOTATIONS)
+        if annotations is not None:
+            for key in annotations:
+                self.annotations[key] += weight
+        citation = data.get(CITATION)
+        if citation is not None:
+            citation_key = citation[NAMESPACE], citation[IDENTIFIER]
+            self._offer(self._citation_examples, self.citations, citation_key, (u, v, data), weight)
+            authors = citation.get(CITATION_AUTHORS)
+            if authors:
+                self.authors.update(authors)
+
+    def _count_header(self) -> str:
+        return "Count (approximate)" if self.approximate else "Count"
+
+    def function_table_df(self) -> pd.DataFrame:
+        """Create a dataframe describing the functions in the graph."""
+        if not self.examples:
+            return pd.DataFrame(self.functions.most_common(), columns=["Type", self._count_header()])
+        return pd.DataFrame(
+            [(function, count, self._function_examples[function]) for function, count in self.functions.most_common()],
+            columns=["Type", self._count_header(), "Example"],
+        )
+
+    def namespaces_table_df(self) -> pd.DataFrame:
+        """Create a dataframe describing the namespaces in the graph."""
+        if not self.examples:
+            return pd.DataFrame(self.namespaces.most_common(), columns=["Namespace", self._count_header()])
+        return pd.DataFrame(
+            [
+                (prefix, bioregistry.get_name(prefix), count, self._namespace_examples.get(prefix, ""))
+                for prefix, count in self.namespaces.most_common()
+            ],
+            columns=["Prefix", "Name", self._count_header(), "Example"],
+        )
+
+    def edge_table_df(self, minimum: int | None = None) -> pd.DataFrame:
+        """Create a dataframe describing the edges in the graph."""
+        rows = self.edge_types.most_common()
+        if minimum:
+            rows = [(edge_type, count) for edge_type, count in rows if count >= minimum]
+        if not self.examples:
+            return pd.DataFrame(rows, columns=["Edge Type", self._count_header()])
+        return pd.DataFrame(
+            [
+                (edge_type, count, self.graph.edge_to_bel(*self._edge_type_examples[edge_type], use_identifiers=True))
+                for edge_type, count in rows
+            ],
+            columns=["Edge Type", self._count_header(), "Example"],
+        )
+
+    def citation_table_df(self, n: int | None = 15) -> pd.DataFrame:
+        """Create a dataframe describing the most common citations in the graph."""
+        rows = []
+        for citation, count in self.citations.most_common(n=n):
+            example = self.graph.edge_to_bel(*self._citation_examples[citation]) if self.examples else None
+            rows.append((":".join(citation), count, example))
+        return pd.DataFrame(rows, columns=["Citation", self._count_header(), "Example"])
+
+    def functions_str(self, add_count: bool = True, **kwargs) -> str:
+        """Make a summary string of the functions in the graph."""
+        return _table_str(self.function_table_df(), add_count=add_count, **kwargs)
+
+    def namespaces_str(self, add_count: bool = True, **kwargs) -> str:
+        """Make a summary string of the namespaces in the graph."""
+        return _table_str(self.namespaces_table_df(), add_count=add_count, **kwargs)
+
+    def edges_str(self, add_count: bool = True, minimum: int | None = None, **kwargs) -> str:
+        """Make a summary string of the edges in the graph."""
+        return _table_str(self.edge_table_df(minimum=minimum), add_count=add_count, count_format=intword, **kwargs)
+
+    def statistics_list(self, prose_prefix: bool = True) -> list[tuple[str, Any]]:
+        """Get the statistics of the graph, with the estimated ones prefixed by a tilde."""
+        rv = [
+            ("Nodes", self.number_of_nodes),
+            ("Namespaces", self._format_estimate(len(self.namespaces))),
+            ("Edges", self.number_of_edges),
+            ("Annotations", self._format_estimate(len(self.annotations))),
+            ("Citations", self._format_estimate(len(self.citations))),
+            ("Authors", self._format_estimate(len(self.authors))),
+            ("Components", self.number_of_components),
+            ("Warnings", self.graph.number_of_warnings()),
+        ]
+        if prose_prefix:
+            rv = [(f"Number of {x}", y) for x, y in rv]
+        rv.append(("Network Density", f"{nx.density(self.graph):.2E}"))
+        return rv
+
+    def _format_estimate(self, value: int):
+        return f"~{value}" if self.approximate else value
+
+
+def _find(parents: dict[int, int], x: int) -> int:
+    """Find the root of the set containing x and compress the path to it."""
+    root = x
+    while root in parents:
+        root = parents[root]
+    while x != root:
+        parents[x], x = root, parents[x]
+    return root
+
+
+def _table_str(df: pd.DataFrame, add_count: bool = True, count_format=str, **kwargs) -> str:
+    headers = list(df.columns)
+    if add_count:
+        headers[0] += f" ({count_format(len(df.index))})"
+    return tabulate(df.values, headers=headers, **kwargs)
+
 
 def function_table_df(graph: BELGraph, examples: bool = True) -> pd.DataFrame:
     """Create a dataframe describing the functions in the graph."""
-    function_mapping = multidict((node.function, node) for node in graph)
-    function_c = Counter({function: len(nodes) for function, nodes in function_mapping.items()})
-    if not examples:
-        return pd.DataFrame(function_c.most_common(), columns=["Type", "Count"])
-    return pd.DataFrame(
-        [
-            (function, count, random.choice(function_mapping[function]))  # noqa:S311
-            for function, count in function_c.most_common()
-        ],
-        columns=["Type", "Count", "Example"],
-    )
+    return GraphSummary(graph, examples=examples).function_table_df()
 
 
 def functions_str(graph, examples: bool = True, add_count: bool = True, **kwargs) -> str:
     """Make a summary string of the functions in the graph."""
-    df = function_table_df(graph, examples=examples)
-    headers = list(df.columns)
-    if add_count:
-        headers[0] += f" ({len(df.index)})"
-    return tabulate(df.values, headers=headers, **kwargs)
+    return GraphSummary(graph, examples=examples).functions_str(add_count=add_count, **kwargs)
 
 
 def functions(graph, file: TextIO | None = None, examples: bool = True, **kwargs) -> None:
@@ -50,31 +294,12 @@ def functions(graph, file: TextIO | None = None, examples: bool = True, **kwargs
 
 def namespaces_table_df(graph: BELGraph, examples: bool = True) -> pd.DataFrame:
     """Create a dataframe describing the namespaces in the graph."""
-    namespace_mapping = multidict((node.namespace, node) for node in graph if isinstance(node, BaseConcept))
-    namespace_c = count_namespaces(graph)
-    if not examples:
-        return pd.DataFrame(namespace_c.most_common(), columns=["Namespace", "Count"])
-    return pd.DataFrame(
-        [
-            (
-                prefix,
-                bioregistry.get_name(prefix),
-                count,
-                random.choice(namespace_mapping[prefix]) if prefix in namespace_mapping else "",  # noqa:S311
-            )
-            for prefix, count in namespace_c.most_common()
-        ],
-        columns=["Prefix", "Name", "Count", "Example"],
-    )
+    return GraphSummary(graph, examples=examples).namespaces_table_df()
 
 
 def namespaces_str(graph: BELGraph, examples: bool = True, add_count: bool = True, **kwargs) -> None:
     """Make a summary string of the namespaces in the graph."""
-    df = namespaces_table_df(graph, examples=examples)
-    headers = list(df.columns)
-    if add_count:
-        headers[0] += f" ({len(df.index)})"
-    return tabulate(df.values, headers=headers, **kwargs)
+    return GraphSummary(graph, examples=examples).namespaces_str(add_count=add_count, **kwargs)
 
 
 def namespaces(graph: BELGraph, file: TextIO | None = None, examples: bool = True, **kwargs) -> None:
@@ -84,32 +309,7 @@ def namespaces(graph: BELGraph, file: TextIO | None = None, examples: bool = Tru
 
 def edge_table_df(graph: BELGraph, *, examples: bool = True, minimum: int | None = None) -> pd.DataFrame:
     """Create a dataframe describing the edges in the graph."""
-    edge_mapping = multidict(
-        (
-            f"{u.function} {d[RELATION]} {v.function}",
-            graph.edge_to_bel(u, v, d, use_identifiers=True),
-        )
-        for u, v, d in graph.edges(data=True)
-        if d[RELATION] not in TWO_WAY_RELATIONS or u.function > v.function
-    )
-    edge_c = Counter({top_level_edge: len(edges) for top_level_edge, edges in edge_mapping.items()})
-    if examples:
-        rows = [
-            (
-                top_level_edge,
-                count,
-                random.choice(edge_mapping[top_level_edge]),
-            )
-            for top_level_edge, count in edge_c.most_common()
-            if not minimum or count >= minimum
-        ]
-        columns = ["Edge Type", "Count", "Example"]
-    else:
-        rows = edge_c.most_common()
-        if minimum:
-            rows = [(k, count) for k, count in rows if count >= minimum]
-        columns = ["Edge Type", "Count"]
-    return pd.DataFrame(rows, columns=columns)
+    return GraphSummary(graph, examples=examples).edge_table_df(minimum=minimum)
 
 
 def edges_str(
@@ -121,11 +321,7 @@ def edges_str(
     **kwargs,
 ) -> str:
     """Make a summary str of the edges in the graph."""
-    df = edge_table_df(graph, examples=examples, minimum=minimum)
-    headers = list(df.columns)
-    if add_count:
-        headers[0] += f" ({intword(len(df.index))})"
-    return tabulate(df.values, headers=headers, **kwargs)
+    return GraphSummary(graph, examples=examples).edges_str(add_count=add_count, minimum=minimum, **kwargs)
 
 
 def edges(
@@ -142,29 +338,5 @@ def edges(
 
 def citations(graph: BELGraph, n: int | None = 15, file: TextIO | None = None) -> None:
     """Print a summary of the citations in the graph."""
-    edge_mapping = multidict(
-        (
-            (data[CITATION][NAMESPACE], data[CITATION][IDENTIFIER]),
-            graph.edge_to_bel(u, v, data),
-        )
-        for u, v, data in graph.edges(data=True)
-        if CITATION in data
-    )
-    edge_c = Counter({top_level_edge: len(edges) for top_level_edge, edges in edge_mapping.items()})
-    df = pd.DataFrame(
-        [
-            (
-                ":".join(top_level_edge),
-                count,
-                random.choice(edge_mapping[top_level_edge]),
-            )
-            for top_level_edge, count in edge_c.most_common(n=n)
-        ],
-        columns=["Citation", "Count", "Example"],
-    )
-
-    if n is None or len(edge_mapping) < n:
-        pass
-    else:
-        pass
+    df = GraphSummary(graph).citation_table_df(n=n)
     print(tabulate(df.values, headers=df.columns), file=file)
@@ -1,6 +1,7 @@
 """Mocks for PyBEL testing."""
 
-from collections.abc import Iterable
+import datetime
+from collections.abc import Iterable, Mapping
 
 from ..manager.models import Network
 from ..struct import union
@@ -22,6 +23,9 @@ class MockQueryManager:
         #: A lookup from network identifier to graph
         self.id_graph = {}
 
+        #: A lookup from network identifier to the time it was inserted
+        self.id_created = {}
+
         if graphs is not None:
             for graph in graphs:
                 self.insert_graph(graph)
@@ -38,11 +42,16 @@ class MockQueryManager:
         network_id = len(self.graphs)
         self.graphs.append(graph)
         self.id_graph[network_id] = graph
+        self.id_created[network_id] = datetime.datetime.utcnow()
 
         for node in graph:
             self.hash_to_node[node.md5] = node
 
-        return Network(id=network_id)
+        return Network(id=network_id, created=self.id_created[network_id])
+
+    def get_network_timestamps(self, network_ids: Iterable[int]) -> Mapping[int, datetime.datetime]:
+        """Get the insertion timestamps of the networks with the given identifiers."""
+        return {network_id: self.id_created[network_id] for network_id in network_ids if network_id in self.id_created}
 
     def get_graph_by_ids(self, network_ids: Iterable[int]):
         """Get a graph from the union of multiple networks.
@@ -1,8 +1,11 @@
 """Utilities for PyBEL testing."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from uuid import uuid4
 
 from requests.compat import urlparse
+from sqlalchemy import event
 
 from ..manager import Manager
 from ..manager.models import Namespace, NamespaceEntry
@@ -59,3 +62,21 @@ def make_dummy_annotations(manager: Manager, graph: BELGraph):
         manager.session.add(entry)
 
     manager.session.commit()
+
+
+@contextmanager
+def count_statements(manager: Manager) -> Iterator[list[str]]:
+    """Count the SQL statements that the manager's engine runs inside the context.
+
+    :return: A list that gets each statement appended to it
+    """
+    statements = []
+
+    def _append(_connection, _cursor, statement, *_):
+        statements.append(statement)
+
+    event.listen(manager.engine, "before_cursor_execute", _append)
+    try:
+        yield statements
+    finally:
+        event.remove(manager.engine, "before_cursor_execute", _append)
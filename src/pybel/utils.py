@@ -171,7 +171,19 @@ def hash_edge(source, target, edge_data: EdgeData) -> str:
     :return: A hashed version of the edge tuple using MD5 hash of the binary pickle dump of u, v, and the json dump
      of d
     """
-    edge_tuple = _get_edge_tuple(source, target, edge_data)
+    return hash_bel_edge(source.as_bel(), target.as_bel(), edge_data)
+
+
+def hash_bel_edge(source_bel: str, target_bel: str, edge_data: EdgeData) -> str:
+    """Convert an edge tuple to a MD5 hash, given the already serialized source and target nodes.
+
+    This gives the same hash as :func:`hash_edge` and is useful for re-hashing many edges that share nodes.
+
+    :param source_bel: The source BEL node, serialized with :meth:`pybel.dsl.BaseEntity.as_bel`
+    :param target_bel: The target BEL node, serialized with :meth:`pybel.dsl.BaseEntity.as_bel`
+    :param edge_data: The edge's data dictionary
+    """
+    edge_tuple = _get_bel_edge_tuple(source_bel, target_bel, edge_data)
     edge_tuple_bytes = pickle.dumps(edge_tuple)
     return hashlib.md5(edge_tuple_bytes).hexdigest()
 
@@ -188,9 +200,17 @@ def _get_edge_tuple(
     :param edge_data: The edge's data dictionary
     :return: A tuple that can be hashed representing this edge. Makes no promises to its structure.
     """
+    return _get_bel_edge_tuple(source.as_bel(), target.as_bel(), edge_data)
+
+
+def _get_bel_edge_tuple(
+    source_bel: str,
+    target_bel: str,
+    edge_data: EdgeData,
+) -> tuple[str, str, str | None, str | None, CanonicalEdge]:
     return (
-        source.as_bel(),
-        target.as_bel(),
+        source_bel,
+        target_bel,
         _get_citation_str(edge_data),
         edge_data.get(EVIDENCE),
         canonicalize_edge(edge_data),
@@ -1,5 +1,6 @@
 """Tests for the internal DSL."""
 
+import pickle
 import unittest
 
 import pybel.constants as pc
@@ -193,6 +194,18 @@ class TestDSL(unittest.TestCase):
         )
         self.assertEqual('g(fus(HGNC:TMPRSS2, "?", HGNC:ERG, "?"))', dsl.as_bel())
 
+    def test_pickle_bel(self):
+        """Test the BEL string kept for hashing is not pickled, and is rebuilt after unpickling."""
+        node = ComplexAbundance([Protein("HGNC", "A"), Protein("HGNC", "B")])
+        self.assertEqual(hash(node.as_bel()), hash(node))
+        self.assertIn("_bel", node.__dict__)
+
+        loaded = pickle.loads(pickle.dumps(node))
+        self.assertNotIn("_bel", loaded.__dict__)
+        self.assertEqual(node, loaded)
+        self.assertEqual(hash(node), hash(loaded))
+        self.assertEqual({node}, {loaded})
+
 
 class TestCentralDogma(unittest.TestCase):
     """Test functions specific for :class:`CentralDogmaAbundance`s."""
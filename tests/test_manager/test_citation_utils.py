@@ -17,11 +17,14 @@ The test data can be created with the following script:
 
 import json
 import os
+import threading
 import time
 import unittest
 from collections.abc import Iterable, Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
 from pybel import BELGraph
 from pybel.constants import (
@@ -33,15 +36,21 @@ from pybel.constants import (
 )
 from pybel.dsl import Protein
 from pybel.language import CitationDict
+from pybel.manager import Manager
 from pybel.manager.citation_utils import (
+    NCBI_API_KEY_RATE_LIMIT,
+    EUtilsClient,
+    TokenBucket,
     _enrich_citations,
+    enrich_citation_model,
+    enrich_citations_bulk,
     enrich_pubmed_citations,
     get_citations_by_pmids,
     sanitize_date,
 )
-from pybel.manager.models import Citation
+from pybel.manager.models import Author, Citation
 from pybel.testing.cases import TemporaryCacheMixin
-from pybel.testing.utils import n
+from pybel.testing.utils import count_statements, n
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 
@@ -54,7 +63,7 @@ with open(PMC_DATA_PATH) as _file:
     PMC_DATA = json.load(_file)
 
 
-def _mock_fn(pubmed_identifiers: Iterable[str]) -> Mapping[str, Any]:
+def _mock_fn(pubmed_identifiers: Iterable[str], client=None) -> Mapping[str, Any]:
     result = {
         "uids": pubmed_identifiers,
     }
@@ -235,6 +244,74 @@ class TestPubmed(TemporaryCacheMixin):
         self.assertEqual(g2, a2.name)
 
 
+class TestBulkEnrichment(TemporaryCacheMixin):
+    """Test enriching citations in bulk gives the same rows as enriching them one at a time."""
+
+    def setUp(self):
+        super().setUp()
+        self.pmids = sorted(pmid for pmid in PUBMED_DATA["result"] if pmid != "uids")
+        self.summaries = {pmid: PUBMED_DATA["result"][pmid] for pmid in self.pmids}
+
+    def _get_citations(self, manager: Manager, prefix: str) -> dict[str, Citation]:
+        rv = {pmid: manager.get_or_create_citation(namespace=prefix, identifier=pmid) for pmid in self.pmids}
+        manager.session.commit()
+        return rv
+
+    @staticmethod
+    def _get_rows(citations: Mapping[str, Citation]):
+        rv = {}
+        for pmid, citation in citations.items():
+            data = dict(citation.to_json())
+            del data["namespace"]
+            rv[pmid] = data
+        return rv
+
+    def test_same_as_orm(self):
+        """Test the citations, authors, and links are the same as from enriching each citation model."""
+        existing = self.manager.get_or_create_author("Gomez C")
+        self.manager.session.commit()
+
+        expected_citations = self._get_citations(self.manager, "orm")
+        for pmid, citation in expected_citations.items():
+            self.assertTrue(enrich_citation_model(self.manager, citation, self.summaries[pmid]))
+        self.manager.session.commit()
+        expected_authors = self.manager.session.query(Author).count()
+
+        citations = self._get_citations(self.manager, CITATION_TYPE_PUBMED)
+        with count_statements(self.manager) as statements:
+            errors = enrich_citations_bulk(self.manager, self.summaries)
+            self.manager.session.commit()
+        self.assertEqual(set(), errors)
+        self.assertGreater(10, len(statements))
+
+        self.assertEqual(self._get_rows(expected_citations), self._get_rows(citations))
+        self.assertEqual(
+            expected_authors, self.manager.session.query(Author).count(), msg="authors should not be duplicated"
+        )
+        self.assertIn(existing, citations["29359844"].authors)
+
+        # enriching again should not add the links between citations and authors again
+        enrich_citations_bulk(self.manager, self.summaries)
+        self.manager.session.commit()
+        self.assertEqual(self._get_rows(expected_citations), self._get_rows(citations))
+
+    def test_error(self):
+        """Test citations with errors and identifiers without citations are skipped."""
+        citations = self._get_citations(self.manager, CITATION_TYPE_PUBMED)
+        errors = enrich_citations_bulk(
+            self.manager,
+            {
+                "1": self.summaries[self.pmids[2]],
+                self.pmids[0]: {"error": "cannot get document summary"},
+                self.pmids[1]: self.summaries[self.pmids[1]],
+            },
+        )
+        self.manager.session.commit()
+        self.assertEqual({"1", self.pmids[0]}, errors)
+        self.assertFalse(citations[self.pmids[0]].is_enriched)
+        self.assertTrue(citations[self.pmids[1]].is_enriched)
+
+
 class TestPMC(TemporaryCacheMixin):
     """Tests for citations."""
 
@@ -264,3 +341,133 @@ class TestPMC(TemporaryCacheMixin):
         self.assertIn(CITATION_AUTHORS, citation_dict)
         self.assertLess(0, len(citation_dict[CITATION_AUTHORS]))
         # TODO the eUtils and CSL thing both normalize the way autors look
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the token bucket rate limiter."""
+
+    def test_acquire(self):
+        """Test bursts up to the capacity, then waiting for tokens to be refilled."""
+        now = [0.0]
+
+        def _sleep(seconds):
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, clock=lambda: now[0], sleep=_sleep)
+        self.assertEqual(0, bucket.acquire())
+        self.assertEqual(0, bucket.acquire())
+        self.assertAlmostEqual(0.5, bucket.acquire())
+        self.assertAlmostEqual(0.5, bucket.acquire())
+        now[0] += 10
+        self.assertEqual(0, bucket.acquire(), msg="tokens should refill up to the capacity")
+        self.assertEqual(0, bucket.acquire())
+        self.assertAlmostEqual(0.5, bucket.acquire())
+        self.assertAlmostEqual(1.5, now[0] - 10)
+
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class _StubEUtilsServer(ThreadingHTTPServer):
+    """A local eSummary service that serves the test data."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubEUtilsHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        #: Status codes to answer the next requests with, before answering normally
+        self.failures = []
+        #: Identifiers whose chunks always fail
+        self.broken = set()
+
+    @property
+    def url(self) -> str:
+        """Get the URL of the service."""
+        return f"http://127.0.0.1:{self.server_address[1]}/esummary.fcgi"
+
+
+class _StubEUtilsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa:N802
+        params = parse_qs(urlparse(self.path).query)
+        identifiers = params["id"][0].split(",")
+        with self.server.lock:
+            self.server.requests.append(params)
+            status = self.server.failures.pop(0) if self.server.failures else None
+        if status is None and self.server.broken.intersection(identifiers):
+            status = 500
+        if status is not None:
+            self.send_error(status)
+            return
+        body = json.dumps(_mock_fn(identifiers)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConcurrentEnrichment(TemporaryCacheMixin):
+    """Test enriching citations from a local eSummary service with several threads."""
+
+    def setUp(self):
+        super().setUp()
+        self.server = _StubEUtilsServer()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.client = EUtilsClient(api_key="secret", url=self.server.url, rate=1000, backoff=0.001)
+        self.pmids = sorted(pmid for pmid in PUBMED_DATA["result"] if pmid != "uids")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        super().tearDown()
+
+    def _get_requested(self) -> list[str]:
+        return sorted(pmid for params in self.server.requests for pmid in params["id"][0].split(","))
+
+    def test_client(self):
+        """Test the rate is higher with an API key."""
+        self.assertEqual(NCBI_API_KEY_RATE_LIMIT, EUtilsClient(api_key="secret").limiter.rate)
+        self.assertEqual(1000, self.client.limiter.rate)
+
+    def test_retries(self):
+        """Test failed requests are retried and the API key is sent."""
+        self.server.failures.extend([429, 503])
+        enriched, errors = get_citations_by_pmids(
+            self.manager, self.pmids, group_size=2, client=self.client, n_workers=3
+        )
+        self.assertEqual(set(), errors)
+        self.assertEqual(set(self.pmids), set(enriched))
+        self.assertEqual(4 + 2, len(self.server.requests))
+        self.assertTrue(all(params["api_key"] == ["secret"] for params in self.server.requests))
+        self.assertTrue(all(self.manager.get_citation_by_pmid(pmid).is_enriched for pmid in self.pmids))
+        self.assertEqual("Martínez-Guillén JR", self.manager.get_citation_by_pmid("29324713").first.name)
+
+    def test_resume(self):
+        """Test the chunks that failed are the only ones downloaded when enriching again."""
+        self.client.max_retries = 1
+        self.server.broken.add(self.pmids[0])
+        _, errors = get_citations_by_pmids(self.manager, self.pmids, group_size=2, client=self.client)
+        self.assertEqual(set(self.pmids[:2]), errors)
+        self.assertEqual(
+            [False, False] + [True] * (len(self.pmids) - 2),
+            [self.manager.get_citation_by_pmid(pmid).is_enriched for pmid in self.pmids],
+        )
+
+        self.server.broken.clear()
+        self.server.requests.clear()
+        enriched, errors = get_citations_by_pmids(self.manager, self.pmids, group_size=2, client=self.client)
+        self.assertEqual(set(), errors)
+        self.assertEqual(set(self.pmids), set(enriched))
+        self.assertEqual(self.pmids[:2], self._get_requested())
+
+    def test_not_retried(self):
+        """Test client errors are not retried."""
+        self.server.failures.append(404)
+        _, errors = get_citations_by_pmids(self.manager, self.pmids[:2], client=self.client)
+        self.assertEqual(set(self.pmids[:2]), errors)
+        self.assertEqual(1, len(self.server.requests))
@@ -1,16 +1,22 @@
 """Tests for instantiating the manager."""
 
+import multiprocessing
 import os
 import tempfile
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
-from pybel import Manager
-from pybel.manager.base_manager import build_engine_session
-
-try:
-    from unittest import mock
-except ImportError:
-    from unittest import mock
+from pybel import BELGraph, Manager
+from pybel.dsl import Protein
+from pybel.manager.base_manager import (
+    build_engine_session,
+    get_engine_kwargs,
+    is_sqlite_memory,
+)
+from pybel.testing.cases import TEST_CONNECTION
+from pybel.testing.mocks import mock_bel_resources
+from pybel.testing.utils import make_dummy_namespaces, n
 
 
 class TestInstantiation(unittest.TestCase):
@@ -82,3 +88,126 @@ class TestInstantiation(unittest.TestCase):
     def test_instantiate_manager_session_missing(self):
         with self.assertRaises(ValueError):
             Manager(engine="fake-engine", session=None)
+
+    def test_pool_options(self):
+        """Test the pool options are passed to the engine."""
+        manager = Manager(self.connection, pool_size=3, max_overflow=2, pool_pre_ping=True, pool_recycle=60)
+        self.assertEqual(3, manager.engine.pool.size())
+        self.assertEqual(2, manager.engine.pool._max_overflow)
+        self.assertTrue(manager.engine.pool._pre_ping)
+        self.assertEqual(60, manager.engine.pool._recycle)
+
+        worker_manager = manager.for_worker()
+        self.assertIsNot(manager.engine, worker_manager.engine)
+        self.assertIsNot(manager.session, worker_manager.session)
+        self.assertEqual(manager.engine.url, worker_manager.engine.url)
+        self.assertEqual(3, worker_manager.engine.pool.size())
+        manager.engine.dispose()
+        worker_manager.engine.dispose()
+
+    def test_pool_options_memory(self):
+        """Test the pool size is ignored for in-memory SQLite databases, which have no pool to size."""
+        self.assertEqual({"pool_recycle": 60}, get_engine_kwargs("sqlite://", pool_size=3, pool_recycle=60))
+        self.assertEqual({"pool_size": 3}, get_engine_kwargs("postgresql://localhost/pybel", pool_size=3))
+        manager = Manager("sqlite://", pool_size=3)
+        self.assertEqual(0, manager.count_networks())
+
+    def test_for_worker_memory(self):
+        """Test workers can't get managers for in-memory SQLite databases, which they would not share."""
+        for connection in ("sqlite://", "sqlite:///:memory:"):
+            with self.subTest(connection=connection):
+                self.assertTrue(is_sqlite_memory(connection))
+                with self.assertRaises(ValueError):
+                    Manager(connection).for_worker()
+        self.assertFalse(is_sqlite_memory(self.connection))
+
+    def test_sqlite_wal(self):
+        """Test SQLite databases can use write-ahead logging."""
+        manager = Manager(self.connection, sqlite_wal=True)
+        with manager.engine.connect() as connection:
+            self.assertEqual("wal", connection.exec_driver_sql("PRAGMA journal_mode").scalar())
+        manager.engine.dispose()
+
+
+#: The manager that the process pool's workers get their own managers from
+_parent_manager: Manager | None = None
+#: The manager of a process pool's worker
+_worker_manager: Manager | None = None
+
+
+def _initialize_worker() -> None:
+    global _worker_manager
+    _worker_manager = _parent_manager.for_worker()
+
+
+def _insert_and_query(graph: BELGraph) -> tuple[int, int, int]:
+    with mock_bel_resources:
+        network = _worker_manager.insert_graph(graph, use_tqdm=False)
+    return os.getpid(), network.id, _worker_manager.get_graph_by_id(network.id).number_of_edges()
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), reason="needs processes to be forked")
+class TestWorkers(unittest.TestCase):
+    """Test inserting and querying from the workers of a process pool."""
+
+    def _run(self, manager: Manager) -> None:
+        global _parent_manager
+        graphs = []
+        for i in range(6):
+            graph = BELGraph(name=f"worker graph {i}", version="1.0.0")
+            for j in range(i + 1):
+                graph.add_increases(
+                    Protein("hgnc", f"A{i}-{j}"), Protein("hgnc", f"B{i}-{j}"), citation=n(), evidence=n()
+                )
+            graphs.append(graph)
+
+        # namespaces are made up front since workers that make the same namespace at the same time would conflict
+        union = BELGraph()
+        for graph in graphs:
+            union.add_edges_from(graph.edges(keys=True, data=True))
+        make_dummy_namespaces(manager, union)
+        for graph in graphs:
+            graph.namespace_url.update(union.namespace_url)
+        # the parent has open connections while the workers are forked
+        self.assertEqual(0, manager.count_networks())
+
+        _parent_manager = manager
+        context = multiprocessing.get_context("fork")
+        try:
+            with ProcessPoolExecutor(max_workers=3, mp_context=context, initializer=_initialize_worker) as executor:
+                results = list(executor.map(_insert_and_query, graphs))
+        finally:
+            _parent_manager = None
+
+        self.assertEqual([graph.number_of_edges() for graph in graphs], [edges for _, _, edges in results])
+        self.assertNotIn(os.getpid(), {pid for pid, _, _ in results})
+        self.assertEqual(len(graphs), len({network_id for _, network_id, _ in results}))
+        self.assertEqual(len(graphs), manager.count_networks())
+        self.assertEqual(sum(graph.number_of_edges() for graph in graphs), manager.count_edges())
+
+    def test_sqlite_wal(self):
+        """Test workers on a SQLite database with write-ahead logging."""
+        fd, path = tempfile.mkstemp()
+        manager = Manager("sqlite:///" + path, sqlite_wal=True)
+        try:
+            self._run(manager)
+        finally:
+            manager.session.close()
+            manager.engine.dispose()
+            os.close(fd)
+            os.remove(path)
+
+    @unittest.skipUnless(
+        TEST_CONNECTION and TEST_CONNECTION.startswith("postgresql"),
+        reason="needs a PostgreSQL database configured as the pybel test_connection",
+    )
+    def test_postgresql(self):
+        """Test workers on a PostgreSQL database, with small pools that are checked before use."""
+        manager = Manager(TEST_CONNECTION, pool_size=2, max_overflow=0, pool_pre_ping=True)
+        manager.drop_all()
+        manager.create_all()
+        try:
+            self._run(manager)
+        finally:
+            manager.drop_all()
+            manager.engine.dispose()
@@ -1,12 +1,16 @@
 import os
 from pathlib import Path
 
+from sqlalchemy import event
+
 from pybel import BELGraph, Manager
 from pybel.constants import ANNOTATIONS
+from pybel.manager.models import Namespace, NamespaceEntry
 from pybel.resources import HGNC_URL
 from pybel.testing.cases import TemporaryCacheClsMixin
 from pybel.testing.constants import belns_dir_path
 from pybel.testing.mocks import mock_bel_resources
+from pybel.testing.utils import n
 from tests.constants import OPENBEL_ANNOTATION_RESOURCES
 
 ns1 = Path(os.path.join(belns_dir_path, "disease-ontology.belns")).as_uri()
@@ -105,3 +109,40 @@ class TestDefinitionManagers(TemporaryCacheClsMixin):
         data = {}
         entries = self.manager._get_annotation_entries_from_data(graph, data)
         self.assertIsNone(entries)
+
+    def test_get_namespace_entry_ids(self):
+        """Test getting namespace entry identifiers in batches and caching them."""
+        url = n()
+        namespace = Namespace(keyword="TEST", url=url)
+        self.manager.session.add_all([NamespaceEntry(name=name, namespace=namespace) for name in ("A", "B", "C")])
+        self.manager.session.commit()
+
+        statements = []
+
+        def _count(*_):
+            statements.append(1)
+
+        event.listen(self.manager.engine, "before_cursor_execute", _count)
+        try:
+            entry_ids = self.manager.get_namespace_entry_ids(url, ["A", "B", "C", n()])
+            self.assertEqual({"A", "B", "C"}, set(entry_ids))
+            self.assertEqual(1, len(statements))
+
+            del statements[:]
+            self.assertEqual(entry_ids, self.manager.get_namespace_entry_ids(url, ["A", "B", "C"]))
+            self.assertEqual(0, len(statements))
+        finally:
+            event.remove(self.manager.engine, "before_cursor_execute", _count)
+        self.assertEqual(self.manager.get_namespace_entry(url, "B").id, entry_ids["B"])
+
+        self.manager.namespace_entry_cache_max_size = 2
+        self.manager.clear_namespace_entry_cache()
+        self.manager.get_namespace_entry_ids(url, ["A", "B"])
+        self.manager.get_namespace_entry_ids(url, ["A"])
+        self.manager.get_namespace_entry_ids(url, ["C"])
+        self.assertEqual([(url, "A"), (url, "C")], list(self.manager._namespace_entry_cache))
+        del self.manager.namespace_entry_cache_max_size
+
+        self.manager.drop_namespace_by_url(url)
+        self.assertEqual(0, len(self.manager._namespace_entry_cache))
+        self.assertEqual({}, self.manager.get_namespace_entry_ids(url, ["A"]))
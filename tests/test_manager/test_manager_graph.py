@@ -1,14 +1,24 @@
 """Tests for manager functions handling BEL networks."""
 
+import copy
+import json
+import os
+import tempfile
 import time
 import unittest
 from collections import Counter
 from random import randint
 
+import networkx as nx
+from sqlalchemy import func
+from sqlalchemy import inspect as sa_inspect
+
 from pybel import BELGraph, from_bel_script, from_database, to_database
 from pybel.constants import (
     ABUNDANCE,
+    ASSOCIATION,
     BIOPROCESS,
+    CITATION,
     CITATION_TYPE_PUBMED,
     DECREASES,
     HAS_PRODUCT,
@@ -23,6 +33,8 @@ from pybel.constants import (
     PATHOLOGY,
     PROTEIN,
     RELATION,
+    RELATION_CLASS_CAUSAL,
+    RELATION_CLASSES,
 )
 from pybel.dsl import (
     BaseEntity,
@@ -46,10 +58,27 @@ from pybel.dsl import (
     translocation,
 )
 from pybel.dsl.namespaces import chebi, hgnc, mirbase
-from pybel.examples import ras_tloc_graph, sialic_acid_graph
+from pybel.examples import homology_graph, ras_tloc_graph, sialic_acid_graph
 from pybel.language import Entity
-from pybel.manager import models
-from pybel.manager.models import Author, Citation, Edge, Evidence, NamespaceEntry, Node
+from pybel.manager import (
+    EDGE_LOADERS,
+    NEIGHBORHOOD_DIRECTIONS,
+    Manager,
+    graph_from_edge_store,
+    graph_from_edges,
+    models,
+    search,
+)
+from pybel.manager.models import (
+    Author,
+    Citation,
+    Edge,
+    Evidence,
+    Namespace,
+    NamespaceEntry,
+    Network,
+    Node,
+)
 from pybel.testing.cases import (
     FleetingTemporaryCacheMixin,
     TemporaryCacheClsMixin,
@@ -57,7 +86,12 @@ from pybel.testing.cases import (
 )
 from pybel.testing.constants import test_bel_simple
 from pybel.testing.mocks import mock_bel_resources
-from pybel.testing.utils import make_dummy_annotations, make_dummy_namespaces, n
+from pybel.testing.utils import (
+    count_statements,
+    make_dummy_annotations,
+    make_dummy_namespaces,
+    n,
+)
 from tests.constants import (
     BelReconstitutionMixin,
     akt1,
@@ -186,6 +220,519 @@ class TestNetworkCache(BelReconstitutionMixin, FleetingTemporaryCacheMixin):
         to_database(ras_tloc_graph, manager=self.manager)
 
 
+class TestGraphCache(TemporaryCacheMixin):
+    """Test the cache of deserialized graphs and universes in the manager."""
+
+    def _insert(self, graph: BELGraph):
+        # deep copy since the dummy namespaces are written into the graph's namespace dictionaries
+        graph = copy.deepcopy(graph)
+        make_dummy_namespaces(self.manager, graph)
+        make_dummy_annotations(self.manager, graph)
+        with mock_bel_resources:
+            return self.manager.insert_graph(graph, use_tqdm=False)
+
+    def setUp(self):
+        """Set up the cache with two networks."""
+        super().setUp()
+        self.manager.graph_cache_max_elements = 5_000_000
+        self.sialic_acid_id = self._insert(sialic_acid_graph).id
+        self.ras_tloc_id = self._insert(ras_tloc_graph).id
+
+    def test_cache(self):
+        """Test that graphs and universes are cached, frozen, and invalidated when networks are dropped."""
+        graph = self.manager.get_graph_by_id(self.sialic_acid_id)
+        self.assertTrue(nx.is_frozen(graph))
+        self.assertIs(graph, self.manager.get_graph_by_id(self.sialic_acid_id))
+        self.assertFalse(nx.is_frozen(graph.copy()))
+        with self.assertRaises(nx.NetworkXError):
+            graph.add_node(Protein("HGNC", "YFG"))
+
+        universe = self.manager.get_graph_by_ids([self.ras_tloc_id, self.sialic_acid_id])
+        self.assertIs(universe, self.manager.get_graph_by_ids([self.sialic_acid_id, self.ras_tloc_id]))
+        self.assertEqual(
+            sialic_acid_graph.number_of_edges() + ras_tloc_graph.number_of_edges(), universe.number_of_edges()
+        )
+        self.assertEqual(3, len(self.manager._graph_cache))
+
+        self.manager.drop_network_by_id(self.ras_tloc_id)
+        self.assertEqual([(self.sialic_acid_id,)], list(self.manager._graph_cache))
+
+        self.manager.drop_networks()
+        self.assertEqual(0, len(self.manager._graph_cache))
+        self.assertEqual(0, self.manager._graph_cache_elements)
+
+    def test_drop_network(self):
+        """Test that dropping a network removes the graphs and universes that contain it."""
+        self.manager.get_graph_by_id(self.sialic_acid_id)
+        self.manager.get_graph_by_id(self.ras_tloc_id)
+        self.manager.get_graph_by_ids([self.sialic_acid_id, self.ras_tloc_id])
+
+        self.manager.drop_network(self.manager.get_network_by_id(self.sialic_acid_id))
+        self.assertEqual([(self.ras_tloc_id,)], list(self.manager._graph_cache))
+        self.assertEqual(
+            ras_tloc_graph.number_of_nodes() + ras_tloc_graph.number_of_edges(),
+            self.manager._graph_cache_elements,
+        )
+
+    def test_drop_all(self):
+        """Test that dropping the database clears the graph cache."""
+        self.manager.get_graph_by_id(self.sialic_acid_id)
+        self.manager.drop_all()
+        self.assertEqual(0, len(self.manager._graph_cache))
+        self.assertEqual(0, self.manager._graph_cache_elements)
+
+    def test_insert_reused_id(self):
+        """Test that inserting a network removes cached graphs under its identifier, since databases may reuse them."""
+        for bulk in (False, True):
+            with self.subTest(bulk=bulk):
+                self.manager.clear_graph_cache()
+                network_id = self.manager.session.query(func.max(Network.id)).scalar() + 1
+                self.manager._set_cached_graph((network_id,), sialic_acid_graph.copy())
+                self.manager._set_cached_graph((self.sialic_acid_id,), sialic_acid_graph.copy())
+
+                graph = copy.deepcopy(homology_graph)
+                graph.version = f"{graph.version}-{bulk}"
+                make_dummy_namespaces(self.manager, graph)
+                make_dummy_annotations(self.manager, graph)
+                with mock_bel_resources:
+                    network = self.manager.insert_graph(graph, use_tqdm=False, bulk=bulk)
+                self.assertEqual(network_id, network.id)
+                self.assertEqual([(self.sialic_acid_id,)], list(self.manager._graph_cache))
+
+    def test_disabled(self):
+        """Test that graphs are neither cached nor frozen by default."""
+        self.manager.graph_cache_max_elements = type(self.manager).graph_cache_max_elements
+        graph = self.manager.get_graph_by_id(self.sialic_acid_id)
+        self.assertFalse(nx.is_frozen(graph))
+        self.assertIsNot(graph, self.manager.get_graph_by_id(self.sialic_acid_id))
+        self.assertFalse(nx.is_frozen(self.manager.get_graph_by_ids([self.sialic_acid_id, self.ras_tloc_id])))
+        self.assertEqual(0, len(self.manager._graph_cache))
+
+    def test_eviction(self):
+        """Test the least recently used graphs are evicted when the cache is full."""
+        self.manager.graph_cache_max_elements = (
+            sialic_acid_graph.number_of_nodes() + sialic_acid_graph.number_of_edges()
+        )
+        self.manager.get_graph_by_id(self.sialic_acid_id)
+        self.assertEqual([(self.sialic_acid_id,)], list(self.manager._graph_cache))
+
+        # too big to fit, so it's neither cached nor frozen
+        self.assertFalse(nx.is_frozen(self.manager.get_graph_by_ids([self.sialic_acid_id, self.ras_tloc_id])))
+
+        self.manager.get_graph_by_id(self.ras_tloc_id)
+        self.assertEqual([(self.ras_tloc_id,)], list(self.manager._graph_cache))
+
+        self.manager.graph_cache_max_elements = 0
+        self.manager.clear_graph_cache()
+        self.assertFalse(nx.is_frozen(self.manager.get_graph_by_id(self.sialic_acid_id)))
+
+
+class TestBulkInsert(TemporaryCacheMixin):
+    """Test inserting graphs with multi-row inserts stores the same rows as inserting them through the ORM."""
+
+    def setUp(self):
+        """Set up the test with a second manager for the ORM insert."""
+        super().setUp()
+        self.fd_orm, self.path_orm = tempfile.mkstemp()
+        self.orm_manager = Manager(connection="sqlite:///" + self.path_orm, autoflush=True)
+        self.orm_manager.create_all()
+
+    def tearDown(self):
+        """Tear down the second manager."""
+        self.orm_manager.session.close()
+        self.orm_manager.engine.dispose()
+        os.close(self.fd_orm)
+        os.remove(self.path_orm)
+        super().tearDown()
+
+    @staticmethod
+    def _get_graph(manager: Manager) -> BELGraph:
+        graph = copy.deepcopy(sialic_acid_graph)
+        make_dummy_namespaces(manager, graph)
+        make_dummy_annotations(manager, graph)
+        graph.namespace_pattern["dbsnp"] = r"^rs\d+$"
+        graph.add_association(
+            Gene("dbsnp", "rs123"),
+            Gene("dbsnp", "rs456"),
+            citation=test_citation_dict,
+            evidence=test_evidence_text,
+        )
+        return graph
+
+    @staticmethod
+    def _get_rows(manager: Manager, network):
+        session = manager.session
+        nodes = {
+            (node.md5, node.bel, node.type, node.namespace_entry and node.namespace_entry.name)
+            for node in session.query(Node)
+        }
+        edges = {
+            (
+                edge.md5,
+                edge.bel,
+                edge.relation,
+                edge.source.md5,
+                edge.target.md5,
+                edge.evidence and (edge.evidence.citation.db, edge.evidence.citation.db_id, edge.evidence.text),
+                frozenset((entry.namespace.keyword, entry.name) for entry in edge.annotations),
+            )
+            for edge in session.query(Edge)
+        }
+        return (
+            nodes,
+            edges,
+            {node.md5 for node in network.nodes},
+            {edge.md5 for edge in network.edges},
+            session.query(Citation).count(),
+            session.query(Evidence).count(),
+            session.query(NamespaceEntry).count(),
+        )
+
+    def test_same_rows(self):
+        """Test a bulk insert into an empty database stores the same rows as an ORM insert."""
+        with mock_bel_resources:
+            orm_network = self.orm_manager.insert_graph(self._get_graph(self.orm_manager), use_tqdm=False)
+            bulk_network = self.manager.insert_graph(self._get_graph(self.manager), use_tqdm=False, bulk=True)
+
+        expected = self._get_rows(self.orm_manager, orm_network)
+        self.assertEqual(expected, self._get_rows(self.manager, bulk_network))
+        self.assertIn(Gene("dbsnp", "rs123").md5, expected[2])
+
+        orm_graph = self.orm_manager.get_graph_by_id(orm_network.id)
+        bulk_graph = self.manager.get_graph_by_id(bulk_network.id)
+        self.assertEqual(set(orm_graph.edges(keys=True)), set(bulk_graph.edges(keys=True)))
+
+    def test_reuse_rows(self):
+        """Test a bulk insert reuses the rows that are already in the database."""
+        graph = self._get_graph(self.manager)
+        with mock_bel_resources:
+            orm_network = self.manager.insert_graph(graph, use_tqdm=False)
+            expected = self._get_rows(self.manager, orm_network)
+            graph.version = "1.0.0-bulk"
+            bulk_network = self.manager.insert_graph(graph, use_tqdm=False, bulk=True)
+
+        self.assertNotEqual(orm_network.id, bulk_network.id)
+        self.assertEqual(expected, self._get_rows(self.manager, bulk_network))
+
+
+def _insert_sialic_acid_graph(manager: Manager):
+    graph = copy.deepcopy(sialic_acid_graph)
+    make_dummy_namespaces(manager, graph)
+    make_dummy_annotations(manager, graph)
+    with mock_bel_resources:
+        return manager.insert_graph(graph, use_tqdm=False)
+
+
+class TestGraphFromEdgeStore(TemporaryCacheMixin):
+    """Test building graphs from the edge store without loading ORM models."""
+
+    def setUp(self):
+        """Set up the test with a network in the edge store."""
+        super().setUp()
+        self.network = _insert_sialic_acid_graph(self.manager)
+
+    def assert_same_graph(self, expected: BELGraph, actual: BELGraph):
+        """Assert the graphs have the same nodes, and the same edges with the same data.
+
+        The keys aren't compared since :func:`graph_from_edges` hashes the edges again.
+        """
+        self.assertEqual(set(expected), set(actual))
+        self.assertEqual(
+            Counter((u, v, json.dumps(d, sort_keys=True)) for u, v, d in expected.edges(data=True)),
+            Counter((u, v, json.dumps(d, sort_keys=True)) for u, v, d in actual.edges(data=True)),
+        )
+
+    def test_network(self):
+        """Test building the graph of a network."""
+        graph = self.manager.get_graph_from_edge_store(self.network.id)
+        self.assertEqual(sialic_acid_graph.name, graph.name)
+        self.assert_same_graph(graph_from_edges(self.network.edges), graph)
+        self.assertEqual(
+            {(u, v, k) for u, v, k in sialic_acid_graph.edges(keys=True)},
+            {(u, v, k) for u, v, k in graph.edges(keys=True)},
+        )
+
+    def test_queries(self):
+        """Test building graphs of query results, in batches."""
+        nodes = self.manager.session.query(Node).limit(4).all()
+        self.assert_same_graph(
+            graph_from_edges(self.manager.query_neighbors(nodes)),
+            self.manager.get_neighbors_graph(nodes),
+        )
+        self.assert_same_graph(
+            graph_from_edges(self.manager.query_induction(nodes)),
+            self.manager.get_induction_graph(nodes),
+        )
+        pubmed_identifiers = [citation.db_id for citation in self.manager.session.query(Citation)]
+        self.assert_same_graph(
+            graph_from_edges(self.manager.query_edges_by_pubmed_identifiers(pubmed_identifiers)),
+            self.manager.get_graph_by_pubmed_identifiers(pubmed_identifiers),
+        )
+        self.assert_same_graph(
+            graph_from_edges(self.network.edges),
+            graph_from_edge_store(self.manager.session, yield_per=3),
+        )
+
+    def test_statements(self):
+        """Test the number of statements doesn't grow with the number of edges."""
+        with count_statements(self.manager) as statements:
+            graph_from_edge_store(self.manager.session)
+        self.assertEqual(2, len(statements))
+
+
+class TestEdgeQueries(TemporaryCacheMixin):
+    """Test eagerly loading, projecting, and paginating edge queries."""
+
+    def setUp(self):
+        """Set up the test with a network in the edge store."""
+        super().setUp()
+        self.network = _insert_sialic_acid_graph(self.manager)
+        self.nodes = self.manager.session.query(Node).all()
+        self.manager.session.expunge_all()
+
+    @staticmethod
+    def _serialize(edges):
+        return [(edge.to_json(), edge.evidence and edge.evidence.citation.to_json()) for edge in edges]
+
+    def test_eager(self):
+        """Test eager loading gives the same edges with a constant number of statements."""
+        with count_statements(self.manager) as statements:
+            expected = self._serialize(self.manager.query_neighbors(self.nodes))
+        self.assertLess(len(expected), len(statements))
+
+        for eager in EDGE_LOADERS:
+            with self.subTest(eager=eager):
+                self.manager.session.expunge_all()
+                with count_statements(self.manager) as statements:
+                    self.assertEqual(expected, self._serialize(self.manager.query_neighbors(self.nodes, eager=eager)))
+                self.assertGreaterEqual(6, len(statements))
+
+        with self.assertRaises(ValueError):
+            self.manager.query_edges(eager="lazy")
+
+    def test_iter_edges(self):
+        """Test iterating over edges in pages."""
+        expected = self.manager.session.query(Edge).order_by(Edge.id).all()
+        self.manager.session.expunge_all()
+        with count_statements(self.manager) as statements:
+            edges = list(self.manager.iter_edges(page_size=5))
+            self._serialize(edges)
+        self.assertEqual([edge.id for edge in expected], [edge.id for edge in edges])
+        # each of the three pages loads the edges, sources, targets, evidences, citations, and authors
+        self.assertEqual(3 * 6, len(statements))
+
+        query = self.manager.query_edges(relation=INCREASES)
+        self.assertEqual(
+            sorted(edge.id for edge in query),
+            [edge.id for edge in self.manager.iter_edges(query, page_size=1, eager=None)],
+        )
+
+    def test_rows(self):
+        """Test projecting edges to rows."""
+        edges = {edge.id: edge for edge in self.manager.session.query(Edge)}
+        rows = list(self.manager.query_edge_rows())
+        self.assertEqual(sorted(edges), [row.id for row in rows])
+        for row in rows:
+            edge = edges[row.id]
+            self.assertEqual((edge.md5, edge.bel, edge.relation), (row.md5, row.bel, row.relation))
+            self.assertEqual((edge.source.bel, edge.target.bel), (row.source_bel, row.target_bel))
+            if edge.evidence is None:
+                self.assertIsNone(row.evidence)
+            else:
+                self.assertEqual(edge.evidence.text, row.evidence)
+                self.assertEqual(edge.evidence.citation.db_id, row.citation_db_id)
+
+        rows = list(self.manager.query_edge_rows(Edge.relation == INCREASES))
+        self.assertLess(0, len(rows))
+        self.assertTrue(all(row.relation == INCREASES for row in rows))
+
+    def test_annotations(self):
+        """Test getting the annotations of many edges at once."""
+        edges = self.manager.session.query(Edge).order_by(Edge.id).all()
+        namespace = Namespace(keyword="TEST", url=n(), is_annotation=True)
+        entries = [NamespaceEntry(name=name, namespace=namespace) for name in ("a", "b")]
+        edges[0].annotations.append(entries[0])
+        edges[1].annotations.extend(entries)
+        self.manager.session.commit()
+        edges = self.manager.session.query(Edge).all()
+        with count_statements(self.manager) as statements:
+            annotations = self.manager.get_annotations_by_edge(edges)
+            names = {
+                edge_id: {(entry.namespace.keyword, entry.name) for entry in entries}
+                for edge_id, entries in annotations.items()
+            }
+        self.assertEqual(1, len(statements))
+        self.assertLess(0, len(names))
+        for edge in edges:
+            self.assertEqual(
+                {(entry.namespace.keyword, entry.name) for entry in edge.annotations},
+                names.get(edge.id, set()),
+            )
+
+
+class TestNeighborhoodQueries(TemporaryCacheMixin):
+    """Test multi-hop neighborhood queries with recursive common table expressions."""
+
+    def setUp(self):
+        """Set up the test with a chain of causal edges and some other edges."""
+        super().setUp()
+        self.a, self.b, self.c, self.d, self.e, self.f = (Protein("hgnc", name) for name in "ABCDEF")
+        graph = BELGraph(name=n(), version=n())
+        graph.add_increases(self.a, self.b, citation=n(), evidence=n())
+        graph.add_decreases(self.b, self.c, citation=n(), evidence=n())
+        graph.add_increases(self.c, self.d, citation=n(), evidence=n())
+        graph.add_association(self.e, self.b, citation=n(), evidence=n())
+        graph.add_part_of(self.d, self.f)
+        make_dummy_namespaces(self.manager, graph)
+        with mock_bel_resources:
+            self.manager.insert_graph(graph, use_tqdm=False)
+        self.graph = graph
+        self.ids = {node: self.manager.get_node_by_hash(node.md5).id for node in graph}
+        self.edge_ids = {key: self.manager.get_edge_by_hash(key).id for _, _, key in graph.edges(keys=True)}
+
+    def _get_expected(self, nodes, hops, direction, relations=None):
+        """Expand the neighborhood in Python."""
+        rv = set()
+        frontier = set(nodes)
+        for _ in range(hops):
+            reached = set()
+            for u, v, key, data in self.graph.edges(keys=True, data=True):
+                if relations is not None and data[RELATION] not in relations:
+                    continue
+                if direction != "upstream" and u in frontier:
+                    rv.add(self.edge_ids[key])
+                    reached.add(v)
+                if direction != "downstream" and v in frontier:
+                    rv.add(self.edge_ids[key])
+                    reached.add(u)
+            frontier = reached
+        return sorted(rv)
+
+    def test_edge_ids(self):
+        """Test the edge identifiers are the same as from expanding in Python."""
+        for hops in range(4):
+            for direction in NEIGHBORHOOD_DIRECTIONS:
+                for relation_class in (None, RELATION_CLASS_CAUSAL):
+                    with self.subTest(hops=hops, direction=direction, relation_class=relation_class):
+                        relations = None if relation_class is None else RELATION_CLASSES[relation_class]
+                        self.assertEqual(
+                            self._get_expected([self.b], hops, direction, relations),
+                            self.manager.get_neighborhood_edge_ids(
+                                [self.ids[self.b]], hops, direction, relation_class=relation_class
+                            ),
+                        )
+
+        nodes = self.manager.session.query(Node).filter(Node.id == self.ids[self.b]).all()
+        self.assertEqual(
+            sorted(edge.id for edge in self.manager.query_neighbors(nodes)),
+            self.manager.get_neighborhood_edge_ids(nodes),
+        )
+        self.assertEqual(
+            self._get_expected([self.b], 2, "both", {ASSOCIATION, DECREASES}),
+            self.manager.get_neighborhood_edge_ids(nodes, 2, relations=[ASSOCIATION, DECREASES]),
+        )
+
+        for kwargs in ({"hops": -1}, {"direction": "sideways"}, {"relation_class": "magic"}):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                self.manager.get_neighborhood_edge_ids(nodes, **kwargs)
+
+    def test_graphs(self):
+        """Test getting neighborhoods as graphs."""
+        graph = self.manager.get_downstream_causal_graph([self.ids[self.b]], hops=5)
+        self.assertEqual({self.b, self.c, self.d}, set(graph))
+        self.assertEqual({(self.b, self.c), (self.c, self.d)}, set(graph.edges()))
+
+        graph = self.manager.get_upstream_causal_graph([self.ids[self.d]], hops=2)
+        self.assertEqual({(self.b, self.c), (self.c, self.d)}, set(graph.edges()))
+
+        graph = self.manager.get_neighborhood_graph([self.ids[self.b]], hops=2)
+        self.assertEqual({self.a, self.b, self.c, self.d, self.e}, set(graph))
+
+
+class TestFullTextSearch(TemporaryCacheMixin):
+    """Test ranked full-text search over evidences and BEL statements."""
+
+    def setUp(self):
+        """Set up the test with edges with different evidences."""
+        super().setUp()
+        self.a, self.b, self.c = (Protein("hgnc", name) for name in ("AKT1", "MTOR", "EGFR"))
+        graph = BELGraph(name=n(), version=n())
+        self.keys = {
+            "twice": graph.add_increases(
+                self.a, self.b, citation=n(), evidence="Phosphorylation of MTOR by AKT1, then phosphorylation of X."
+            ),
+            "once": graph.add_decreases(self.b, self.c, citation=n(), evidence="EGFR phosphorylated by the kinase."),
+            "other": graph.add_directly_increases(
+                self.c, self.a, citation=n(), evidence="An unrelated 100% observation."
+            ),
+        }
+        make_dummy_namespaces(self.manager, graph)
+        with mock_bel_resources:
+            self.network = self.manager.insert_graph(graph, use_tqdm=False)
+        self.edge_ids = {name: self.manager.get_edge_by_hash(key).id for name, key in self.keys.items()}
+
+    def _search(self, query, **kwargs):
+        return [(edge.id, score) for edge, score in self.manager.search_edges(query, **kwargs)]
+
+    def test_evidence(self):
+        """Test searching evidences is ranked and matches stemmed words."""
+        self.assertTrue(search.has_search_index(self.manager.session.connection(), "evidence"))
+        results = self._search("phosphorylation")
+        self.assertEqual([self.edge_ids["twice"], self.edge_ids["once"]], [edge_id for edge_id, _ in results])
+        self.assertGreater(results[0][1], results[1][1])
+        self.assertEqual([self.edge_ids["twice"]], [edge_id for edge_id, _ in self._search("phosphorylation", limit=1)])
+        self.assertEqual([self.edge_ids["once"]], [edge_id for edge_id, _ in self._search("kinase EGFR")])
+        self.assertEqual([], self._search("kinase AKT1"))
+        self.assertEqual([], self._search("  "))
+
+    def test_bel(self):
+        """Test searching BEL statements with punctuation in the query."""
+        self.assertEqual(
+            {self.edge_ids["twice"], self.edge_ids["other"]},
+            {edge_id for edge_id, _ in self._search("AKT1", field="bel", eager="selectin")},
+        )
+        self.assertEqual(
+            [self.edge_ids["twice"]], [edge_id for edge_id, _ in self._search("p(HGNC:AKT1) MTOR", field="bel")]
+        )
+        with self.assertRaises(ValueError):
+            self.manager.search_edges("AKT1", field="nope")
+
+    def test_sync(self):
+        """Test the index is kept in sync when edges are inserted and dropped."""
+        graph = BELGraph(name=n(), version=n())
+        graph.add_increases(self.a, self.c, citation=n(), evidence="Phosphorylation again.")
+        make_dummy_namespaces(self.manager, graph)
+        with mock_bel_resources:
+            self.manager.insert_graph(graph, use_tqdm=False, bulk=True)
+        self.assertEqual(3, len(self._search("phosphorylation")))
+
+        self.manager.drop_network(self.network)
+        self.assertEqual(1, len(self._search("phosphorylation")))
+        self.assertEqual(1, len(self._search("AKT1", field="bel")))
+
+    def test_create_search_index(self):
+        """Test searching falls back to substring search before the index is added to an existing database."""
+        connection = self.manager.session.connection()
+        for field in search.SEARCH_FIELDS.values():
+            connection.exec_driver_sql(f"DROP TABLE {field.fts_table}")
+        connection.exec_driver_sql("DROP INDEX ix_pybel_edge_evidence_id")
+        self.manager.session.commit()
+        self.assertFalse(search.has_search_index(self.manager.session.connection(), "evidence"))
+
+        self.assertEqual(
+            [(self.edge_ids["twice"], 0.0)], self._search("phosphorylation of"), msg="should use substring search"
+        )
+        self.assertEqual([(self.edge_ids["other"], 0.0)], self._search("100%"), msg="should escape wildcards")
+
+        self.manager.create_search_index()
+        self.assertTrue(search.has_search_index(self.manager.session.connection(), "bel"))
+        indexes = sa_inspect(self.manager.engine).get_indexes(models.EDGE_TABLE_NAME)
+        self.assertIn("ix_pybel_edge_evidence_id", {index["name"] for index in indexes})
+        results = self._search("phosphorylation")
+        self.assertEqual([self.edge_ids["twice"], self.edge_ids["once"]], [edge_id for edge_id, _ in results])
+        self.assertNotEqual(0.0, results[0][1])
+
+
 class TestTemporaryInsertNetwork(TemporaryCacheMixin):
     def test_insert_with_list_annotations(self):
         """This test checks that graphs that contain list annotations, which aren't cached, can be loaded properly
@@ -411,7 +958,7 @@ class TestEnsure(TemporaryCacheMixin):
 
         evidence = self.manager.get_or_create_evidence(basic_citation, utf8_test_evidence)
         self.assertIsInstance(evidence, Evidence)
-        self.assertIn(evidence, self.manager.object_cache_evidence.values())
+        self.assertIs(evidence, self.manager.object_cache_evidence.get((citation_db, citation_ref, utf8_test_evidence)))
 
         # Objects cached?
         reloaded_evidence = self.manager.get_or_create_evidence(basic_citation, utf8_test_evidence)
@@ -438,6 +985,93 @@ class TestEnsure(TemporaryCacheMixin):
         self.assertEqual(author, author_from_get)
 
 
+class TestObjectCaches(TemporaryCacheMixin):
+    """Test the object caches of the insert manager keep a bounded number of models."""
+
+    def test_bounded(self):
+        """Test the least recently used keys are evicted and lookups are counted."""
+        self.manager.object_cache_author.max_size = 2
+        authors = [self.manager.get_or_create_author(name) for name in ("A", "B", "C")]
+        self.assertEqual(["B", "C"], list(self.manager.object_cache_author))
+        self.assertIs(authors[2], self.manager.object_cache_author.get("C"))
+
+        self.assertIs(authors[1], self.manager.get_or_create_author("B"))
+        self.assertIs(authors[0], self.manager.get_or_create_author("A"))
+        self.assertEqual(["B", "A"], list(self.manager.object_cache_author))
+        info = self.manager.cache_info()["author"]
+        self.assertEqual((2, 4, 2, 2), tuple(info))
+        self.assertAlmostEqual(1 / 3, self.manager.object_cache_author.hit_rate)
+
+        self.manager.clear_caches()
+        self.assertEqual(0, len(self.manager.object_cache_author))
+        self.assertEqual(2, self.manager.cache_info()["author"].hits)
+
+    def test_not_flushed(self):
+        """Test new models are cached without flushing them."""
+        author = self.manager.get_or_create_author("A")
+        self.assertIsNone(author.id)
+        self.assertIn(author, self.manager.session.new)
+        self.assertIs(author, self.manager.get_or_create_author("A"))
+        self.assertIn(author, self.manager.session.new)
+
+    def test_flush_evicted(self):
+        """Test new models are flushed when they are evicted, so they are found when they are looked up again."""
+        self.manager.object_cache_author.max_size = 1
+        with self.manager.session.no_autoflush:
+            author_a = self.manager.get_or_create_author("A")
+            self.assertIsNone(author_a.id)
+            self.manager.get_or_create_author("B")
+            self.assertIsNotNone(author_a.id)
+            self.assertEqual(["B"], list(self.manager.object_cache_author))
+            self.assertIs(author_a, self.manager.get_or_create_author("A"))
+        self.assertEqual(2, self.manager.session.query(Author).count())
+
+    def test_insert_small_cache(self):
+        """Test inserting a graph with caches smaller than it stores each row once."""
+        self.manager.clear_caches()
+        for _, cache in self.manager._iter_object_caches():
+            cache.max_size = 1
+        graph = copy.deepcopy(sialic_acid_graph)
+        make_dummy_namespaces(self.manager, graph)
+        make_dummy_annotations(self.manager, graph)
+        with mock_bel_resources:
+            self.manager.insert_graph(graph, use_tqdm=False)
+        self.assertEqual(graph.number_of_nodes(), self.manager.count_nodes())
+        self.assertEqual(graph.number_of_edges(), self.manager.count_edges())
+        citations = {data[CITATION][IDENTIFIER] for _, _, data in graph.edges(data=True) if CITATION in data}
+        self.assertEqual(len(citations), self.manager.count_citations())
+
+    def test_max_size(self):
+        """Test the size of the object caches can be given when making the manager."""
+        manager = Manager(connection=self.connection, object_cache_max_size=3)
+        self.assertEqual(3, manager.object_cache_max_size)
+        self.assertEqual(3, manager.object_cache_node.max_size)
+        self.assertEqual(3, manager.for_worker().object_cache_author.max_size)
+
+    def test_stale(self):
+        """Test cached models that were rolled back are not used."""
+        self.manager.get_or_create_author("A")
+        self.manager.session.rollback()
+        self.assertIn("A", self.manager.object_cache_author)
+
+        self.manager.session.add(Author(name="B"))
+        self.manager.session.commit()
+        author = self.manager.get_or_create_author("A")
+        self.assertEqual("A", author.name)
+        self.assertEqual(2, self.manager.session.query(Author).count())
+
+    def test_cleared_after_insert(self):
+        """Test the caches are cleared after a network is inserted."""
+        graph = copy.deepcopy(sialic_acid_graph)
+        make_dummy_namespaces(self.manager, graph)
+        make_dummy_annotations(self.manager, graph)
+        with mock_bel_resources:
+            self.manager.insert_graph(graph, use_tqdm=False)
+        self.assertEqual(0, len(self.manager.object_cache_node))
+        self.assertEqual(0, len(self.manager.object_cache_edge))
+        self.assertLess(0, self.manager.cache_info()["citation"].hits)
+
+
 class TestEdgeStore(TemporaryCacheClsMixin, BelReconstitutionMixin):
     """Tests that the cache can be queried."""
 
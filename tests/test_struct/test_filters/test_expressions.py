@@ -0,0 +1,152 @@
+"""Tests for compiled predicate expressions."""
+
+import pickle
+import unittest
+
+from pybel import BELGraph
+from pybel.constants import ASSOCIATION, DECREASES, INCREASES
+from pybel.dsl import Abundance, ComplexAbundance, Pathology, Protein
+from pybel.examples.sialic_acid_example import sialic_acid_graph
+from pybel.struct.filters import (
+    and_edge_predicates,
+    build_annotation_dict_any_filter,
+    build_relation_predicate,
+    concatenate_node_predicates,
+    filter_edges,
+    filter_nodes,
+    function_inclusion_filter_builder,
+    has_pubmed,
+    namespace_inclusion_builder,
+)
+from pybel.struct.filters.expressions import (
+    AnnotationHas,
+    CitationIn,
+    EdgePredicateExpression,
+    FunctionIs,
+    NamespaceIs,
+    Not,
+    RelationIn,
+    Source,
+    Target,
+)
+from pybel.struct.mutation import get_subgraph_by_edge_filter
+from pybel.testing.utils import n
+
+a, b = Protein("hgnc", "A"), Protein("hgnc", "B")
+c = Abundance("chebi", "C")
+d = Pathology("mesh", "D")
+ab = ComplexAbundance([a, b])
+
+
+class TestExpressions(unittest.TestCase):
+    """Test compiled expressions give the same results as the predicates they replace."""
+
+    def setUp(self):
+        """Set up a graph with a variety of edges."""
+        self.graph = BELGraph()
+        self.graph.annotation_list["Species"] = {"9606", "10090"}
+        self.k1 = self.graph.add_increases(a, b, citation="1", evidence=n(), annotations={"Species": "9606"})
+        self.k2 = self.graph.add_decreases(b, c, citation="2", evidence=n(), annotations={"Species": "10090"})
+        self.k3 = self.graph.add_association(c, d, citation=("pmc", "3"), evidence=n())
+        self.k4 = self.graph.add_increases(ab, d, citation="4", evidence=n())
+
+    def assert_edges(self, expected, predicate):
+        """Check the edges passing the predicate, both through filter_edges and by calling the predicate."""
+        self.assertEqual(set(expected), {k for _, _, k in filter_edges(self.graph, predicate)})
+        self.assertEqual(
+            set(expected),
+            {k for u, v, k in self.graph.edges(keys=True) if predicate(self.graph, u, v, k)},
+        )
+
+    def get_edges(self, func):
+        """Get the keys of the edges for which the function of the source, target, and data passes."""
+        return {k for u, v, k, data in self.graph.edges(keys=True, data=True) if func(u, v, data)}
+
+    def test_relation(self):
+        """Test filtering edges by relation."""
+        self.assert_edges({self.k1, self.k2, self.k4}, RelationIn(INCREASES, DECREASES))
+        self.assert_edges(
+            self.get_edges(lambda u, v, data: data["relation"] not in {INCREASES, DECREASES}),
+            ~RelationIn(INCREASES, DECREASES),
+        )
+
+    def test_annotation(self):
+        """Test filtering edges by annotation."""
+        self.assert_edges({self.k1, self.k2}, AnnotationHas("Species"))
+        self.assert_edges({self.k1}, AnnotationHas("Species", "9606"))
+        self.assert_edges({self.k1, self.k2}, AnnotationHas("Species", "9606", "10090"))
+        self.assert_edges(set(), AnnotationHas("Confidence", "High"))
+
+    def test_citation(self):
+        """Test filtering edges by citation."""
+        self.assert_edges(self.get_edges(lambda u, v, data: (u, v) != (b, c)), ~CitationIn("2"))
+        self.assert_edges(
+            self.get_edges(lambda u, v, data: d in (u, v)) - {self.k4},
+            CitationIn("1", "3") & ~CitationIn("1"),
+        )
+        self.assert_edges({self.k1}, CitationIn("1", "3", namespaces=["PubMed"]))
+
+    def test_nodes(self):
+        """Test filtering edges by their source and target nodes."""
+        self.assert_edges({self.k4}, Source(FunctionIs("Complex")))
+        self.assert_edges({self.k2}, Target(NamespaceIs("chebi")) & Source(NamespaceIs("hgnc")))
+        self.assert_edges(
+            self.get_edges(lambda u, v, data: u in {a, b, ab}),
+            Source(NamespaceIs("hgnc")) | Source(FunctionIs("Complex")),
+        )
+        with self.assertRaises(TypeError):
+            Source(RelationIn(INCREASES))
+        with self.assertRaises(TypeError):
+            RelationIn(INCREASES) & FunctionIs("Complex")
+
+    def test_node_filter(self):
+        """Test expressions over nodes work as node predicates."""
+        expression = FunctionIs("Protein", "Abundance") & ~NamespaceIs("chebi")
+        expected = set(
+            filter_nodes(
+                self.graph,
+                [
+                    function_inclusion_filter_builder(["Protein", "Abundance"]),
+                    lambda graph, node: not namespace_inclusion_builder("chebi")(graph, node),
+                ],
+            )
+        )
+        self.assertEqual({a, b}, expected)
+        self.assertEqual(expected, set(filter_nodes(self.graph, expression)))
+        self.assertEqual(expected, set(filter_nodes(self.graph, [expression.operands[0], Not(NamespaceIs("chebi"))])))
+
+    def test_mixed(self):
+        """Test expressions can be combined with predicate functions."""
+        predicate = and_edge_predicates([RelationIn(INCREASES, ASSOCIATION), has_pubmed])
+        self.assertEqual("And", type(predicate).__name__)
+        self.assert_edges({self.k1, self.k4}, predicate)
+
+        node_predicate = concatenate_node_predicates([FunctionIs("Protein"), lambda graph, node: node.name == "A"])
+        self.assertEqual({a}, set(filter_nodes(self.graph, node_predicate)))
+
+    def test_same_as_builders(self):
+        """Test expressions give the same sub-graphs as the equivalent builders on a larger graph."""
+        graph = sialic_acid_graph
+        annotations = graph._clean_annotations({"Confidence": ["High"]})
+        expected = get_subgraph_by_edge_filter(
+            graph,
+            [build_relation_predicate([INCREASES]), build_annotation_dict_any_filter(annotations)],
+        )
+        self.assertLess(0, expected.number_of_edges())
+        actual = get_subgraph_by_edge_filter(graph, RelationIn(INCREASES) & AnnotationHas("Confidence", "High"))
+        self.assertEqual(set(expected.edges(keys=True)), set(actual.edges(keys=True)))
+
+    def test_source(self):
+        """Test the compiled source inlines the tests and looks up the edge's data once."""
+        expression = RelationIn(INCREASES) & AnnotationHas("Species", "9606") & EdgePredicateExpression(has_pubmed)
+        self.assertEqual(3, len(expression.operands))
+        self.assertNotIn("graph[u]", expression.source)
+        self.assertIn("(graph, u, v, k)", expression.source)
+
+    def test_pickle(self):
+        """Test expressions can be pickled after they have been compiled."""
+        expression = RelationIn(INCREASES) & Source(FunctionIs("Protein"))
+        self.assert_edges({self.k1}, expression)
+        loaded = pickle.loads(pickle.dumps(expression))
+        self.assertNotIn("compiled", loaded.__dict__)
+        self.assert_edges({self.k1}, loaded)
@@ -7,6 +7,7 @@ from pybel.constants import CITATION_TYPE_PUBMED
 from pybel.dsl import protein
 from pybel.language import Entity
 from pybel.struct.grouping import get_subgraphs_by_annotation, get_subgraphs_by_citation
+from pybel.struct.grouping.utils import LazyStrata
 from pybel.testing.utils import n
 
 test_namespace_url = n()
@@ -92,6 +93,20 @@ class TestAnnotation(unittest.TestCase):
         self.assertIn(Entity(namespace="subgraph", identifier="2"), subgraphs)
         self.assertIn(sentinel, subgraphs)
 
+    def test_get_subgraphs_by_annotation_lazy(self):
+        """Test that lazy stratification gives the same sub-graphs."""
+        expected = get_subgraphs_by_annotation(self.graph, annotation="subgraph")
+        subgraphs = get_subgraphs_by_annotation(self.graph, annotation="subgraph", lazy=True)
+        self.assertEqual(set(expected), set(subgraphs))
+        for key, subgraph in expected.items():
+            self.assertIsInstance(subgraphs[key], BELGraph)
+            self.assertIn("test", subgraphs[key].namespace_url)
+            self.assertEqual(set(subgraph.edges(keys=True)), set(subgraphs[key].edges(keys=True)))
+
+        key = Entity(namespace="subgraph", identifier="1")
+        self.assertEqual(3, subgraphs.number_of_edges(key))
+        self.assertIs(subgraphs[key], subgraphs[key])
+
 
 class TestProvenance(unittest.TestCase):
     """Tests for getting sub-graphs by provenance information (citation, etc.)."""
@@ -135,3 +150,24 @@ class TestProvenance(unittest.TestCase):
         self.assertNotIn(b, c3_subgraph)
         self.assertNotIn(c, c3_subgraph)
         self.assertIn(d, c3_subgraph)
+
+    def test_get_subgraphs_by_citation_lazy(self):
+        """Test that lazy stratification by citation gives the same sub-graphs, with and without the index."""
+        graph = BELGraph()
+        c1, c2 = n(), n()
+        graph.add_increases(a, b, citation=c1, evidence=n())
+        graph.add_increases(a, b, citation=c2, evidence=n())
+        graph.add_increases(b, c, citation=c1, evidence=n())
+        graph.add_part_of(c, d)
+
+        expected = get_subgraphs_by_citation(graph)
+        for use_provenance_index in (True, False):
+            graph.use_provenance_index = use_provenance_index
+            with self.subTest(use_provenance_index=use_provenance_index):
+                subgraphs = get_subgraphs_by_citation(graph, lazy=True)
+                self.assertIsInstance(subgraphs, LazyStrata)
+                self.assertEqual(set(expected), set(subgraphs))
+                self.assertEqual(2, subgraphs.number_of_edges((CITATION_TYPE_PUBMED, c1)))
+                for key, subgraph in expected.items():
+                    self.assertIsInstance(subgraphs[key], BELGraph)
+                    self.assertEqual(set(subgraph.edges(keys=True)), set(subgraphs[key].edges(keys=True)))
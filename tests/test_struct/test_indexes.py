@@ -0,0 +1,294 @@
+"""Tests for secondary indexes over BEL graphs."""
+
+import pickle
+import unittest
+
+from pybel import BELGraph
+from pybel.constants import (
+    CITATION,
+    CITATION_AUTHORS,
+    RELATION_CLASS_CAUSAL,
+    RELATION_CLASS_CORRELATIVE,
+)
+from pybel.dsl import Protein
+from pybel.language import CitationDict
+from pybel.struct.filters.edge_predicate_builders import (
+    build_author_inclusion_filter,
+    build_pmid_inclusion_filter,
+)
+from pybel.struct.filters.node_predicates import (
+    has_causal_in_edges,
+    has_causal_out_edges,
+    is_causal_source,
+)
+from pybel.struct.grouping.provenance import get_subgraphs_by_citation
+from pybel.struct.indexes import AnnotationIndex, ProvenanceIndex, RelationIndex
+from pybel.struct.mutation.induction.annotations import (
+    _build_annotations_predicate,
+    get_subgraph_by_annotations,
+)
+from pybel.struct.mutation.induction.citation import (
+    get_subgraph_by_authors,
+    get_subgraph_by_pubmed,
+)
+from pybel.struct.mutation.induction.upstream import (
+    get_downstream_causal_subgraph,
+    get_upstream_causal_subgraph,
+)
+from pybel.struct.mutation.induction.utils import get_subgraph_by_edge_filter
+from pybel.struct.mutation.metadata import (
+    remove_extra_citation_metadata,
+    strip_annotations,
+)
+from pybel.struct.summary.provenance import (
+    get_pubmed_identifiers,
+    iterate_pubmed_identifiers,
+)
+from pybel.testing.utils import n
+
+a, b, c, d = (Protein(namespace="HGNC", name=name) for name in "ABCD")
+
+
+class TestRelationIndex(unittest.TestCase):
+    """Tests for the relation-typed adjacency index."""
+
+    def setUp(self) -> None:
+        """Set up a graph with causal and correlative edges."""
+        self.graph = BELGraph()
+        self.k1 = self.graph.add_increases(a, b, citation=n(), evidence=n())
+        self.graph.add_positive_correlation(b, c, citation=n(), evidence=n())
+        self.k2 = self.graph.add_decreases(d, b, citation=n(), evidence=n())
+
+    def test_index(self):
+        """Test the index only contains the edges of each relation class."""
+        index = self.graph.relation_index
+        self.assertIsInstance(index, RelationIndex)
+        self.assertEqual([(a, self.k1), (d, self.k2)], index.predecessors(b, RELATION_CLASS_CAUSAL))
+        self.assertEqual([(b, self.k1)], index.successors(a, RELATION_CLASS_CAUSAL))
+        self.assertEqual([], index.successors(b, RELATION_CLASS_CAUSAL))
+        self.assertEqual(1, len(index.successors(b, RELATION_CLASS_CORRELATIVE)))
+        self.assertEqual(1, len(index.predecessors(b, RELATION_CLASS_CORRELATIVE)))
+        with self.assertRaises(ValueError):
+            index.successors(a, "nope")
+
+    def test_invalidation(self):
+        """Test the index is rebuilt after the graph is modified."""
+        self.assertFalse(has_causal_in_edges(self.graph, c))
+        self.graph.add_increases(b, c, citation=n(), evidence=n())
+        self.assertTrue(has_causal_in_edges(self.graph, c))
+        self.assertTrue(has_causal_out_edges(self.graph, b))
+
+        self.graph.remove_node(a)
+        self.assertTrue(is_causal_source(self.graph, d))
+        self.assertEqual([(d, self.k2)], self.graph.relation_index.predecessors(b, RELATION_CLASS_CAUSAL))
+
+        self.graph.remove_edge(d, b, self.k2)
+        self.assertFalse(has_causal_in_edges(self.graph, b))
+
+    def test_disabled(self):
+        """Test traversals give the same results without the index."""
+        expected = get_upstream_causal_subgraph(self.graph, [b])
+        self.graph.use_relation_index = False
+        self.assertIsNone(self.graph.relation_index)
+        self.assertEqual(
+            set(expected.edges(keys=True)), set(get_upstream_causal_subgraph(self.graph, [b]).edges(keys=True))
+        )
+        self.assertTrue(has_causal_in_edges(self.graph, b))
+
+    def test_downstream(self):
+        """Test the downstream causal subgraph only follows causal edges."""
+        subgraph = get_downstream_causal_subgraph(self.graph, [a, b])
+        self.assertEqual({(a, b, self.k1)}, set(subgraph.edges(keys=True)))
+
+    def test_view(self):
+        """Test that frozen views do not get an index."""
+        self.assertIsNone(self.graph.subgraph([a, b]).relation_index)
+
+    def test_pickle(self):
+        """Test that the index is not pickled with the graph."""
+        self.assertIsNotNone(self.graph.relation_index)
+        graph = pickle.loads(pickle.dumps(self.graph))
+        self.assertIsNone(graph._relation_index)
+        self.assertTrue(has_causal_in_edges(graph, b))
+
+
+class TestAnnotationIndex(unittest.TestCase):
+    """Tests for the index from edge annotations to edges."""
+
+    def setUp(self) -> None:
+        """Set up a graph with annotated edges."""
+        self.graph = BELGraph()
+        self.graph.annotation_list["Species"] = {"9606", "10090"}
+        self.graph.annotation_list["Tissue"] = {"liver", "lung"}
+        self.k1 = self.graph.add_increases(
+            a, b, citation=n(), evidence=n(), annotations={"Species": "9606", "Tissue": ["liver", "lung"]}
+        )
+        self.k2 = self.graph.add_decreases(b, c, citation=n(), evidence=n(), annotations={"Species": "10090"})
+        self.k3 = self.graph.add_increases(
+            c, d, citation=n(), evidence=n(), annotations={"Species": ["9606", "10090"], "Tissue": "lung"}
+        )
+        self.graph.add_part_of(a, d)
+
+    def _query(self, annotations, or_=None):
+        """Get the edges of the sub-graph given by the index."""
+        return set(get_subgraph_by_annotations(self.graph, annotations, or_=or_).edges(keys=True))
+
+    def _scan(self, annotations, or_=None):
+        """Get the edges of the sub-graph given by checking each edge."""
+        predicate = _build_annotations_predicate(self.graph, annotations, or_=or_)
+        return set(get_subgraph_by_edge_filter(self.graph, predicate).edges(keys=True))
+
+    def test_index(self):
+        """Test any and all queries give the same edges as checking each edge."""
+        self.assertIsInstance(self.graph.annotation_index, AnnotationIndex)
+        self.assertEqual(4, len(self.graph.annotation_index))
+        for annotations, expected_any, expected_all in [
+            ({"Species": "9606"}, {(a, b, self.k1), (c, d, self.k3)}, {(a, b, self.k1), (c, d, self.k3)}),
+            ({"Species": ["9606", "10090"]}, {(a, b, self.k1), (b, c, self.k2), (c, d, self.k3)}, {(c, d, self.k3)}),
+            ({"Species": "10090", "Tissue": "liver"}, {(a, b, self.k1), (b, c, self.k2), (c, d, self.k3)}, set()),
+            (
+                {"Species": "9606", "Tissue": "lung"},
+                {(a, b, self.k1), (c, d, self.k3)},
+                {(a, b, self.k1), (c, d, self.k3)},
+            ),
+            ({"Tissue": "kidney"}, set(), set()),
+        ]:
+            with self.subTest(annotations=annotations):
+                self.assertEqual(expected_any, self._query(annotations))
+                self.assertEqual(expected_any, self._scan(annotations))
+                self.assertEqual(expected_all, self._query(annotations, or_=False))
+                self.assertEqual(expected_all, self._scan(annotations, or_=False))
+
+    def test_empty_query(self):
+        """Test an empty query matches all edges, like the edge predicates."""
+        self.assertEqual(self._scan({}), self._query({}))
+        self.assertEqual(self._scan({}, or_=False), self._query({}, or_=False))
+        self.assertEqual(4, len(self._query({})))
+
+    def test_invalidation(self):
+        """Test the index is rebuilt after the graph is modified."""
+        self.assertEqual(2, len(self._query({"Tissue": "lung"})))
+        self.graph.remove_edge(a, b, self.k1)
+        self.assertEqual({(c, d, self.k3)}, self._query({"Tissue": "lung"}))
+        k4 = self.graph.add_increases(d, a, citation=n(), evidence=n(), annotations={"Tissue": "lung"})
+        self.assertEqual({(c, d, self.k3), (d, a, k4)}, self._query({"Tissue": "lung"}))
+        self.graph.remove_node(c)
+        self.assertEqual({(d, a, k4)}, self._query({"Tissue": "lung"}))
+
+    def test_invalidation_in_place(self):
+        """Test the index is rebuilt after an in-place transformation edits the annotations of edges."""
+        self.assertEqual({(a, b, self.k1), (c, d, self.k3)}, self._query({"Species": "9606"}))
+        strip_annotations(self.graph)
+        self.assertEqual(set(), self._scan({"Species": "9606"}))
+        self.assertEqual(set(), self._query({"Species": "9606"}))
+
+    def test_disabled(self):
+        """Test queries give the same results without the index."""
+        expected = self._query({"Species": "10090"})
+        self.graph.use_annotation_index = False
+        self.assertIsNone(self.graph.annotation_index)
+        self.assertEqual(expected, self._query({"Species": "10090"}))
+
+    def test_view(self):
+        """Test that frozen views do not get an index."""
+        self.assertIsNone(self.graph.subgraph([a, b]).annotation_index)
+
+    def test_pickle(self):
+        """Test that the index is not pickled with the graph."""
+        self.assertIsNotNone(self.graph.annotation_index)
+        graph = pickle.loads(pickle.dumps(self.graph))
+        self.assertIsNone(graph._annotation_index)
+        self.assertEqual(4, len(graph.annotation_index))
+
+
+class TestProvenanceIndex(unittest.TestCase):
+    """Tests for the index from citations, authors, and evidences to edges."""
+
+    def setUp(self) -> None:
+        """Set up a graph with edges from a few citations."""
+        self.graph = BELGraph()
+        self.k1 = self.graph.add_increases(
+            a, b, citation=CitationDict("pubmed", "1", **{CITATION_AUTHORS: ["X", "Y", "X"]}), evidence="e1"
+        )
+        self.k2 = self.graph.add_decreases(
+            b, c, citation=CitationDict("PubMed", "2", **{CITATION_AUTHORS: ["Y"]}), evidence="e2"
+        )
+        self.k3 = self.graph.add_increases(c, d, citation=CitationDict("pmc", "1"), evidence="e1")
+        self.k4 = self.graph.add_increases(a, d, citation="1", evidence="e3")
+        self.graph.add_part_of(a, d)
+
+    def _edges(self, graph):
+        return set(graph.edges(keys=True))
+
+    def test_index(self):
+        """Test the sub-graphs from the index are the same as from checking each edge."""
+        self.assertIsInstance(self.graph.provenance_index, ProvenanceIndex)
+        for pmids in ["1", ["1", "2"], ["3"]]:
+            with self.subTest(pmids=pmids):
+                expected = get_subgraph_by_edge_filter(self.graph, build_pmid_inclusion_filter(pmids))
+                self.assertEqual(self._edges(expected), self._edges(get_subgraph_by_pubmed(self.graph, pmids)))
+        self.assertEqual({(a, b, self.k1), (a, d, self.k4)}, self._edges(get_subgraph_by_pubmed(self.graph, "1")))
+
+        for authors in ["X", ["X", "Y"], "Z"]:
+            with self.subTest(authors=authors):
+                expected = get_subgraph_by_edge_filter(self.graph, build_author_inclusion_filter(authors))
+                self.assertEqual(self._edges(expected), self._edges(get_subgraph_by_authors(self.graph, authors)))
+
+        index = self.graph.provenance_index
+        positions = index.get_positions_by_evidences("e1")
+        self.assertEqual({(a, b, self.k1), (c, d, self.k3)}, {edge[:3] for edge in index.iter_edges(positions)})
+        positions = index.get_positions_by_citation_identifiers("1", namespaces=["pubmed", "pmc"])
+        self.assertEqual(
+            {(a, b, self.k1), (c, d, self.k3), (a, d, self.k4)}, {edge[:3] for edge in index.iter_edges(positions)}
+        )
+
+    def test_grouping(self):
+        """Test grouping by citation and listing PubMed identifiers give the same results without the index."""
+        with_index = get_subgraphs_by_citation(self.graph)
+        identifiers = sorted(iterate_pubmed_identifiers(self.graph))
+        self.graph.use_provenance_index = False
+        without_index = get_subgraphs_by_citation(self.graph)
+
+        self.assertEqual(list(without_index), list(with_index))
+        for citation, subgraph in without_index.items():
+            self.assertEqual(self._edges(subgraph), self._edges(with_index[citation]))
+        self.assertEqual(sorted(iterate_pubmed_identifiers(self.graph)), identifiers)
+        self.assertEqual({"1", "2"}, get_pubmed_identifiers(self.graph))
+
+    def test_invalidation(self):
+        """Test the index is rebuilt after the graph is modified."""
+        self.assertEqual(2, get_subgraph_by_pubmed(self.graph, "1").number_of_edges())
+        self.graph.remove_edge(a, d, self.k4)
+        self.assertEqual({(a, b, self.k1)}, self._edges(get_subgraph_by_pubmed(self.graph, "1")))
+        self.graph.add_increases(b, d, citation="2", evidence="e4")
+        self.assertEqual(2, get_subgraph_by_pubmed(self.graph, "2").number_of_edges())
+
+    def test_pickle(self):
+        """Test that the index is pickled with the graph and still points at its edges."""
+        index = self.graph.provenance_index
+        graph = pickle.loads(pickle.dumps(self.graph))
+        self.assertIsNotNone(graph._provenance_index)
+        self.assertEqual(len(index), len(graph._provenance_index))
+        for (u, v, k, data), (_, _, _, original_data) in zip(graph._provenance_index.edges, index.edges):
+            self.assertIs(data, graph[u][v][k])
+            self.assertEqual(original_data, data)
+        self.assertEqual({(a, b, self.k1), (a, d, self.k4)}, self._edges(get_subgraph_by_pubmed(graph, "1")))
+
+    def test_pickle_unbuilt(self):
+        """Test that pickling does not build the index, which is built on first access after loading instead."""
+        graph = pickle.loads(pickle.dumps(self.graph))
+        self.assertIsNone(self.graph._provenance_index)
+        self.assertIsNone(graph._provenance_index)
+        self.assertEqual({(a, b, self.k1), (a, d, self.k4)}, self._edges(get_subgraph_by_pubmed(graph, "1")))
+        self.assertIsNotNone(graph._provenance_index)
+
+    def test_invalidation_in_place(self):
+        """Test the index is rebuilt after the citations of edges are edited in place."""
+        self.assertEqual({(a, b, self.k1), (b, c, self.k2)}, self._edges(get_subgraph_by_authors(self.graph, "Y")))
+        remove_extra_citation_metadata(self.graph)
+        self.assertEqual(set(), self._edges(get_subgraph_by_authors(self.graph, "Y")))
+
+        self.graph[a][d][self.k4][CITATION] = CitationDict("pubmed", "2")
+        self.graph.clear_indexes()
+        self.assertEqual({(a, b, self.k1)}, self._edges(get_subgraph_by_pubmed(self.graph, "1")))
+        self.assertEqual({(b, c, self.k2), (a, d, self.k4)}, self._edges(get_subgraph_by_pubmed(self.graph, "2")))
@@ -14,9 +14,19 @@ from pybel.examples.various_example import (
     glucose_6_phosphate,
     hk1,
     phosphate,
+    single_complex_graph,
     single_reaction_graph,
 )
-from pybel.struct.node_utils import flatten_list_abundance, reaction_cartesian_expansion
+from pybel.io.triples.api import to_triples
+from pybel.struct.node_utils import (
+    estimate_cartesian_expansion,
+    flatten_list_abundance,
+    iter_cartesian_expansion,
+    list_abundance_cartesian_expansion,
+    reaction_cartesian_expansion,
+)
+from pybel.testing.utils import n
+from pybel.utils import hash_edge
 
 
 class TestNodeUtils(unittest.TestCase):
@@ -117,3 +127,51 @@ class TestNodeUtils(unittest.TestCase):
         # TODO Fix so unqualified duplicate edges are not created (it should be the 6 edges below)
         self.assertEqual(two_reactions_graph.number_of_nodes(), 5)
         self.assertEqual(two_reactions_graph.number_of_edges(), 8)
+
+
+class TestLazyCartesianExpansion(unittest.TestCase):
+    """Test streaming the cartesian expansion of a graph without modifying it."""
+
+    def setUp(self) -> None:
+        """Set up a graph with complexes and reactions that are connected to each other."""
+        self.graph = single_reaction_graph.copy()
+        self.graph.update(single_complex_graph)
+        self.graph.annotation_pattern["Species"] = ".*"
+        p1, p2 = Protein("HGNC", "A"), Protein("HGNC", "B")
+        complex_abundance = g([p1, p2])
+        self.graph.add_increases(complex_abundance, Reaction([glucose, atp], [hk1]), citation=n(), evidence=n())
+        self.graph.add_decreases(p1, g([p2, g([p1, hk1])]), citation=n(), evidence=n())
+        self.graph.add_increases(p1, p2, citation=n(), evidence=n(), annotations={"Species": "9606"})
+
+    def _get_expanded_graph(self) -> BELGraph:
+        graph = self.graph.copy()
+        list_abundance_cartesian_expansion(graph)
+        reaction_cartesian_expansion(graph)
+        return graph
+
+    def test_same_as_in_place(self):
+        """Test the stream has the same edges as the in-place expansions."""
+        expected = self._get_expanded_graph()
+        number_edges = self.graph.number_of_edges()
+        edges = list(iter_cartesian_expansion(self.graph))
+        self.assertEqual(number_edges, self.graph.number_of_edges(), msg="graph should not be modified")
+        self.assertEqual(set(expected.edges(keys=True)), {(u, v, hash_edge(u, v, d)) for u, v, d in edges})
+
+    def test_estimate(self):
+        """Test the estimate is the length of the stream, up to edges to nested complexes."""
+        estimate = estimate_cartesian_expansion(self.graph)
+        number_edges = sum(1 for _ in iter_cartesian_expansion(self.graph))
+        self.assertEqual(number_edges + 1, estimate)  # the edge to the nested complex is skipped
+        self.assertLessEqual(self._get_expanded_graph().number_of_edges(), estimate)
+
+        self.assertEqual(
+            sum(1 for _ in iter_cartesian_expansion(self.graph, list_abundances=False)),
+            estimate_cartesian_expansion(self.graph, list_abundances=False),
+        )
+
+    def test_to_triples(self):
+        """Test exporting triples from the stream."""
+        self.assertEqual(
+            to_triples(self._get_expanded_graph()),
+            to_triples(self.graph, cartesian_expansion=True),
+        )
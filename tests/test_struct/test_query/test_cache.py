@@ -0,0 +1,94 @@
+"""Tests for the query result cache."""
+
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from pybel.examples.egf_example import egf_graph, vcp
+from pybel.examples.sialic_acid_example import sialic_acid_graph
+from pybel.struct.query import DirectoryQueryCache, MemoryQueryCache, Query
+from pybel.testing.mock_manager import MockQueryManager
+
+
+class TestQueryCache(unittest.TestCase):
+    """Test caching the results of queries."""
+
+    def setUp(self):
+        """Set up a mock query manager with two networks."""
+        self.manager = MockQueryManager()
+        self.egf_id = self.manager.insert_graph(egf_graph.copy()).id
+        self.sialic_acid_id = self.manager.insert_graph(sialic_acid_graph.copy()).id
+        self.query = Query(network_ids=[self.egf_id, self.sialic_acid_id])
+        self.query.append_seeding_neighbors([vcp])
+
+    def test_memory(self):
+        """Test that a repeated query is served from the cache."""
+        cache = MemoryQueryCache()
+        expected = self.query.run(self.manager)
+
+        first = self.query.run(self.manager, cache=cache)
+        with mock.patch.object(self.manager, "get_graph_by_ids") as get_graph_by_ids:
+            second = Query.from_json(self.query.to_json()).run(self.manager, cache=cache)
+            get_graph_by_ids.assert_not_called()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(set(expected.edges(keys=True)), set(second.edges(keys=True)))
+        stats = cache.get_stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["entries"])
+        self.assertEqual(0.5, stats["hit_rate"])
+
+    def test_key(self):
+        """Test the key changes with the query and with the upload timestamps of its networks."""
+        key = self.query.get_cache_key(self.manager)
+        self.assertEqual(key, Query.from_json(self.query.to_json()).get_cache_key(self.manager))
+        self.assertNotEqual(key, Query(network_ids=self.query.network_ids).get_cache_key(self.manager))
+
+        self.manager.id_created[self.egf_id] = self.manager.id_created[self.egf_id].replace(year=1970)
+        self.assertNotEqual(key, self.query.get_cache_key(self.manager))
+
+    def test_memory_eviction(self):
+        """Test the least recently used results are evicted first."""
+        cache = MemoryQueryCache(max_entries=2)
+        for key in "abc":
+            if key == "c":
+                cache.get("a")
+            cache.set(key, egf_graph)
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+        size = cache.size // 2
+        cache = MemoryQueryCache(max_size=size + 1, max_entries=None)
+        cache.set("a", egf_graph)
+        cache.set("b", egf_graph)
+        self.assertEqual(1, len(cache))
+        self.assertEqual(size, cache.size)
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+
+    def test_directory(self):
+        """Test that results in a directory are shared between caches and evicted by size."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DirectoryQueryCache(directory)
+            self.query.run(self.manager, cache=cache)
+
+            other = DirectoryQueryCache(directory)
+            self.assertEqual(1, len(other))
+            with mock.patch.object(self.manager, "get_graph_by_ids") as get_graph_by_ids:
+                self.assertIsNotNone(self.query.run(self.manager, cache=other))
+                get_graph_by_ids.assert_not_called()
+            self.assertEqual(1, other.hits)
+
+            other.max_size = max(other.size, len(pickle.dumps(sialic_acid_graph, protocol=pickle.HIGHEST_PROTOCOL)))
+            other.set("other", sialic_acid_graph)
+            self.assertEqual(1, len(other))
+            self.assertEqual(1, other.evictions)
+            self.assertIsNotNone(other.get("other"))
+
+            other.clear()
+            self.assertEqual(0, len(cache))
@@ -28,7 +28,12 @@ from pybel.struct import (
     get_subgraph_by_annotation_value,
 )
 from pybel.struct.mutation import collapse_to_genes, enrich_protein_and_rna_origins
-from pybel.struct.query import Query, QueryMissingNetworksError, Seeding
+from pybel.struct.query import (
+    Query,
+    QueryMissingNetworksError,
+    Seeding,
+    SeedingSizeError,
+)
 from pybel.testing.generate import generate_random_graph
 from pybel.testing.mock_manager import MockQueryManager
 from pybel.testing.utils import n
@@ -316,3 +321,51 @@ class QueryTest(unittest.TestCase):
         self.assertIn(mouse_csf1_protein, result)
 
         self.assertEqual(2, result.number_of_edges())
+
+
+class TestParallelSeeding(unittest.TestCase):
+    """Tests for running seeding methods concurrently."""
+
+    def setUp(self):
+        """Set up a seeding with several methods over the sialic acid graph."""
+        self.graph = sialic_acid_graph.copy()
+        self.seeding = Seeding()
+        self.seeding.append_neighbors([trem2])
+        self.seeding.append_induction([shp1, shp2, syk])
+        self.seeding.append_neighbors([cd33_phosphorylated])
+        self.seeding.append_induction([Protein("HGNC", "NOPE")])
+
+    def assert_same_result(self, **kwargs):
+        """Check that seeding concurrently gives the same graph as seeding serially."""
+        expected = self.seeding.run(self.graph)
+        actual = self.seeding.run(self.graph, **kwargs)
+        self.assertEqual(set(expected), set(actual))
+        self.assertEqual(set(expected.edges(keys=True)), set(actual.edges(keys=True)))
+
+    def test_processes(self):
+        """Test seeding in worker processes."""
+        self.assert_same_result(n_jobs=2)
+
+    def test_threads(self):
+        """Test seeding in threads."""
+        self.assert_same_result(n_jobs=3, use_threads=True)
+
+    def test_merge_copies(self):
+        """Test merging leaves the sub-graphs from the seeding methods unchanged."""
+        pairs = list(self.seeding._iter_subgraphs(self.graph))
+        subgraphs = [subgraph for _, subgraph in pairs if subgraph is not None]
+        sizes = [(subgraph.number_of_nodes(), subgraph.number_of_edges()) for subgraph in subgraphs]
+        result = self.seeding._merge(pairs)
+        self.assertFalse(any(result is subgraph for subgraph in subgraphs))
+        self.assertEqual(sizes, [(subgraph.number_of_nodes(), subgraph.number_of_edges()) for subgraph in subgraphs])
+
+    def test_size_cap(self):
+        """Test seeding stops once the result is too big."""
+        expected = self.seeding.run(self.graph)
+        self.assertIsNotNone(self.seeding.run(self.graph, max_nodes=expected.number_of_nodes()))
+        for kwargs in ({}, {"n_jobs": 2}, {"n_jobs": 2, "use_threads": True}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(SeedingSizeError):
+                    self.seeding.run(self.graph, max_nodes=expected.number_of_nodes() - 1, **kwargs)
+                with self.assertRaises(SeedingSizeError):
+                    self.seeding.run(self.graph, max_edges=1, **kwargs)
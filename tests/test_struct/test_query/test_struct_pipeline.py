@@ -3,11 +3,17 @@ import unittest
 from io import StringIO
 
 from pybel import BELGraph
+from pybel.dsl import Pathology, Protein, Rna
 from pybel.examples.egf_example import egf_graph
+from pybel.examples.homology_example import homology_graph
+from pybel.examples.sialic_acid_example import sialic_acid_graph
 from pybel.struct.mutation import enrich_protein_and_rna_origins
+from pybel.struct.operations import union
 from pybel.struct.pipeline import Pipeline
 from pybel.struct.pipeline.decorators import get_transformation, mapped
 from pybel.struct.pipeline.exc import MetaValueError, MissingPipelineFunctionError
+from pybel.struct.pipeline.planner import FusedFilters, plan_protocol
+from pybel.testing.utils import n
 
 log = logging.getLogger(__name__)
 log.setLevel(10)
@@ -52,6 +58,11 @@ class TestPipelineFailures(unittest.TestCase):
         with self.assertRaises(TypeError):
             p.append(4)
 
+    def test_helper_not_registered(self):
+        """Test that helpers taking arguments that can not be serialized are not pipeline functions."""
+        with self.assertRaises(MissingPipelineFunctionError):
+            get_transformation("expand_by_edges")
+
     def test_get_function_failure(self):
         p = Pipeline()
 
@@ -132,3 +143,153 @@ class TestPipeline(TestEgfExample):
             self.assertIn(node, result)
 
         self.check_original_unchanged()
+
+
+class TestPipelinePlanner(unittest.TestCase):
+    """Tests for fusing consecutive filters in a pipeline."""
+
+    def setUp(self):
+        """Set up a graph with annotations, associations, and pathologies."""
+        self.graph = union([egf_graph, sialic_acid_graph, homology_graph])
+        self.graph.add_association(
+            Protein("hgnc", "EGF"),
+            Pathology("MESH", "Neoplasms"),
+            citation=n(),
+            evidence=n(),
+            annotations={"Species": "9606"},
+        )
+        self.graph.add_increases(
+            Protein("hgnc", "EGF"),
+            Protein("hgnc", "VCP"),
+            citation=n(),
+            evidence=n(),
+            annotations={"Confidence": "High"},
+        )
+
+    def assert_same_result(self, pipeline):
+        """Check that running the pipeline with and without fusing filters gives the same graph."""
+        expected = pipeline.run(self.graph)
+        actual = pipeline.run(self.graph, optimize=True)
+        self.assertEqual(set(expected), set(actual))
+        self.assertEqual(set(expected.edges(keys=True)), set(actual.edges(keys=True)))
+        self.assertLess(0, expected.number_of_nodes())
+        return actual
+
+    def test_removals(self):
+        """Test fusing edge and node removals."""
+        pipeline = Pipeline.from_functions(["remove_associations", "remove_pathologies", "remove_non_causal_edges"])
+        self.assertIsInstance(plan_protocol(pipeline.protocol)[0], FusedFilters)
+        result = self.assert_same_result(pipeline)
+        self.assertNotIn(Pathology("MESH", "Neoplasms"), result)
+
+    def test_induction(self):
+        """Test fusing inductions before and after removals."""
+        pipeline = Pipeline()
+        pipeline.append("get_subgraph_by_annotation_value", "Species", "9606")
+        pipeline.append("remove_associations")
+        pipeline.append("remove_biological_processes")
+        self.assert_same_result(pipeline)
+
+        pipeline = Pipeline.from_functions(["remove_associations", "remove_pathologies"])
+        pipeline.append("get_subgraph_by_annotations", {"Confidence": ["High"]})
+        pipeline.append("get_causal_subgraph")
+        pipeline.append("remove_non_causal_edges")
+        self.assert_same_result(pipeline)
+
+    def test_induction_keeps_isolated_nodes(self):
+        """Test that nodes whose edges are removed after an induction are kept, like when run sequentially."""
+        pipeline = Pipeline()
+        pipeline.append("get_subgraph_by_annotation_value", "Species", "9606")
+        pipeline.append("remove_filtered_edges", [lambda graph, u, v, k: True])
+        result = self.assert_same_result(pipeline)
+        self.assertEqual(0, result.number_of_edges())
+
+    def test_plan(self):
+        """Test only runs of consecutive filters are fused."""
+        pipeline = Pipeline.from_functions(
+            [
+                "remove_associations",
+                "enrich_protein_and_rna_origins",
+                "remove_pathologies",
+                "remove_associations",
+                "get_largest_component",
+            ]
+        )
+        plan = plan_protocol(pipeline.protocol)
+        self.assertEqual(4, len(plan))
+        self.assertEqual(pipeline.protocol[0], plan[0])
+        self.assertEqual(pipeline.protocol[1], plan[1])
+        self.assertIsInstance(plan[2], FusedFilters)
+        self.assertEqual(pipeline.protocol[2:4], plan[2].entries)
+        self.assertEqual(pipeline.protocol[4], plan[3])
+        self.assert_same_result(pipeline)
+
+    def test_meta(self):
+        """Test filters are fused inside of the pipelines of a meta-entry."""
+        first = Pipeline.from_functions(["remove_associations", "remove_pathologies"])
+        second = Pipeline.from_functions(["remove_non_causal_edges", "remove_biological_processes"])
+        pipeline = Pipeline.union([first, second])
+        self.assert_same_result(pipeline)
+
+        explanation = pipeline.explain(optimize=True)
+        self.assertIn("union of 2 pipelines", explanation)
+        self.assertEqual(2, explanation.count("single pass over 2 filters"))
+        self.assertNotIn("single pass", pipeline.explain())
+
+    def test_not_optimized_by_default(self):
+        """Test filters are not fused by default, since predicates may depend on changes made by earlier filters."""
+        a, b, c = Protein("hgnc", "A"), Protein("hgnc", "B"), Pathology("mesh", "C")
+        graph = BELGraph()
+        graph.add_increases(a, b, citation=n(), evidence=n())
+        graph.add_increases(b, c, citation=n(), evidence=n())
+        pipeline = Pipeline.from_functions(["remove_pathologies"])
+        pipeline.append("remove_filtered_edges", [lambda graph, u, v, k: graph.degree(v) == 1])
+        self.assertEqual(0, pipeline.run(graph).number_of_edges())
+        self.assertEqual(1, pipeline.run(graph, optimize=True).number_of_edges())
+
+    def test_explain(self):
+        """Test describing the plan of a pipeline."""
+        pipeline = Pipeline.from_functions(["remove_associations", "remove_pathologies"])
+        pipeline.append("get_subgraph_by_annotation_value", "Species", "9606")
+        self.assertEqual(
+            [
+                "1. single pass over 3 filters:",
+                "   - remove_associations() [edge removal]",
+                "   - remove_pathologies() [node removal]",
+                "   - get_subgraph_by_annotation_value('Species', '9606') [edge induction]",
+            ],
+            pipeline.explain(optimize=True).splitlines(),
+        )
+
+
+class TestParallelPipeline(unittest.TestCase):
+    """Tests for running the pipelines of meta-entries in worker processes."""
+
+    def setUp(self):
+        """Set up a seed graph and its universe."""
+        self.universe = union([egf_graph, sialic_acid_graph])
+        self.graph = self.universe.subgraph([Protein("hgnc", "EGF")]).copy()
+        self.first = Pipeline.from_functions(["expand_all_node_neighborhoods", "remove_associations"])
+        self.second = Pipeline.from_functions(["expand_all_node_neighborhoods", "enrich_protein_and_rna_origins"])
+        self.third = Pipeline.from_functions(["expand_all_node_neighborhoods", "remove_biological_processes"])
+
+    def assert_same_result(self, pipeline):
+        """Check that running the pipeline serially and in parallel gives the same graph."""
+        expected = pipeline.run(self.graph, universe=self.universe)
+        for n_jobs in (2, 3):
+            with self.subTest(n_jobs=n_jobs):
+                actual = pipeline.run(self.graph, universe=self.universe, n_jobs=n_jobs)
+                self.assertEqual(list(expected), list(actual))
+                self.assertEqual(list(expected.edges(keys=True)), list(actual.edges(keys=True)))
+        return expected
+
+    def test_union(self):
+        """Test running the pipelines of a union in parallel."""
+        result = self.assert_same_result(Pipeline.union([self.first, self.second, self.third]))
+        self.assertIn(Rna("hgnc", "EGF"), result)
+
+    def test_intersection(self):
+        """Test running the pipelines of an intersection in parallel, where branches do not see each other."""
+        result = self.assert_same_result(Pipeline.intersection([self.second, self.first]))
+        self.assertNotIn(Rna("hgnc", "EGF"), result)
+        self.assertIn(Protein("hgnc", "EGF"), result)
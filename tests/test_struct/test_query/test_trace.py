@@ -0,0 +1,84 @@
+"""Tests for measuring the stages of pipelines and queries."""
+
+import json
+import tracemalloc
+import unittest
+
+from pybel.examples.egf_example import egf_graph, vcp
+from pybel.examples.sialic_acid_example import sialic_acid_graph
+from pybel.struct.pipeline import Pipeline, Trace
+from pybel.struct.query import Query, Seeding
+from pybel.testing.mock_manager import MockQueryManager
+
+
+class TestTrace(unittest.TestCase):
+    """Test recording traces."""
+
+    def test_pipeline(self):
+        """Test each entry of a pipeline is recorded, with the pipelines of a union nested under it."""
+        pipeline = Pipeline.union(
+            [
+                Pipeline.from_functions(["remove_associations", "remove_pathologies"]),
+                Pipeline.from_functions(["enrich_protein_and_rna_origins"]),
+            ]
+        )
+        pipeline.append("get_largest_component")
+        trace = Trace()
+        result = pipeline.run(egf_graph, optimize=True, trace=trace)
+
+        self.assertEqual(["union", "get_largest_component"], [stage.name for stage in trace])
+        union_stage, component_stage = trace.stages
+        self.assertEqual(["pipeline 1", "pipeline 2"], [stage.name for stage in union_stage.stages])
+        fused_stage = union_stage.stages[0].stages[0]
+        self.assertEqual("single pass over 2 filters", fused_stage.name)
+        self.assertEqual(["remove_associations()", "remove_pathologies()"], fused_stage.args)
+        self.assertEqual("enrich_protein_and_rna_origins", union_stage.stages[1].stages[0].name)
+
+        self.assertEqual(egf_graph.number_of_nodes(), union_stage.input_nodes)
+        self.assertEqual(egf_graph.number_of_edges(), union_stage.input_edges)
+        self.assertEqual(union_stage.output_nodes, component_stage.input_nodes)
+        self.assertEqual(result.number_of_nodes(), component_stage.output_nodes)
+        self.assertEqual(result.number_of_edges(), component_stage.output_edges)
+        self.assertLessEqual(union_stage.stages[1].memory, union_stage.memory)
+        self.assertLessEqual(union_stage.stages[0].seconds, union_stage.seconds)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        table = trace.to_table()
+        self.assertIn("| | single pass over 2 filters", table)
+        self.assertIn("remove_associations(), remove_patholo...", table)
+
+    def test_json(self):
+        """Test a trace can be serialized, including arguments that are not JSON."""
+        pipeline = Pipeline()
+        pipeline.append("remove_filtered_edges", [lambda graph, u, v, k: False])
+        trace = Trace(track_memory=False)
+        pipeline.run(egf_graph, trace=trace, optimize=False)
+        self.assertIsNone(trace.stages[0].memory)
+
+        data = json.loads(json.dumps(trace.to_json()))
+        self.assertEqual([["<lambda>"]], data[0]["args"])
+        self.assertEqual(data, Trace.from_json(data).to_json())
+
+    def test_query(self):
+        """Test the universe, seeding, and pipeline of a query are recorded."""
+        manager = MockQueryManager()
+        network_ids = [manager.insert_graph(graph.copy()).id for graph in (egf_graph, sialic_acid_graph)]
+        query = Query(network_ids=network_ids)
+        query.append_seeding_neighbors([vcp])
+        query.append_pipeline("remove_associations")
+
+        trace = Trace()
+        result = query.run(manager, trace=trace)
+        self.assertEqual(["universe", "seeding", "remove_associations"], [stage.name for stage in trace])
+        self.assertEqual(["seed by neighbors"], [stage.name for stage in trace.stages[1].stages])
+        self.assertEqual(network_ids, trace.stages[0].args)
+        self.assertEqual(trace.stages[0].output_nodes, trace.stages[1].input_nodes)
+        self.assertEqual(result.number_of_nodes(), trace.stages[-1].output_nodes)
+
+    def test_seeding_from_json(self):
+        """Test the nodes of seeds are converted back to BEL entities when loading JSON."""
+        seeding = Seeding().append_neighbors([vcp]).append_annotation("Species", ["9606"])
+        loaded = Seeding.loads(seeding.dumps())
+        self.assertEqual(seeding.to_json(), loaded.to_json())
+        self.assertEqual(vcp, loaded[0]["data"][0])
+        self.assertIsNotNone(loaded.run(egf_graph))
@@ -0,0 +1,74 @@
+"""Tests for the summary tables of BEL graphs."""
+
+import random
+import unittest
+from collections import Counter, defaultdict
+
+import networkx as nx
+
+from pybel import BELGraph
+from pybel.constants import RELATION
+from pybel.dsl import Protein
+from pybel.examples import egf_graph, sialic_acid_graph
+from pybel.struct.summary.node_summary import count_namespaces
+from pybel.struct.summary.supersummary import CALIBRATION_SIZE, GraphSummary
+from pybel.testing.utils import n
+
+
+class TestGraphSummary(unittest.TestCase):
+    """Test building the summary tables in a single traversal."""
+
+    def test_counts(self):
+        """Test the counts are the same as from the counting functions."""
+        for graph in (egf_graph, sialic_acid_graph):
+            with self.subTest(graph=graph.name):
+                summary = GraphSummary(graph)
+                self.assertFalse(summary.approximate)
+                self.assertEqual(Counter(node.function for node in graph), summary.functions)
+                self.assertEqual(count_namespaces(graph), summary.namespaces)
+                self.assertEqual(graph.count.annotations(), summary.annotations)
+                self.assertEqual(graph.number_of_citations(), len(summary.citations))
+                self.assertEqual(nx.number_weakly_connected_components(graph), summary.number_of_components)
+
+    def test_examples(self):
+        """Test each row of the tables gets an example from its group."""
+        summary = GraphSummary(sialic_acid_graph, rng=random.Random(5))
+        df = summary.function_table_df()
+        self.assertEqual(["Type", "Count", "Example"], list(df.columns))
+        for function, _, example in df.values:
+            self.assertEqual(function, example.function)
+        edges_by_type = defaultdict(set)
+        for u, v, data in sialic_acid_graph.edges(data=True):
+            edge_type = f"{u.function} {data[RELATION]} {v.function}"
+            edges_by_type[edge_type].add(sialic_acid_graph.edge_to_bel(u, v, data, use_identifiers=True))
+        for edge_type, _, example in summary.edge_table_df().values:
+            self.assertIn(example, edges_by_type[edge_type])
+        self.assertEqual(["Edge Type", "Count"], list(GraphSummary(sialic_acid_graph, examples=False).edge_table_df()))
+
+    def test_components(self):
+        """Test counting components with equal copies of nodes in the adjacency dictionaries."""
+        graph = BELGraph()
+        graph.add_increases(Protein("hgnc", "A"), Protein("hgnc", "B"), citation=n(), evidence=n())
+        graph.add_increases(Protein("hgnc", "B"), Protein("hgnc", "C"), citation=n(), evidence=n())
+        graph.add_increases(Protein("hgnc", "D"), Protein("hgnc", "E"), citation=n(), evidence=n())
+        graph.add_node_from_data(Protein("hgnc", "F"))
+        self.assertEqual(3, GraphSummary(graph).number_of_components)
+
+    def test_time_budget(self):
+        """Test a time budget that can not be met switches to approximate counts."""
+        graph = BELGraph()
+        nodes = [Protein("hgnc", str(i)) for i in range(CALIBRATION_SIZE // 2)]
+        for i in range(3 * CALIBRATION_SIZE):
+            graph.add_increases(nodes[i % len(nodes)], nodes[(7 * i + 1) % len(nodes)], citation=str(i), evidence=n())
+
+        summary = GraphSummary(graph, time_budget=0)
+        self.assertTrue(summary.approximate)
+        self.assertLess(1, summary.edge_stride)
+        self.assertEqual(graph.number_of_edges(), summary.number_of_edges)
+        self.assertGreater(graph.number_of_citations(), len(summary.citations))
+        self.assertIn("Count (approximate)", summary.edges_str())
+        self.assertIn(("Number of Citations", f"~{len(summary.citations)}"), summary.statistics_list())
+
+        exact = GraphSummary(graph, time_budget=60)
+        self.assertFalse(exact.approximate)
+        self.assertEqual(graph.number_of_citations(), len(exact.citations))
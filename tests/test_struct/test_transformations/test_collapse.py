@@ -12,6 +12,7 @@ from pybel.struct.mutation.collapse import (
     surviors_are_inconsistent,
 )
 from pybel.testing.utils import n
+from pybel.utils import hash_edge
 
 HGNC = "HGNC"
 GO = "GO"
@@ -83,6 +84,28 @@ class TestCollapse(unittest.TestCase):
         self.assertEqual({(p1, p3), (p1, p3)}, set(graph.edges()))
         self.assertEqual(2, graph.number_of_edges(), msg=graph.edges(data=True, keys=True))
 
+    def test_collapse_by_dict_transitive(self):
+        """Test collapsing nodes by a dictionary with a transitive chain."""
+        graph = BELGraph()
+        graph.add_increases(p2, p3, citation=n(), evidence=n())
+        graph.add_increases(p3, p5, citation=n(), evidence=n())
+        graph.add_increases(p5, p1, citation=n(), evidence=n())
+
+        collapse_nodes(graph, {p1: {p2}, p2: {p3}})
+
+        self.assertEqual({p1, p5}, set(graph))
+        self.assertEqual({(p1, p5), (p5, p1)}, set(graph.edges()))
+        for u, v, k, data in graph.edges(keys=True, data=True):
+            self.assertEqual(hash_edge(u, v, data), k)
+
+    def test_collapse_by_dict_cycle(self):
+        """Test collapsing nodes by a dictionary with a cycle fails."""
+        graph = BELGraph()
+        graph.add_increases(p1, p2, citation=n(), evidence=n())
+
+        with self.assertRaises(ValueError):
+            collapse_nodes(graph, {p1: {p2}, p2: {p1}})
+
     def test_collapse_dogma_1(self):
         """Test collapsing to genes, only with translations."""
         graph = BELGraph()
@@ -6,14 +6,22 @@ import unittest
 from collections import Counter
 
 import networkx as nx
+import numpy as np
 
+from pybel import BELGraph
+from pybel.dsl import Protein
 from pybel.examples import sialic_acid_graph, statin_graph
+from pybel.struct.mutation.induction import random_subgraph
 from pybel.struct.mutation.induction.paths import get_random_path
 from pybel.struct.mutation.induction.random_subgraph import (
+    FenwickTree,
     _helper,
+    _initialize_worker,
+    _sample_in_worker,
     get_graph_with_random_edges,
     get_random_node,
     get_random_subgraph,
+    get_random_subgraphs,
 )
 from pybel.testing.generate import generate_random_graph
 
@@ -125,6 +133,86 @@ class TestRandom(unittest.TestCase):
 
         self.assertNotIn(3, result)
 
+    def test_fenwick_tree(self):
+        """Test weighted sampling with a Fenwick tree."""
+        tree = FenwickTree(5)
+        for index, weight in enumerate([4, 1, 0, 1, 2]):
+            tree.set(index, weight)
+        self.assertEqual(8, tree.total)
+        tree.set(0, 2)
+        self.assertEqual(6, tree.total)
+
+        rng = np.random.default_rng(125)
+        n = 30000
+        r = Counter(tree.sample(rng) for _ in range(n))
+        self.assertNotIn(2, r)
+        self.assertAlmostEqual(2 / 6, r[0] / n, places=2)
+        self.assertAlmostEqual(1 / 6, r[1] / n, places=2)
+        self.assertAlmostEqual(2 / 6, r[4] / n, places=2)
+
+        for index in range(5):
+            tree.set(index, 0)
+        self.assertIsNone(tree.sample(rng))
+
+    def test_fenwick_tree_drift(self):
+        """Test that sampling stops once all weights are zeroed, even if the total has drifted above zero."""
+        tree = FenwickTree(3)
+        for index, weight in enumerate([0.1, 0.2, 0.3]):
+            tree.set(index, weight)
+        for index in range(3):
+            tree.set(index, 0)
+        self.assertIsNone(tree.sample(np.random.default_rng(125)))
+
+    def test_random_sample_disjoint_components(self):
+        """Test that a random subgraph of many small components stops growing once the seeded components run out."""
+        graph = BELGraph()
+        for component in range(200):
+            nodes = [Protein("HGNC", f"P{3 * component + offset}") for offset in range(3)]
+            for u in nodes:
+                for v in nodes:
+                    if u != v:
+                        graph.add_increases(u, v, citation=str(component), evidence="")
+        self.assertEqual(1200, graph.number_of_edges())
+
+        result = get_random_subgraph(graph, number_edges=500, number_seed_edges=2, seed=0)
+        self.assertLessEqual(result.number_of_edges(), 500)
+
+    def test_random_sample_reproducible(self):
+        """Test that seeding a random subgraph does not depend on the global random state."""
+        graph = generate_random_graph(n_nodes=50, n_edges=500)
+
+        sg_1 = get_random_subgraph(graph, number_edges=100, seed=5)
+        random.seed(0)
+        sg_2 = get_random_subgraph(graph, number_edges=100, seed=5)
+        self.assertEqual(100, sg_1.number_of_edges())
+        self.assertEqual(set(sg_1.edges(keys=True)), set(sg_2.edges(keys=True)))
+
+    def test_random_samples(self):
+        """Test that drawing many samples gives the same results regardless of the number of workers."""
+        graph = generate_random_graph(n_nodes=50, n_edges=500)
+
+        serial = get_random_subgraphs(graph, number_samples=4, number_edges=100, seed=5)
+        parallel = get_random_subgraphs(graph, number_samples=4, number_edges=100, seed=5, n_jobs=2)
+        self.assertEqual(4, len(serial))
+        self.assertEqual(
+            [set(sg.edges(keys=True)) for sg in serial],
+            [set(sg.edges(keys=True)) for sg in parallel],
+        )
+        self.assertNotEqual(set(serial[0].edges(keys=True)), set(serial[1].edges(keys=True)))
+
+    def test_worker_sampler(self):
+        """Test that a worker builds its sampler once, when it starts, and reuses it for each sample."""
+        graph = generate_random_graph(n_nodes=50, n_edges=500)
+        self.addCleanup(setattr, random_subgraph, "_WORKER_SAMPLER", None)
+        _initialize_worker(graph, None)
+        sampler = random_subgraph._WORKER_SAMPLER
+        self.assertIsNotNone(sampler)
+
+        expected = set(get_random_subgraph(graph, number_edges=100, seed=5).edges(keys=True))
+        for _ in range(2):
+            self.assertEqual(expected, set(_sample_in_worker(dict(number_edges=100, seed=5)).edges(keys=True)))
+        self.assertIs(sampler, random_subgraph._WORKER_SAMPLER)
+
 
 class TestRandomPath(unittest.TestCase):
     """Test getting random paths."""